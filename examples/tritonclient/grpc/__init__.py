@@ -1,30 +1,37 @@
 """Triton Inference Server gRPC client module."""
 
 from .client import InferenceServerClient
+from .batching import BatchingInferenceServerClient, BatchedInferResult
 from .types import (
     InferInput,
     InferRequestedOutput,
     InferResult,
     InferOutput,
+    PreparedInferRequest,
     ModelMetadata,
     TensorMetadata,
     ModelConfig,
     TensorConfig,
     ModelConfigResponse,
+    JsonView,
     CallContext,
 )
 
 __all__ = [
     "InferenceServerClient",
+    "BatchingInferenceServerClient",
+    "BatchedInferResult",
     "InferInput",
     "InferRequestedOutput",
     "InferResult",
     "InferOutput",
+    "PreparedInferRequest",
     "ModelMetadata",
     "TensorMetadata",
     "ModelConfig",
     "TensorConfig",
     "ModelConfigResponse",
+    "JsonView",
     "CallContext",
 ]
 
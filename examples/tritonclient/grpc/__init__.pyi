@@ -1,19 +1,24 @@
 """Type stubs for tritonclient.grpc module."""
 
-from typing import Any, Callable, Optional
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Iterator, Optional
 import numpy as np
 
 __all__ = [
     "InferenceServerClient",
+    "BatchingInferenceServerClient",
+    "BatchedInferResult",
     "InferInput",
     "InferRequestedOutput",
     "InferResult",
     "InferOutput",
+    "PreparedInferRequest",
     "ModelMetadata",
     "TensorMetadata",
     "ModelConfig",
     "ModelConfigResponse",
     "TensorConfig",
+    "JsonView",
     "CallContext",
 ]
 
@@ -24,7 +29,7 @@ class InferInput:
     def __init__(
         self,
         name: str,
-        shape: list[int],
+        shape: Sequence[int],
         datatype: str,
     ) -> None:
         """Initialize an inference input.
@@ -52,7 +57,7 @@ class InferInput:
         """
         ...
     
-    def shape(self) -> list[int]:
+    def shape(self) -> tuple[int, ...]:
         """Get the shape of input associated with this object.
         
         Returns:
@@ -60,7 +65,7 @@ class InferInput:
         """
         ...
     
-    def set_shape(self, shape: list[int]) -> "InferInput":
+    def set_shape(self, shape: Sequence[int]) -> "InferInput":
         """Set the shape of the input tensor.
         
         Args:
@@ -71,11 +76,14 @@ class InferInput:
         """
         ...
     
-    def set_data_from_numpy(self, input_tensor: np.ndarray) -> "InferInput":
+    def set_data_from_numpy(self, input_tensor: np.ndarray, binary_data: bool = False) -> "InferInput":
         """Set the input data from a numpy array.
         
         Args:
             input_tensor: The numpy array containing the input data.
+            binary_data: If True the data is sent in the request's raw_input_contents and
+                passed to Rust through the buffer protocol instead of the typed tensor
+                contents. Default is False.
             
         Returns:
             The updated input.
@@ -161,6 +169,15 @@ class InferOutput:
     def datatype(self) -> str:
         """The data type of the output tensor."""
         ...
+    
+    def as_numpy(self) -> np.ndarray | None:
+        """Get the output tensor as a numpy array.
+        
+        Returns:
+            The output tensor as a numpy array, or None if the response carries no data
+            for it (e.g. the output was written to shared memory).
+        """
+        ...
 
 
 class InferResult:
@@ -173,7 +190,17 @@ class InferResult:
             name: The name of the output tensor.
             
         Returns:
-            The output tensor as a numpy array, or None if not found.
+            The output tensor as a numpy array, or None if not found or the response carries
+            no data for it.
+        """
+        ...
+    
+    def as_numpy_all(self) -> dict[str, np.ndarray | None]:
+        """Get all output tensors as numpy arrays.
+        
+        Returns:
+            The output tensors as numpy arrays, keyed by output name. Outputs the response
+            carries no data for (e.g. written to shared memory) map to None.
         """
         ...
     
@@ -201,6 +228,22 @@ class InferResult:
         ...
 
 
+class PreparedInferRequest:
+    """A reusable inference request created by InferenceServerClient.prepare_infer()."""
+    
+    def run(self, buffers: list[Any]) -> InferResult:
+        """Perform synchronous inference with new input data.
+        
+        Args:
+            buffers: The data of each input not using shared memory, in schema order.
+                Numpy arrays or objects exposing a byte buffer (e.g. memoryview).
+            
+        Returns:
+            The inference result.
+        """
+        ...
+
+
 class TensorMetadata:
     """Represents metadata for a tensor (input or output)."""
     
@@ -215,7 +258,7 @@ class TensorMetadata:
         ...
     
     @property
-    def shape(self) -> list[int]:
+    def shape(self) -> tuple[int, ...]:
         """The shape of the tensor."""
         ...
 
@@ -263,7 +306,7 @@ class TensorConfig:
         ...
     
     @property
-    def shape(self) -> list[int]:
+    def shape(self) -> tuple[int, ...]:
         """The shape of the tensor."""
         ...
 
@@ -302,9 +345,33 @@ class ModelConfig:
         ...
 
 
+class JsonView(Mapping[str, Any]):
+    """Read-only json-style view of a protobuf message, returned for as_json=True.
+    
+    Fields are read from the message and converted only when accessed, and cached
+    afterwards; nested messages are returned as JsonView as well. Use to_dict() to
+    get a plain dict (e.g. for json.dumps).
+    """
+    
+    def __getitem__(self, key: str) -> Any: ...
+    
+    def __iter__(self) -> Iterator[str]: ...
+    
+    def __len__(self) -> int: ...
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the whole message to a plain dict."""
+        ...
+
+
 class CallContext:
     """Context for asynchronous inference calls."""
     
+    @property
+    def request_id(self) -> str:
+        """The id of the in-flight request."""
+        ...
+    
     def cancel(self) -> None:
         """Cancel the ongoing inference request."""
         ...
@@ -363,7 +430,7 @@ class InferenceServerClient:
             model_name: The name of the model.
             model_version: The version of the model. Default is empty string.
             headers: Optional dictionary specifying additional headers.
-            as_json: If True then returns model metadata as a json dict, otherwise as a protobuf message.
+            as_json: If True then returns model metadata as a read-only json dict (JsonView), otherwise as a protobuf message.
             client_timeout: Client timeout in seconds (optional).
             
         Returns:
@@ -385,7 +452,7 @@ class InferenceServerClient:
             model_name: The name of the model.
             model_version: The version of the model. Default is empty string.
             headers: Optional dictionary specifying additional headers.
-            as_json: If True then returns configuration as a json dict, otherwise as a protobuf message.
+            as_json: If True then returns configuration as a read-only json dict (JsonView), otherwise as a protobuf message.
             client_timeout: Client timeout in seconds (optional).
             
         Returns:
@@ -403,7 +470,7 @@ class InferenceServerClient:
         
         Args:
             headers: Optional dictionary specifying additional headers.
-            as_json: If True then returns server metadata as a json dict, otherwise as a protobuf message.
+            as_json: If True then returns server metadata as a read-only json dict (JsonView), otherwise as a protobuf message.
             client_timeout: Client timeout in seconds (optional).
             
         Returns:
@@ -411,6 +478,95 @@ class InferenceServerClient:
         """
         ...
     
+    def get_status(self, model_name: str = "", model_version: str = "") -> dict[str, Any]:
+        """Query server health and metadata, and optionally model status, in one burst.
+        
+        Args:
+            model_name: The name of the model to also query. Default is empty string
+                which only queries the server.
+            model_version: The version of the model. Default is empty string.
+            
+        Returns:
+            A dict with "live", "ready" and "server_metadata", plus "model_ready",
+            "model_metadata", "model_config" and "model_statistics" when model_name is given.
+        """
+        ...
+    
+    def load_model(
+        self,
+        model_name: str,
+        headers: Optional[dict[str, str]] = None,
+        config: Optional[str] = None,
+        files: Optional[dict[str, bytes]] = None,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Request the inference server to load or reload the specified model.
+        
+        Args:
+            model_name: The name of the model to be loaded.
+            headers: Optional dictionary specifying additional headers.
+            config: Optional JSON representation of a model config.
+            files: Optional dictionary specifying file path to file content.
+            client_timeout: Client timeout in seconds (optional).
+        """
+        ...
+    
+    def unload_model(
+        self,
+        model_name: str,
+        headers: Optional[dict[str, str]] = None,
+        unload_dependents: bool = False,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Request the inference server to unload the specified model.
+        
+        Args:
+            model_name: The name of the model to be unloaded.
+            headers: Optional dictionary specifying additional headers.
+            unload_dependents: Whether the dependents of the model should also be unloaded.
+            client_timeout: Client timeout in seconds (optional).
+        """
+        ...
+    
+    def load_models(
+        self,
+        model_names: list[str],
+        headers: Optional[dict[str, str]] = None,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Request the inference server to load or reload several models concurrently.
+        
+        All requests are sent at once over the shared connection, so the call takes about
+        as long as the slowest single load instead of the sum of all loads.
+        
+        Args:
+            model_names: The names of the models to be loaded.
+            headers: Optional dictionary specifying additional headers.
+            client_timeout: Client timeout in seconds (optional).
+            
+        Raises:
+            RuntimeError: If any of the models failed to load; the other models are still loaded.
+        """
+        ...
+    
+    def unload_models(
+        self,
+        model_names: list[str],
+        headers: Optional[dict[str, str]] = None,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Request the inference server to unload several models concurrently.
+        
+        Args:
+            model_names: The names of the models to be unloaded.
+            headers: Optional dictionary specifying additional headers.
+            client_timeout: Client timeout in seconds (optional).
+            
+        Raises:
+            RuntimeError: If any of the models failed to unload.
+        """
+        ...
+    
     def register_system_shared_memory(
         self,
         name: str,
@@ -448,6 +604,35 @@ class InferenceServerClient:
         """
         ...
     
+    def unregister_all_system_shared_memory(
+        self,
+        headers: Optional[dict[str, str]] = None,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Unregister all system shared memory regions from the server in a single request.
+        
+        Prefer this over calling unregister_system_shared_memory() for each region, which
+        costs one round trip per region.
+        
+        Args:
+            headers: Optional dictionary specifying additional headers.
+            client_timeout: Client timeout in seconds (optional).
+        """
+        ...
+    
+    def unregister_all_cuda_shared_memory(
+        self,
+        headers: Optional[dict[str, str]] = None,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Unregister all CUDA shared memory regions from the server in a single request.
+        
+        Args:
+            headers: Optional dictionary specifying additional headers.
+            client_timeout: Client timeout in seconds (optional).
+        """
+        ...
+    
     def infer(
         self,
         model_name: str,
@@ -487,6 +672,95 @@ class InferenceServerClient:
         """
         ...
     
+    def infer_raw_outputs(
+        self,
+        model_name: str,
+        inputs: list[InferInput],
+        model_version: str = "",
+        outputs: Optional[list[InferRequestedOutput]] = None,
+        request_id: str = "",
+    ) -> dict[str, np.ndarray]:
+        """Perform synchronous inference and return only the raw output tensors.
+        
+        The response is not decoded into a ModelInferResponse; only the output
+        descriptions and raw_output_contents are located in the response body, and the
+        returned arrays are read-only views into that body without copying.
+        
+        Args:
+            model_name: The name of the model.
+            inputs: List of input tensors.
+            model_version: The version of the model (optional).
+            outputs: List of requested output tensors (optional).
+            request_id: Unique identifier for the request (optional).
+            
+        Returns:
+            The output tensors keyed by output name. Outputs returned through shared
+            memory are not included.
+        """
+        ...
+    
+    async def infer_async(
+        self,
+        model_name: str,
+        inputs: list[InferInput],
+        model_version: str = "",
+        outputs: Optional[list[InferRequestedOutput]] = None,
+        request_id: str = "",
+        sequence_id: int = 0,
+        sequence_start: bool = False,
+        sequence_end: bool = False,
+        priority: int = 0,
+        timeout: Optional[float] = None,
+        client_timeout: Optional[float] = None,
+        headers: Optional[dict[str, str]] = None,
+        compression_algorithm: Optional[str] = None,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> InferResult:
+        """Perform inference as an asyncio coroutine.
+        
+        Args:
+            model_name: The name of the model.
+            inputs: List of input tensors.
+            model_version: The version of the model (optional).
+            outputs: List of requested output tensors (optional).
+            request_id: Unique identifier for the request (optional).
+            sequence_id: Sequence identifier for stateful models (optional).
+            sequence_start: Whether this is the start of a sequence (optional).
+            sequence_end: Whether this is the end of a sequence (optional).
+            priority: Request priority (optional).
+            timeout: Request timeout in seconds (optional).
+            client_timeout: Client timeout in seconds (optional).
+            headers: Additional headers (optional).
+            compression_algorithm: Compression algorithm to use (optional).
+            
+        Returns:
+            The inference result.
+        """
+        ...
+    
+    def prepare_infer(
+        self,
+        model_name: str,
+        inputs: list[InferInput],
+        model_version: str = "",
+        outputs: Optional[list[InferRequestedOutput]] = None,
+        request_id: str = "",
+    ) -> PreparedInferRequest:
+        """Build a reusable inference request.
+        
+        Args:
+            model_name: The name of the model.
+            inputs: The input schema. Data set on the inputs is ignored, except that inputs
+                using shared memory keep their shared memory settings.
+            model_version: The version of the model (optional).
+            outputs: List of requested output tensors (optional).
+            request_id: Identifier sent with every request (optional).
+            
+        Returns:
+            The prepared request.
+        """
+        ...
+    
     def async_infer(
         self,
         model_name: str,
@@ -512,7 +786,7 @@ class InferenceServerClient:
             inputs: List of input tensors.
             outputs: List of requested output tensors (optional).
             model_version: The version of the model (optional).
-            request_id: Unique identifier for the request (optional).
+            request_id: Unique identifier for the request. A unique id is generated if empty.
             sequence_id: Sequence identifier for stateful models (optional).
             sequence_start: Whether this is the start of a sequence (optional).
             sequence_end: Whether this is the end of a sequence (optional).
@@ -533,3 +807,85 @@ class InferenceServerClient:
         """Close the client connection."""
         ...
 
+
+class BatchedInferResult:
+    """The part of a batched inference result that belongs to one caller."""
+    
+    def as_numpy(self, name: str) -> np.ndarray | None:
+        """Get the output tensor as a numpy array.
+        
+        Args:
+            name: The name of the output tensor.
+            
+        Returns:
+            The rows of the output tensor belonging to this caller, or None if not found.
+        """
+        ...
+    
+    def as_numpy_all(self) -> dict[str, np.ndarray]:
+        """Get all output tensors as numpy arrays.
+        
+        Returns:
+            The rows of each output tensor belonging to this caller, keyed by output name.
+        """
+        ...
+    
+    def get_output(self, name: str, as_json: bool = False) -> Any:
+        """Get the output tensor object.
+        
+        Args:
+            name: The name of the output tensor.
+            as_json: If True then returns the output as a json dict, otherwise as an InferOutput.
+            
+        Returns:
+            The output tensor holding this caller's rows, or None if not found.
+        """
+        ...
+    
+    def get_response(self, as_json: bool = False) -> Any:
+        """Retrieves the ModelInferResponse as a json dict object or protobuf message.
+        
+        Args:
+            as_json: If True then returns a json dict whose outputs describe this caller's
+                rows, otherwise the protobuf message of the whole batch.
+            
+        Returns:
+            The response as a dict, or the ModelInferResponse of the whole batch.
+        """
+        ...
+
+
+class BatchingInferenceServerClient(InferenceServerClient):
+    """InferenceServerClient that merges concurrent infer() calls into batched requests."""
+    
+    def __init__(
+        self,
+        url: str,
+        max_batch: int = 64,
+        max_delay_us: int = 500,
+        max_inflight: int = 4,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the batching client.
+        
+        Args:
+            url: The URL of the inference server (e.g., "localhost:8001").
+            max_batch: The maximum number of calls merged into one request. Default is 64.
+            max_delay_us: How long, in microseconds, to wait for more calls after the
+                first one arrives. Default is 500.
+            max_inflight: The maximum number of batched requests in flight at once. Default is 4.
+            **kwargs: Passed to InferenceServerClient.
+        """
+        ...
+    
+    def infer(
+        self,
+        model_name: str,
+        inputs: list[InferInput],
+        model_version: str = "",
+        outputs: Optional[list[InferRequestedOutput]] = None,
+        request_id: str = "",
+        **kwargs: Any,
+    ) -> InferResult | BatchedInferResult:
+        """Perform synchronous inference, merging with concurrent calls when possible."""
+        ...
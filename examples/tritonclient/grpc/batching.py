@@ -0,0 +1,336 @@
+"""Client-side micro-batching for the Triton gRPC client."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
+
+import numpy as np
+
+from .client import InferenceServerClient
+from .types import _EMPTY_CONTENTS, InferInput, InferOutput, InferRequestedOutput, InferResult
+
+
+class BatchedInferResult:
+    """The part of a batched inference result that belongs to one caller.
+
+    Provides the same accessors as InferResult, over this caller's rows of each output.
+    """
+
+    def __init__(self, result: InferResult, arrays: Dict[str, np.ndarray]):
+        """Initialize a batched inference result.
+
+        Args:
+            result: The result of the whole batch.
+            arrays: The output arrays of this caller, keyed by output name.
+        """
+        self._result = result
+        self._arrays = arrays
+
+    def as_numpy(self, name: str) -> np.ndarray | None:
+        """Get the output tensor as a numpy array.
+
+        Args:
+            name: The name of the output tensor.
+
+        Returns:
+            The rows of the output tensor belonging to this caller, or None if not found.
+        """
+        return self._arrays.get(name)
+
+    def as_numpy_all(self) -> Dict[str, np.ndarray]:
+        """Get all output tensors as numpy arrays.
+
+        Returns:
+            The rows of each output tensor belonging to this caller, keyed by output name.
+        """
+        return dict(self._arrays)
+
+    def get_output(self, name: str, as_json: bool = False) -> Any:
+        """Get the output tensor object.
+
+        Args:
+            name: The name of the output tensor.
+            as_json: If True then returns the output as a json dict, otherwise as an InferOutput.
+
+        Returns:
+            The output tensor holding this caller's rows, or None if not found.
+        """
+        array = self._arrays.get(name)
+        if array is None:
+            return None
+        # 数据类型取自整个 batch 的输出描述，形状为本调用方的行
+        datatype = self._result._output_headers[name][1]
+        if as_json:
+            return {
+                "name": name,
+                "shape": list(array.shape),
+                "datatype": datatype,
+            }
+        output = InferOutput(
+            name=name,
+            shape=array.shape,
+            datatype=datatype,
+            contents=_EMPTY_CONTENTS,
+        )
+        output._array = array
+        return output
+
+    def get_response(self, as_json: bool = False) -> Any:
+        """Retrieves the ModelInferResponse as a json dict object or protobuf message.
+
+        Args:
+            as_json: If True then returns a json dict whose outputs describe this caller's
+                rows, otherwise the protobuf message of the whole batch.
+
+        Returns:
+            The response as a dict, or the ModelInferResponse of the whole batch.
+        """
+        response = self._result.get_response(as_json)
+        if as_json:
+            response["outputs"] = [self.get_output(name, as_json=True) for name in self._arrays]
+        return response
+
+
+class _PendingInfer:
+    """等待合批的单个 infer 调用."""
+
+    def __init__(
+            self,
+            model_name: str,
+            model_version: str,
+            inputs: List[InferInput],
+            outputs: Optional[List[InferRequestedOutput]],
+    ):
+        self.model_name = model_name
+        self.model_version = model_version
+        self.inputs = inputs
+        self.outputs = outputs
+        self.batch_size = inputs[0].shape()[0]
+        self.future: Future = Future()
+
+    def key(self) -> Tuple:
+        """只有 key 相同的调用可以合并为一个请求."""
+        return (
+            self.model_name,
+            self.model_version,
+            tuple(
+                (inp.name(), inp.datatype(), inp.shape()[1:], inp._binary_data)
+                for inp in self.inputs
+            ),
+            tuple(out.name() for out in self.outputs) if self.outputs else None,
+        )
+
+
+class BatchingInferenceServerClient(InferenceServerClient):
+    """InferenceServerClient that merges concurrent infer() calls into batched requests.
+
+    Calls made from different threads within max_delay_us of each other are
+    concatenated along the first (batch) dimension and sent as one request; the
+    outputs are split back by row. Up to max_inflight batched requests are sent
+    concurrently while further calls keep being collected. Calls that cannot be batched (shared memory
+    inputs/outputs, missing data, mismatched batch sizes, a request id or any other
+    non-default infer() argument) are sent directly. If an output of a batched request
+    cannot be split by row, each call of that batch is resent on its own.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            max_batch: int = 64,
+            max_delay_us: int = 500,
+            max_inflight: int = 4,
+            **kwargs: Any,
+    ) -> None:
+        """Initialize the batching client.
+
+        Args:
+            url: The URL of the inference server (e.g., "localhost:8001").
+            max_batch: The maximum number of calls merged into one request. Default is 64.
+            max_delay_us: How long, in microseconds, to wait for more calls after the
+                first one arrives. Default is 500.
+            max_inflight: The maximum number of batched requests in flight at once. Default is 4.
+            **kwargs: Passed to InferenceServerClient.
+        """
+        super().__init__(url, **kwargs)
+        self._max_batch = max_batch
+        self._max_delay = max_delay_us / 1_000_000
+        self._batch_queue: "queue.Queue[Optional[_PendingInfer]]" = queue.Queue()
+        # 保护 _batching_closed 与入队操作，close() 之后不会再有调用进入队列
+        self._batch_lock = threading.Lock()
+        self._batching_closed = False
+        # 合并后的请求在线程池中发送，合批线程不等待结果，继续收集后续调用
+        self._sender = ThreadPoolExecutor(
+            max_workers=max_inflight,
+            thread_name_prefix="triton-batch-sender",
+        )
+        self._batcher = threading.Thread(
+            target=self._batch_loop,
+            name="triton-batcher",
+            daemon=True,
+        )
+        self._batcher.start()
+
+    def infer(
+            self,
+            model_name: str,
+            inputs: List[InferInput],
+            model_version: str = "",
+            outputs: Optional[List[InferRequestedOutput]] = None,
+            request_id: str = "",
+            **kwargs: Any,
+    ) -> InferResult | BatchedInferResult:
+        """Perform synchronous inference, merging with concurrent calls when possible.
+
+        Args:
+            model_name: The name of the model.
+            inputs: List of input tensors. The first dimension is the batch dimension.
+            model_version: The version of the model (optional).
+            outputs: List of requested output tensors (optional).
+            request_id: Unique identifier for the request. Calls with a request id are
+                not batched.
+            **kwargs: The remaining InferenceServerClient.infer() arguments. Calls that
+                set any of them to a non-default value are not batched.
+
+        Returns:
+            The inference result.
+        """
+        # 合并后的请求只携带模型、输入和输出；其余参数（priority、timeout、headers 等）
+        # 的默认值均为假值，设置了任意一个的调用单独发送
+        if request_id or any(kwargs.values()) or not self._is_batchable(inputs, outputs):
+            return super().infer(
+                model_name, inputs, model_version, outputs, request_id, **kwargs
+            )
+        pending = _PendingInfer(model_name, model_version, inputs, outputs)
+        with self._batch_lock:
+            queued = not self._batching_closed
+            if queued:
+                self._batch_queue.put(pending)
+        if not queued:
+            # close() 已开始，合批线程不会再处理新的调用
+            return super().infer(model_name, inputs, model_version, outputs)
+        return pending.future.result()
+
+    def close(self) -> None:
+        """Flush pending calls and close the client connection."""
+        with self._batch_lock:
+            closing = not self._batching_closed
+            self._batching_closed = True
+            if closing:
+                self._batch_queue.put(None)
+        if closing:
+            self._batcher.join()
+            # 合批线程退出前已入队但未处理的调用，逐个发送
+            while not self._batch_queue.empty():
+                item = self._batch_queue.get_nowait()
+                if item is not None:
+                    self._sender.submit(self._run_group, [item])
+            self._sender.shutdown(wait=True)
+        super().close()
+
+    @staticmethod
+    def _is_batchable(
+            inputs: List[InferInput],
+            outputs: Optional[List[InferRequestedOutput]],
+    ) -> bool:
+        """检查调用是否可以参与合批."""
+        if not inputs:
+            return False
+        if outputs and any(out._shm_region_name is not None for out in outputs):
+            return False
+        batch_size = None
+        for inp in inputs:
+            shape = inp.shape()
+            if inp._data is None or not shape:
+                return False
+            if batch_size is None:
+                batch_size = shape[0]
+            elif shape[0] != batch_size:
+                return False
+        return True
+
+    def _batch_loop(self) -> None:
+        """收集一段时间内的调用，按 key 分组后发送."""
+        stopping = False
+        while not stopping:
+            first = self._batch_queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self._max_delay
+            while len(batch) < self._max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._batch_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            groups: Dict[Tuple, List[_PendingInfer]] = {}
+            for item in batch:
+                groups.setdefault(item.key(), []).append(item)
+            for group in groups.values():
+                self._sender.submit(self._run_group, group)
+
+    def _run_single(self, item: _PendingInfer) -> None:
+        """单独发送一个调用."""
+        try:
+            item.future.set_result(
+                super().infer(item.model_name, item.inputs, item.model_version, item.outputs)
+            )
+        except Exception as e:
+            item.future.set_exception(e)
+
+    def _run_group(self, group: List[_PendingInfer]) -> None:
+        """将一组调用合并为一个请求并拆分结果."""
+        if len(group) == 1:
+            self._run_single(group[0])
+            return
+        first = group[0]
+        try:
+            batched_inputs = []
+            for i, inp in enumerate(first.inputs):
+                data = np.concatenate(
+                    [np.reshape(item.inputs[i]._data, item.inputs[i].shape()) for item in group]
+                )
+                batched = InferInput(inp.name(), data.shape, inp.datatype())
+                batched.set_data_from_numpy(data, binary_data=inp._binary_data)
+                batched_inputs.append(batched)
+
+            result = super().infer(
+                first.model_name, batched_inputs, first.model_version, first.outputs
+            )
+            if first.outputs:
+                arrays = {out.name(): result.as_numpy(out.name()) for out in first.outputs}
+            else:
+                arrays = result.as_numpy_all()
+
+            total = sum(item.batch_size for item in group)
+            if any(
+                array is None or array.ndim == 0 or array.shape[0] != total
+                for array in arrays.values()
+            ):
+                # 输出的第一维不是 batch 维，无法按行拆分；各调用本身是合法的，改为逐个发送
+                for item in group:
+                    self._run_single(item)
+                return
+
+            start = 0
+            for item in group:
+                end = start + item.batch_size
+                item.future.set_result(
+                    BatchedInferResult(
+                        result, {name: array[start:end] for name, array in arrays.items()}
+                    )
+                )
+                start = end
+        except Exception as e:
+            for item in group:
+                if not item.future.done():
+                    item.future.set_exception(e)
@@ -1,18 +1,55 @@
 """Triton Inference Server gRPC client implementation."""
 
 import triton_client
-from typing import List, Optional, Dict, Any, Callable
-from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, Tuple, FrozenSet
+import logging
 import threading
+import uuid
+import weakref
+import numpy as np
 from .types import (
     InferInput,
     InferRequestedOutput,
     InferResult,
+    InferOutput,
+    PreparedInferRequest,
     ModelMetadata,
     ModelConfigResponse,
+    JsonView,
     CallContext,
+    _shm_output_names,
+    _EMPTY_CONTENTS,
 )
 
+logger = logging.getLogger(__name__)
+
+# 同一 URL 的所有 InferenceServerClient 共享一个 triton_client.Client（HTTP/2 连接可多路复用），
+# 最后一个使用者释放后连接随之关闭
+_CLIENT_POOL: "weakref.WeakValueDictionary[Tuple, triton_client.Client]" = weakref.WeakValueDictionary()
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def _shared_rust_client(url: str, keepalive_options: Optional[Any] = None) -> triton_client.Client:
+    """返回 url（及 keepalive 设置）对应的共享 triton_client.Client，不存在时创建."""
+    keepalive = (
+        getattr(keepalive_options, "keepalive_time_ms", None),
+        getattr(keepalive_options, "keepalive_timeout_ms", None),
+        bool(getattr(keepalive_options, "keepalive_permit_without_calls", False)),
+    )
+    key = (url, keepalive)
+    with _CLIENT_POOL_LOCK:
+        client = _CLIENT_POOL.get(key)
+        if client is None:
+            client = triton_client.Client(
+                url,
+                access_token=None,
+                keepalive_time_ms=keepalive[0],
+                keepalive_timeout_ms=keepalive[1],
+                keepalive_permit_without_calls=keepalive[2],
+            )
+            _CLIENT_POOL[key] = client
+        return client
+
 
 class InferenceServerClient:
     """Client for communicating with Triton Inference Server via gRPC."""
@@ -31,6 +68,8 @@ class InferenceServerClient:
     ) -> None:
         """Initialize the inference server client.
         
+        Clients created for the same URL share one underlying gRPC connection.
+        
         Args:
             url: The URL of the inference server (e.g., "localhost:8001").
             verbose: Whether to enable verbose logging (ignored).
@@ -39,12 +78,26 @@ class InferenceServerClient:
             private_key: Path to private key file (ignored).
             certificate_chain: Path to certificate chain file (ignored).
             creds: A grpc.ChannelCredentials object (ignored).
-            keepalive_options: Object encapsulating various GRPC KeepAlive options (ignored).
+            keepalive_options: Object encapsulating various GRPC KeepAlive options. Its
+                keepalive_time_ms, keepalive_timeout_ms and keepalive_permit_without_calls
+                attributes are applied; keepalive pings are disabled when not given.
             channel_args: List of Tuple pairs ("key", value) to be passed directly to the GRPC channel (ignored).
         """
         # 忽略不支持的参数，保持签名一致性
-        self._rust_client = triton_client.Client(url, access_token=None)
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._rust_client = _shared_rust_client(url, keepalive_options)
+        # async_infer 复用同一条 ModelStreamInfer stream，首次调用时再建立
+        self._stream: Optional[triton_client.InferStream] = None
+        self._dispatcher: Optional[threading.Thread] = None
+        # request_id -> (callback, 写入共享内存的输出名)
+        self._pending: Dict[
+            str,
+            Tuple[Callable[[Optional[InferResult], Optional[Exception]], None], FrozenSet[str]],
+        ] = {}
+        self._pending_lock = threading.Lock()
+        # 元数据/配置在模型加载期间不变，按 (model_name, model_version, as_json) 缓存
+        self._server_metadata_cache: Dict[bool, Any] = {}
+        self._model_metadata_cache: Dict[Tuple[str, str, bool], Any] = {}
+        self._model_config_cache: Dict[Tuple[str, str, bool], Any] = {}
         self._closed = False
     
     def get_model_metadata(
@@ -61,43 +114,30 @@ class InferenceServerClient:
             model_name: The name of the model.
             model_version: The version of the model. Default is empty string.
             headers: Optional dictionary specifying additional headers (ignored).
-            as_json: If True then returns model metadata as a json dict, otherwise as a protobuf message.
+            as_json: If True then returns model metadata as a read-only json dict (JsonView), otherwise as a protobuf message.
             client_timeout: Client timeout in seconds (ignored).
             
         Returns:
-            The model metadata as a protobuf message or json dict.
+            The model metadata as a protobuf message or json dict. The result is cached
+            until the model is loaded or unloaded through this client.
         """
+        key = (model_name, model_version, as_json)
+        cached = self._model_metadata_cache.get(key)
+        if cached is None:
+            cached = self._fetch_model_metadata(model_name, model_version, as_json)
+            self._model_metadata_cache[key] = cached
+        return cached
+    
+    def _fetch_model_metadata(self, model_name: str, model_version: str, as_json: bool) -> Any:
+        """请求模型元数据."""
         req = triton_client.ModelMetadataRequest(
             name=model_name,
             version=model_version,
         )
-        resp = self._rust_client.model_metadata(req)
-        
         if as_json:
-            # TODO: 实现 JSON 序列化
-            return {
-                "name": resp.name,
-                "versions": resp.versions,
-                "platform": resp.platform,
-                "inputs": [
-                    {
-                        "name": inp.name,
-                        "datatype": inp.datatype,
-                        "shape": inp.shape,
-                    }
-                    for inp in resp.inputs
-                ],
-                "outputs": [
-                    {
-                        "name": out.name,
-                        "datatype": out.datatype,
-                        "shape": out.shape,
-                    }
-                    for out in resp.outputs
-                ],
-            }
-        else:
-            return ModelMetadata(resp)
+            # 字段在访问时才转换，不预先构建整个 dict
+            return JsonView(self._rust_client.model_metadata(req))
+        return ModelMetadata(self._rust_client.model_metadata(req))
     
     def get_model_config(
         self,
@@ -113,45 +153,30 @@ class InferenceServerClient:
             model_name: The name of the model.
             model_version: The version of the model. Default is empty string.
             headers: Optional dictionary specifying additional headers (ignored).
-            as_json: If True then returns configuration as a json dict, otherwise as a protobuf message.
+            as_json: If True then returns configuration as a read-only json dict (JsonView), otherwise as a protobuf message.
             client_timeout: Client timeout in seconds (ignored).
             
         Returns:
             The ModelConfigResponse protobuf message (has a .config attribute) or json dict.
+            The result is cached until the model is loaded or unloaded through this client.
         """
+        key = (model_name, model_version, as_json)
+        cached = self._model_config_cache.get(key)
+        if cached is None:
+            cached = self._fetch_model_config(model_name, model_version, as_json)
+            self._model_config_cache[key] = cached
+        return cached
+    
+    def _fetch_model_config(self, model_name: str, model_version: str, as_json: bool) -> Any:
+        """请求模型配置."""
         req = triton_client.ModelConfigRequest(
             name=model_name,
             version=model_version,
         )
-        resp = self._rust_client.model_config(req)
-        
         if as_json:
-            # TODO: 实现 JSON 序列化
-            return {
-                "config": {
-                    "name": resp.config.name,
-                    "platform": resp.config.platform,
-                    "max_batch_size": resp.config.max_batch_size,
-                    "input": [
-                        {
-                            "name": inp.name,
-                            "datatype": inp.datatype,
-                            "shape": inp.shape,
-                        }
-                        for inp in resp.config.input
-                    ],
-                    "output": [
-                        {
-                            "name": out.name,
-                            "datatype": out.datatype,
-                            "shape": out.shape,
-                        }
-                        for out in resp.config.output
-                    ],
-                }
-            }
-        else:
-            return ModelConfigResponse(resp)
+            # 字段在访问时才转换，不预先构建整个 dict
+            return JsonView(self._rust_client.model_config(req))
+        return ModelConfigResponse(self._rust_client.model_config(req))
     
     def get_server_metadata(
         self,
@@ -163,23 +188,170 @@ class InferenceServerClient:
         
         Args:
             headers: Optional dictionary specifying additional headers (ignored).
-            as_json: If True then returns server metadata as a json dict, otherwise as a protobuf message.
+            as_json: If True then returns server metadata as a read-only json dict (JsonView), otherwise as a protobuf message.
             client_timeout: Client timeout in seconds (ignored).
             
         Returns:
-            The server metadata as a protobuf message or json dict.
+            The server metadata as a protobuf message or json dict. The result is cached
+            for the lifetime of the client.
         """
-        resp = self._rust_client.server_metadata()
+        cached = self._server_metadata_cache.get(as_json)
+        if cached is None:
+            resp = self._rust_client.server_metadata()
+            cached = JsonView(resp) if as_json else resp
+            self._server_metadata_cache[as_json] = cached
+        return cached
+    
+    def get_status(self, model_name: str = "", model_version: str = "") -> Dict[str, Any]:
+        """Query server health and metadata, and optionally model status, in one burst.
         
-        if as_json:
-            # TODO: 实现 JSON 序列化
-            return {
-                "name": resp.name,
-                "version": resp.version,
-                "extensions": resp.extensions,
-            }
-        else:
-            return resp
+        The requests are sent concurrently over the shared connection, so the call costs
+        one round trip instead of one per request. The metadata and config caches are
+        refreshed with the results.
+        
+        Args:
+            model_name: The name of the model to also query. Default is empty string
+                which only queries the server.
+            model_version: The version of the model. Default is empty string.
+            
+        Returns:
+            A dict with "live", "ready" and "server_metadata", plus "model_ready",
+            "model_metadata", "model_config" and "model_statistics" when model_name is given.
+        """
+        live, ready, server_metadata = self._rust_client.server_status()
+        self._server_metadata_cache[False] = server_metadata
+        status: Dict[str, Any] = {
+            "live": live.live,
+            "ready": ready.ready,
+            "server_metadata": server_metadata,
+        }
+        if model_name:
+            model_ready, metadata, config, statistics = self._rust_client.model_status(
+                model_name, model_version
+            )
+            metadata = ModelMetadata(metadata)
+            config = ModelConfigResponse(config)
+            self._model_metadata_cache[(model_name, model_version, False)] = metadata
+            self._model_config_cache[(model_name, model_version, False)] = config
+            status.update(
+                model_ready=model_ready.ready,
+                model_metadata=metadata,
+                model_config=config,
+                model_statistics=statistics,
+            )
+        return status
+    
+    def load_model(
+        self,
+        model_name: str,
+        headers: Optional[Dict[str, str]] = None,
+        config: Optional[str] = None,
+        files: Optional[Dict[str, bytes]] = None,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Request the inference server to load or reload the specified model.
+        
+        Args:
+            model_name: The name of the model to be loaded.
+            headers: Optional dictionary specifying additional headers (ignored).
+            config: Optional JSON representation of a model config (ignored).
+            files: Optional dictionary specifying file path to file content (ignored).
+            client_timeout: Client timeout in seconds (ignored).
+        """
+        req = triton_client.RepositoryModelLoadRequest(
+            repository_name="",
+            model_name=model_name,
+            parameters={},
+        )
+        self._rust_client.repository_model_load(req)
+        self._invalidate_model_cache(model_name)
+    
+    def unload_model(
+        self,
+        model_name: str,
+        headers: Optional[Dict[str, str]] = None,
+        unload_dependents: bool = False,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Request the inference server to unload the specified model.
+        
+        Args:
+            model_name: The name of the model to be unloaded.
+            headers: Optional dictionary specifying additional headers (ignored).
+            unload_dependents: Whether the dependents of the model should also be unloaded (ignored).
+            client_timeout: Client timeout in seconds (ignored).
+        """
+        req = triton_client.RepositoryModelUnloadRequest(
+            repository_name="",
+            model_name=model_name,
+            parameters={},
+        )
+        self._rust_client.repository_model_unload(req)
+        self._invalidate_model_cache(model_name)
+    
+    def load_models(
+        self,
+        model_names: List[str],
+        headers: Optional[Dict[str, str]] = None,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Request the inference server to load or reload several models concurrently.
+        
+        All requests are sent at once over the shared connection, so the call takes about
+        as long as the slowest single load instead of the sum of all loads.
+        
+        Args:
+            model_names: The names of the models to be loaded.
+            headers: Optional dictionary specifying additional headers (ignored).
+            client_timeout: Client timeout in seconds (ignored).
+            
+        Raises:
+            RuntimeError: If any of the models failed to load; the other models are still loaded.
+        """
+        model_names = list(model_names)
+        errors = self._rust_client.repository_model_load_many(model_names)
+        for model_name in model_names:
+            self._invalidate_model_cache(model_name)
+        self._raise_for_errors("load", model_names, errors)
+    
+    def unload_models(
+        self,
+        model_names: List[str],
+        headers: Optional[Dict[str, str]] = None,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Request the inference server to unload several models concurrently.
+        
+        Args:
+            model_names: The names of the models to be unloaded.
+            headers: Optional dictionary specifying additional headers (ignored).
+            client_timeout: Client timeout in seconds (ignored).
+            
+        Raises:
+            RuntimeError: If any of the models failed to unload.
+        """
+        model_names = list(model_names)
+        errors = self._rust_client.repository_model_unload_many(model_names)
+        for model_name in model_names:
+            self._invalidate_model_cache(model_name)
+        self._raise_for_errors("unload", model_names, errors)
+    
+    def _invalidate_model_cache(self, model_name: str) -> None:
+        """清除指定模型的元数据和配置缓存."""
+        for cache in (self._model_metadata_cache, self._model_config_cache):
+            for key in [key for key in cache if key[0] == model_name]:
+                del cache[key]
+    
+    @staticmethod
+    def _raise_for_errors(action: str, model_names: List[str], errors: List[Optional[str]]) -> None:
+        """汇总批量操作中失败的模型."""
+        failed = [
+            f"{model_name}: {error}"
+            for model_name, error in zip(model_names, errors)
+            if error is not None
+        ]
+        if failed:
+            raise RuntimeError(f"Failed to {action} models: " + "; ".join(failed))
     
     def register_system_shared_memory(
         self,
@@ -227,6 +399,36 @@ class InferenceServerClient:
         )
         self._rust_client.system_shared_memory_unregister(req)
     
+    def unregister_all_system_shared_memory(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Unregister all system shared memory regions from the server in a single request.
+        
+        Prefer this over calling unregister_system_shared_memory() for each region, which
+        costs one round trip per region.
+        
+        Args:
+            headers: Optional dictionary specifying additional headers (ignored).
+            client_timeout: Client timeout in seconds (ignored).
+        """
+        self.unregister_system_shared_memory("")
+    
+    def unregister_all_cuda_shared_memory(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        client_timeout: Optional[float] = None,
+    ) -> None:
+        """Unregister all CUDA shared memory regions from the server in a single request.
+        
+        Args:
+            headers: Optional dictionary specifying additional headers (ignored).
+            client_timeout: Client timeout in seconds (ignored).
+        """
+        req = triton_client.CudaSharedMemoryUnregisterRequest(name="")
+        self._rust_client.cuda_shared_memory_unregister(req)
+    
     def infer(
         self,
         model_name: str,
@@ -265,28 +467,157 @@ class InferenceServerClient:
         Returns:
             The inference result.
         """
-        # 转换输入
-        input_tensors = [inp.to_rust_input() for inp in inputs]
+        response = self._infer_soa(model_name, inputs, model_version, outputs, request_id)
+        if response is None:
+            request, raw_inputs = self._build_request(
+                model_name, inputs, model_version, outputs, request_id
+            )
+            
+            # 执行推理，raw_inputs 在 Rust 侧直接从 buffer 读取
+            response = self._rust_client.model_infer(request, raw_inputs)
+        
+        return InferResult(response, _shm_output_names(outputs))
+    
+    def infer_raw_outputs(
+        self,
+        model_name: str,
+        inputs: List[InferInput],
+        model_version: str = "",
+        outputs: Optional[List[InferRequestedOutput]] = None,
+        request_id: str = "",
+    ) -> Dict[str, np.ndarray]:
+        """Perform synchronous inference and return only the raw output tensors.
+        
+        The response is not decoded into a ModelInferResponse; only the output
+        descriptions and raw_output_contents are located in the response body, and the
+        returned arrays are read-only views into that body without copying.
+        
+        Args:
+            model_name: The name of the model.
+            inputs: List of input tensors.
+            model_version: The version of the model (optional).
+            outputs: List of requested output tensors (optional).
+            request_id: Unique identifier for the request (optional).
+            
+        Returns:
+            The output tensors keyed by output name. Outputs returned through shared
+            memory are not included.
+        """
+        request, raw_inputs = self._build_request(
+            model_name, inputs, model_version, outputs, request_id
+        )
+        body, spans = self._rust_client.model_infer_raw_outputs(request, raw_inputs)
+        # ResponseBody 通过 buffer protocol 导出响应数据，各输出都是它的切片视图
+        buffer = np.frombuffer(body, dtype=np.uint8)
+        return {
+            name: InferOutput._raw_contents_to_numpy(buffer[start:end], datatype, tuple(shape))
+            for name, datatype, shape, start, end in spans
+        }
+    
+    async def infer_async(
+        self,
+        model_name: str,
+        inputs: List[InferInput],
+        model_version: str = "",
+        outputs: Optional[List[InferRequestedOutput]] = None,
+        request_id: str = "",
+        sequence_id: int = 0,
+        sequence_start: bool = False,
+        sequence_end: bool = False,
+        priority: int = 0,
+        timeout: Optional[float] = None,
+        client_timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        compression_algorithm: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> InferResult:
+        """Perform inference as an asyncio coroutine.
+        
+        The request runs on the client's tokio runtime; awaiting it does not block
+        the event loop or occupy a Python thread.
+        
+        Args:
+            model_name: The name of the model.
+            inputs: List of input tensors.
+            model_version: The version of the model (optional).
+            outputs: List of requested output tensors (optional).
+            request_id: Unique identifier for the request (optional).
+            sequence_id: Sequence identifier for stateful models (ignored).
+            sequence_start: Whether this is the start of a sequence (ignored).
+            sequence_end: Whether this is the end of a sequence (ignored).
+            priority: Request priority (ignored).
+            timeout: Request timeout in seconds (ignored).
+            client_timeout: Client timeout in seconds (ignored).
+            headers: Additional headers (ignored).
+            compression_algorithm: Compression algorithm to use (ignored).
+            parameters: Additional parameters (ignored).
+            
+        Returns:
+            The inference result.
+        """
+        request, raw_inputs = self._build_request(
+            model_name, inputs, model_version, outputs, request_id
+        )
+        response = await self._rust_client.model_infer_async(request, raw_inputs)
+        return InferResult(response, _shm_output_names(outputs))
+    
+    def prepare_infer(
+        self,
+        model_name: str,
+        inputs: List[InferInput],
+        model_version: str = "",
+        outputs: Optional[List[InferRequestedOutput]] = None,
+        request_id: str = "",
+    ) -> PreparedInferRequest:
+        """Build a reusable inference request.
+        
+        The request (model, input names/datatypes/shapes and requested outputs) is built
+        once; each PreparedInferRequest.run() call only supplies the input data, which is
+        sent in raw_input_contents.
+        
+        Args:
+            model_name: The name of the model.
+            inputs: The input schema. Data set on the inputs is ignored, except that inputs
+                using shared memory keep their shared memory settings.
+            model_version: The version of the model (optional).
+            outputs: List of requested output tensors (optional).
+            request_id: Identifier sent with every request (optional).
+            
+        Returns:
+            The prepared request.
+        """
+        input_tensors = []
+        raw_datatypes = []
+        for inp in inputs:
+            if inp._shm_region_name is not None:
+                input_tensors.append(inp.to_rust_input())
+                continue
+            input_tensors.append(
+                triton_client.InferInputTensor(
+                    name=inp.name(),
+                    datatype=inp.datatype(),
+                    shape=inp.shape(),
+                    contents=_EMPTY_CONTENTS,
+                    parameters={},
+                )
+            )
+            raw_datatypes.append(inp.datatype())
         
-        # 转换输出
         output_tensors = []
         if outputs:
             output_tensors = [out.to_rust_output() for out in outputs]
         
-        # 创建请求
         request = triton_client.ModelInferRequest(
             model_name=model_name,
             model_version=model_version,
             id=request_id,
             inputs=input_tensors,
             outputs=output_tensors,
-            parameters={},  # TODO: 转换 parameters
+            parameters={},
+        )
+        return PreparedInferRequest(
+            self._rust_client, request, raw_datatypes, _shm_output_names(outputs)
         )
-        
-        # 执行推理（通过 extract 实现所有权转移，零拷贝）
-        response = self._rust_client.model_infer(request)
-        
-        return InferResult(response)
     
     def async_infer(
         self,
@@ -315,7 +646,7 @@ class InferenceServerClient:
                       The callback receives (result, error) as arguments.
             model_version: The version of the model (optional).
             outputs: List of requested output tensors (optional).
-            request_id: Unique identifier for the request (ignored).
+            request_id: Unique identifier for the request. A unique id is generated if empty.
             sequence_id: Sequence identifier for stateful models (ignored).
             sequence_start: Whether this is the start of a sequence (ignored).
             sequence_end: Whether this is the end of a sequence (ignored).
@@ -329,34 +660,192 @@ class InferenceServerClient:
         Returns:
             A call context that can be used to cancel the request.
         """
-        def worker():
-            try:
-                result = self.infer(
-                    model_name=model_name,
-                    inputs=inputs,
-                    model_version=model_version,
-                    outputs=outputs,
-                    request_id=request_id,
-                    sequence_id=sequence_id,
-                    sequence_start=sequence_start,
-                    sequence_end=sequence_end,
-                    priority=priority,
-                    timeout=timeout,
-                    client_timeout=client_timeout,
-                    headers=headers,
-                    compression_algorithm=compression_algorithm,
-                    parameters=parameters,
-                )
-                callback(result, None)
-            except Exception as e:
-                callback(None, e)
-        
-        future = self._executor.submit(worker)
-        return CallContext(future)
+        # 响应按 id 分发，未指定时自动生成唯一 id
+        if not request_id:
+            request_id = uuid.uuid4().hex
+        request, raw_inputs = self._build_request(
+            model_name, inputs, model_version, outputs, request_id
+        )
+        stream = self._register_pending(request_id, callback, _shm_output_names(outputs))
+        try:
+            stream.send(request, raw_inputs)
+        except Exception:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise
+        return CallContext(request_id, self._cancel_pending)
     
     def close(self) -> None:
         """Close the client connection."""
-        if not self._closed:
-            self._executor.shutdown(wait=True)
+        with self._pending_lock:
+            if self._closed:
+                return
             self._closed = True
+            stream, dispatcher = self._stream, self._dispatcher
+        if stream is not None:
+            # 关闭发送端后服务端会返回剩余响应并结束 stream，分发线程随之退出
+            stream.close()
+            if threading.current_thread() is not dispatcher:
+                dispatcher.join()
+    
+    def _infer_soa(
+        self,
+        model_name: str,
+        inputs: List[InferInput],
+        model_version: str,
+        outputs: Optional[List[InferRequestedOutput]],
+        request_id: str,
+    ) -> Optional[triton_client.ModelInferResponse]:
+        """所有输入均使用 binary_data 且输出不使用共享内存时，以并列序列一次性传入 Rust.
+        
+        不满足条件时返回 None，由调用方走常规的请求构建流程。
+        """
+        if outputs and any(out._shm_region_name is not None for out in outputs):
+            return None
+        names, datatypes, shapes, buffers = [], [], [], []
+        for inp in inputs:
+            raw = inp._get_raw_content()
+            if raw is None:
+                return None
+            names.append(inp._name)
+            datatypes.append(inp._datatype)
+            shapes.append(inp._shape)
+            buffers.append(raw)
+        output_names = [out._name for out in outputs] if outputs else []
+        return self._rust_client.model_infer_soa(
+            model_name,
+            model_version,
+            request_id,
+            names,
+            datatypes,
+            shapes,
+            buffers,
+            output_names,
+        )
+    
+    def _build_request(
+        self,
+        model_name: str,
+        inputs: List[InferInput],
+        model_version: str,
+        outputs: Optional[List[InferRequestedOutput]],
+        request_id: str,
+    ) -> Tuple[triton_client.ModelInferRequest, Optional[List[Any]]]:
+        """构建 ModelInferRequest.
+        
+        raw_input_contents 不写入请求，而是作为 buffer 列表单独返回，
+        发送时由 Rust 直接读取，避免数据在请求对象中多拷贝一次。
+        """
+        # 转换输出
+        output_tensors = []
+        if outputs:
+            output_tensors = [out.to_rust_output() for out in outputs]
+        
+        request = triton_client.ModelInferRequest(
+            model_name=model_name,
+            model_version=model_version,
+            id=request_id,
+            inputs=[],
+            outputs=output_tensors,
+            parameters={},  # TODO: 转换 parameters
+        )
+        # 转换输入：numpy 数据在一次调用中由 Rust 按 datatype 构建 contents
+        request.extend_inputs([inp._to_rust_item(slot) for slot, inp in enumerate(inputs)])
+        
+        # raw_input_contents 按顺序对应所有非共享内存输入，不能与 contents 混用
+        raw_contents = [inp._get_raw_content() for inp in inputs]
+        if all(raw is None for raw in raw_contents):
+            return request, None
+        raw_inputs = []
+        for inp, raw in zip(inputs, raw_contents):
+            if raw is not None:
+                raw_inputs.append(raw)
+            elif inp._shm_region_name is None:
+                raise ValueError(
+                    f"Input '{inp.name()}' must also use binary_data when other inputs do"
+                )
+        return request, raw_inputs
+    
+    def _register_pending(
+        self,
+        request_id: str,
+        callback: Callable[[Optional[InferResult], Optional[Exception]], None],
+        shm_outputs: FrozenSet[str] = frozenset(),
+    ) -> triton_client.InferStream:
+        """登记回调并返回当前 stream；stream 不存在（首次调用或上一条已结束）时重新建立.
+        
+        登记与取 stream 在同一把锁内完成，stream 结束时登记在其上的回调一定会被通知。
+        """
+        with self._pending_lock:
+            if self._closed:
+                raise RuntimeError("Client is closed")
+            if request_id in self._pending:
+                raise ValueError(f"Duplicate in-flight request id: {request_id}")
+            if self._stream is None:
+                self._stream = self._rust_client.model_stream_infer()
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch_responses,
+                    args=(self._stream,),
+                    name="triton-stream-dispatcher",
+                    daemon=True,
+                )
+                self._dispatcher.start()
+            self._pending[request_id] = (callback, shm_outputs)
+            return self._stream
+    
+    def _dispatch_responses(self, stream: triton_client.InferStream) -> None:
+        """从 stream 读取响应并按 id 调用对应的回调."""
+        while True:
+            try:
+                item = stream.poll_response()
+            except Exception as e:
+                self._fail_pending(stream, e)
+                return
+            if item is None:
+                self._fail_pending(stream, RuntimeError("Inference stream closed"))
+                return
+            
+            request_id, infer_response, error_message = item
+            with self._pending_lock:
+                pending = self._pending.pop(request_id, None)
+            if pending is None:
+                if error_message:
+                    # 无法确定属于哪个请求（服务端未回传 id 或请求已取消），不能交给其他请求
+                    logger.error(
+                        "Inference stream error for unknown request id %r: %s",
+                        request_id,
+                        error_message,
+                    )
+                # 否则是已取消的请求
+                continue
+            
+            callback, shm_outputs = pending
+            # 回调中的异常不能中断分发线程
+            try:
+                if error_message:
+                    callback(None, RuntimeError(error_message))
+                else:
+                    callback(InferResult(infer_response, shm_outputs), None)
+            except Exception:
+                logger.exception("Unhandled exception in async_infer callback")
+    
+    def _fail_pending(self, stream: triton_client.InferStream, error: Exception) -> None:
+        """stream 结束时通知所有未完成的请求，并清除 stream 使下一次 async_infer 重新建立."""
+        with self._pending_lock:
+            if self._stream is stream:
+                self._stream = None
+                self._dispatcher = None
+            callbacks = [callback for callback, _ in self._pending.values()]
+            self._pending.clear()
+        for callback in callbacks:
+            # 单个回调的异常不能阻止其余请求收到通知
+            try:
+                callback(None, error)
+            except Exception:
+                logger.exception("Unhandled exception in async_infer callback")
+    
+    def _cancel_pending(self, request_id: str) -> None:
+        """移除待处理的回调，之后到达的响应将被丢弃."""
+        with self._pending_lock:
+            self._pending.pop(request_id, None)
 
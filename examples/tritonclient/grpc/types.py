@@ -1,6 +1,11 @@
 """Type definitions for tritonclient.grpc."""
 
-from typing import Optional, List, Dict, Any
+import math
+import threading
+import types
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from typing import Optional, List, Dict, Any, Callable, Tuple, Iterator, Sequence, FrozenSet
 
 import numpy as np
 
@@ -8,13 +13,153 @@ import triton_client
 from ..utils.dtype import triton_to_np_dtype
 
 
+# np.dtype 的内置实例是单例，triton_to_np_dtype 返回的也是这些实例，可以用 is 比较
+_OBJECT_DTYPE = np.dtype(np.object_)
+
+
+def _raw_bytes_view(data: Any, datatype: str) -> Any:
+    """将 numpy 数组转换为 raw_input_contents 所需的字节视图，其他 buffer 对象原样返回."""
+    if not isinstance(data, np.ndarray):
+        return data
+    dtype = triton_to_np_dtype(datatype)
+    if dtype is _OBJECT_DTYPE:
+        raise ValueError(f"Unsupported data type for binary data: {datatype}")
+    # dtype 一致且连续时不会产生拷贝，view 只是重新解释字节
+    return np.ascontiguousarray(data, dtype=dtype).reshape(-1).view(np.uint8)
+
+
+# numpy dtype -> (List 类型, InferTensorContents 的 Replace_* 方法, 传入的元素 dtype)
+# List 类型为 None 时直接传入 numpy 数组：8/16 位整数由 Rust 扩展为 protobuf 的 32 位字段；
+# FP16 以 fp32_contents 传输，在 Python 侧由 NumPy 直接转换为 float32
+_CONTENTS_DISPATCH: Dict[np.dtype, Tuple[Any, str, np.dtype]] = {
+    np.dtype(np.bool_): (triton_client.ListBool, "Replace_bool_contents", np.dtype(np.bool_)),
+    np.dtype(np.int8): (None, "Replace_int_contents_from_array", np.dtype(np.int8)),
+    np.dtype(np.int16): (None, "Replace_int_contents_from_array", np.dtype(np.int16)),
+    np.dtype(np.int32): (triton_client.ListI32, "Replace_int_contents", np.dtype(np.int32)),
+    np.dtype(np.int64): (triton_client.ListI64, "Replace_int64_contents", np.dtype(np.int64)),
+    np.dtype(np.uint8): (None, "Replace_uint_contents_from_array", np.dtype(np.uint8)),
+    np.dtype(np.uint16): (None, "Replace_uint_contents_from_array", np.dtype(np.uint16)),
+    np.dtype(np.uint32): (triton_client.ListU32, "Replace_uint_contents", np.dtype(np.uint32)),
+    np.dtype(np.uint64): (triton_client.ListU64, "Replace_uint64_contents", np.dtype(np.uint64)),
+    np.dtype(np.float16): (triton_client.ListF32, "Replace_fp32_contents", np.dtype(np.float32)),
+    np.dtype(np.float32): (triton_client.ListF32, "Replace_fp32_contents", np.dtype(np.float32)),
+    np.dtype(np.float64): (triton_client.ListF64, "Replace_fp64_contents", np.dtype(np.float64)),
+}
+
+
+# Triton datatype -> (InferTensorContents 的 Take_* 方法, 需要转换回的 dtype)
+# 直接以 datatype 字符串为键，省去 triton_to_np_dtype 和逐个 dtype 比较
+_OUTPUT_DISPATCH: Dict[str, Tuple[str, Optional[type]]] = {
+    "BOOL": ("Take_bool_contents", None),
+    "INT8": ("Take_int_contents", np.int8),
+    "INT16": ("Take_int_contents", np.int16),
+    "INT32": ("Take_int_contents", None),
+    "INT64": ("Take_int64_contents", None),
+    "UINT8": ("Take_uint_contents", np.uint8),
+    "UINT16": ("Take_uint_contents", np.uint16),
+    "UINT32": ("Take_uint_contents", None),
+    "UINT64": ("Take_uint64_contents", None),
+    "FP16": ("Take_fp32_contents", np.float16),
+    "FP32": ("Take_fp32_contents", None),
+    "FP64": ("Take_fp64_contents", None),
+}
+
+
+# 空的 InferTensorContents 只会被读取（构建请求时 Rust 侧会克隆，Take_* 作用于空对象不改变其状态），
+# 所有共享内存输入和 raw 输出共用同一个实例
+_EMPTY_CONTENTS = triton_client.InferTensorContents()
+
+
+# 上转换缓冲区按线程复用：List*.from_array 会拷贝数据，调用返回后缓冲区即可再次使用
+_STAGING = threading.local()
+# 超过该元素数的张量不进入缓冲池，避免线程长期持有过大的内存
+_STAGING_MAX_ELEMENTS = 1 << 24
+
+
+def _staging_buffer(dtype: np.dtype, size: int, slot: int = 0) -> Optional[np.ndarray]:
+    """返回当前线程复用的 dtype 缓冲区的前 size 个元素，size 过大时返回 None.
+    
+    缓冲区容量按 2 的幂增长，同一个缓冲区可以服务不同形状的张量。同一次调用中需要
+    同时保留的多个缓冲区（如一个请求的各个输入）使用不同的 slot。
+    """
+    if size > _STAGING_MAX_ELEMENTS:
+        return None
+    pool = getattr(_STAGING, "pool", None)
+    if pool is None:
+        pool = _STAGING.pool = {}
+    buffer = pool.get((dtype, slot))
+    if buffer is None or buffer.size < size:
+        buffer = np.empty(1 << max(size - 1, 0).bit_length(), dtype=dtype)
+        pool[(dtype, slot)] = buffer
+    return buffer[:size]
+
+
+@lru_cache(maxsize=1024)
+def _input_template(name: str, datatype: str, shape: Tuple[int, ...]) -> triton_client.InferInputTensor:
+    """返回不带数据的 InferInputTensor，按 (name, datatype, shape) 缓存.
+    
+    构建请求时 Rust 侧会 extract（克隆）该对象，因此多个请求可以安全地共享同一个模板；
+    模板是可变对象，只在 _to_rust_item 中使用，不能通过公开接口返回给调用方。
+    """
+    return triton_client.InferInputTensor(
+        name=name,
+        datatype=datatype,
+        shape=list(shape),
+        contents=_EMPTY_CONTENTS,
+        parameters={},
+    )
+
+
+# 预先绑定扩展模块中的类和 classmethod，省去每次调用时的多级属性查找
+_InferParameter = triton_client.InferParameter
+_string_param = triton_client.ParameterChoice.string_param
+_uint64_param = triton_client.ParameterChoice.uint64_param
+
+
+def _create_shm_parameters(
+        region_name: str,
+        byte_size: int,
+        offset: int,
+) -> Dict[str, triton_client.InferParameter]:
+    """创建共享内存参数字典."""
+    parameters = {}
+
+    # 设置共享内存区域名称
+    shm_name_param = _InferParameter()
+    shm_name_param.parameter_choice = _string_param(region_name)
+    parameters["shared_memory_region"] = shm_name_param
+
+    # 设置字节大小
+    byte_size_param = _InferParameter()
+    byte_size_param.parameter_choice = _uint64_param(byte_size)
+    parameters["shared_memory_byte_size"] = byte_size_param
+
+    # 设置偏移量（如果有）
+    if offset > 0:
+        offset_param = _InferParameter()
+        offset_param.parameter_choice = _uint64_param(offset)
+        parameters["shared_memory_offset"] = offset_param
+
+    return parameters
+
+
+def _shm_output_names(outputs: Optional[List["InferRequestedOutput"]]) -> FrozenSet[str]:
+    """返回写入共享内存的输出名；这些输出在响应的 raw_output_contents 中没有对应项."""
+    if not outputs:
+        return frozenset()
+    return frozenset(out._name for out in outputs if out._shm_region_name is not None)
+
+
 class InferInput:
     """Represents an input tensor for inference."""
 
+    __slots__ = ("_name", "_shape", "_datatype", "_data", "_binary_data",
+                 "_shm_region_name", "_shm_byte_size", "_shm_offset", "_shm_parameters")
+
     def __init__(
             self,
             name: str,
-            shape: List[int],
+            shape: Sequence[int],
             datatype: str,
     ) -> None:
         """Initialize an inference input.
@@ -25,12 +170,16 @@ class InferInput:
             datatype: The data type of the input tensor (e.g., "FP32", "INT8").
         """
         self._name = name
-        self._shape = shape
+        # shape 以不可变的 tuple 保存，读取时无需防御性拷贝
+        self._shape = tuple(shape)
         self._datatype = datatype
         self._data: Optional[np.ndarray] = None
+        self._binary_data = False
         self._shm_region_name: Optional[str] = None
         self._shm_byte_size: int = 0
         self._shm_offset: int = 0
+        # 共享内存参数只随 set_shared_memory 变化，区域被多次推理复用时无需重复构建
+        self._shm_parameters: Optional[Dict[str, triton_client.InferParameter]] = None
 
     def name(self) -> str:
         """Get the name of input associated with this object.
@@ -48,15 +197,15 @@ class InferInput:
         """
         return self._datatype
 
-    def shape(self) -> List[int]:
+    def shape(self) -> Tuple[int, ...]:
         """Get the shape of input associated with this object.
         
         Returns:
             The shape of input.
         """
-        return self._shape.copy()
+        return self._shape
 
-    def set_shape(self, shape: List[int]) -> "InferInput":
+    def set_shape(self, shape: Sequence[int]) -> "InferInput":
         """Set the shape of the input tensor.
         
         Args:
@@ -65,19 +214,23 @@ class InferInput:
         Returns:
             The updated input.
         """
-        self._shape = shape.copy()
+        self._shape = tuple(shape)
         return self
 
-    def set_data_from_numpy(self, input_tensor: np.ndarray) -> "InferInput":
+    def set_data_from_numpy(self, input_tensor: np.ndarray, binary_data: bool = False) -> "InferInput":
         """Set the input data from a numpy array.
         
         Args:
             input_tensor: The numpy array containing the input data.
+            binary_data: If True the data is sent in the request's raw_input_contents and
+                passed to Rust through the buffer protocol instead of the typed tensor
+                contents. Default is False.
             
         Returns:
             The updated input.
         """
         self._data = input_tensor
+        self._binary_data = binary_data
         self._shm_region_name = None  # 清除共享内存设置
         return self
 
@@ -100,6 +253,7 @@ class InferInput:
         self._shm_region_name = region_name
         self._shm_byte_size = byte_size
         self._shm_offset = offset
+        self._shm_parameters = None
         self._data = None  # 清除 numpy 数据
         return self
 
@@ -109,20 +263,23 @@ class InferInput:
         Returns:
             A Rust InferInputTensor object.
         """
-        contents = None
         parameters: Dict[str, triton_client.InferParameter] = {}
 
-        if self._data is not None:
+        if self._data is not None and not self._binary_data:
             # 使用 numpy 数据
             contents = self._create_tensor_contents(self._data)
         elif self._shm_region_name is not None:
             # 使用共享内存，contents 为空
-            contents = triton_client.InferTensorContents()
-            # 设置共享内存参数
-            parameters = self._create_shm_parameters()
+            contents = _EMPTY_CONTENTS
+            # 设置共享内存参数（Rust 侧构建时会拷贝字典，缓存的对象可以复用）
+            if self._shm_parameters is None:
+                self._shm_parameters = _create_shm_parameters(
+                    self._shm_region_name, self._shm_byte_size, self._shm_offset
+                )
+            parameters = self._shm_parameters
         else:
-            # 没有数据，创建空的 contents
-            contents = triton_client.InferTensorContents()
+            # binary_data（数据通过 raw_input_contents 发送）或没有数据，contents 为空
+            contents = _EMPTY_CONTENTS
 
         return triton_client.InferInputTensor(
             name=self._name,
@@ -132,86 +289,72 @@ class InferInput:
             parameters=parameters,
         )
 
+    def _to_rust_item(self, slot: int = 0) -> Any:
+        """返回 ModelInferRequest.extend_inputs 所需的一项.
+        
+        使用 contents 的输入返回 (name, datatype, shape, 一维数组)，由 Rust 一次性构建；
+        其他输入返回 to_rust_input() 的结果。slot 为输入在请求中的位置：所有输入在同一次
+        调用中才被读取，需要类型转换的输入各自使用独立的线程复用缓冲区。
+        """
+        if self._shm_region_name is None and (self._data is None or self._binary_data):
+            # 只与 name/datatype/shape 有关，复用缓存的模板（Rust 侧会克隆，不会被修改）
+            return _input_template(self._name, self._datatype, self._shape)
+        if self._data is None or self._binary_data:
+            return self.to_rust_input()
+        try:
+            # FP16 直接转换为 fp32_contents 所需的 float32：float32 数据不再先截断为 float16
+            dtype = _CONTENTS_DISPATCH[triton_to_np_dtype(self._datatype)][2]
+        except KeyError:
+            raise ValueError(f"Unsupported data type: {self._datatype}") from None
+        data = self._data
+        if data.flags.c_contiguous and (data.dtype is dtype or data.dtype == dtype):
+            # 类型一致且连续时直接传入视图，不拷贝
+            flat_data = data.reshape(-1)
+        else:
+            # 类型转换和非连续数组的整理一次性写入线程复用的缓冲区，不分配临时数组
+            flat_data = _staging_buffer(dtype, data.size, slot)
+            if flat_data is None:
+                flat_data = np.ascontiguousarray(data, dtype=dtype).reshape(-1)
+            else:
+                np.copyto(flat_data.reshape(data.shape), data, casting="unsafe")
+        return self._name, self._datatype, self._shape, flat_data
+
+    def _get_raw_content(self) -> Optional[np.ndarray]:
+        """返回 raw_input_contents 所需的字节视图，未使用 binary_data 时返回 None."""
+        if self._data is None or not self._binary_data:
+            return None
+        return _raw_bytes_view(self._data, self._datatype)
+
     def _create_tensor_contents(self, data: np.ndarray) -> triton_client.InferTensorContents:
         """从 numpy 数组创建 InferTensorContents."""
-        contents = triton_client.InferTensorContents()
         dtype = triton_to_np_dtype(self._datatype)
-        flat_data = data.flatten()
-        # 根据数据类型设置内容
-        if dtype == np.bool_:
-            data = triton_client.ListBool.from_array(flat_data)
-            contents.Replace_bool_contents(data)
-        elif dtype == np.int8:
-            data = triton_client.ListI32.from_array(flat_data.astype(np.int32))
-            contents.Replace_int_contents(data)
-        elif dtype == np.int16:
-            data = triton_client.ListI32.from_array(flat_data.astype(np.int32))
-            contents.Replace_int_contents(data)
-        elif dtype == np.int32:
-            data = triton_client.ListI32.from_array(flat_data)
-            contents.Replace_int_contents(data)
-        elif dtype == np.int64:
-            data = triton_client.ListI64.from_array(flat_data)
-            contents.Replace_int64_contents(data)
-        elif dtype == np.uint8:
-            data = triton_client.ListU32.from_array(flat_data.astype(np.uint32))
-            contents.Replace_uint_contents(data)
-        elif dtype == np.uint16:
-            data = triton_client.ListU32.from_array(flat_data.astype(np.uint32))
-            contents.Replace_uint_contents(data)
-        elif dtype == np.uint32:
-            data = triton_client.ListU32.from_array(flat_data)
-            contents.Replace_uint_contents(data)
-        elif dtype == np.uint64:
-            data = triton_client.ListU64.from_array(flat_data)
-            contents.Replace_uint64_contents(data)
-        elif dtype == np.float16:
-            data = triton_client.ListF32.from_array(flat_data.astype(np.float32))
-            contents.Replace_fp32_contents(data)
-        elif dtype == np.float32:
-            data = triton_client.ListF32.from_array(flat_data)
-            contents.Replace_fp32_contents(data)
-        elif dtype == np.float64:
-            data = triton_client.ListF64.from_array(flat_data)
-            contents.Replace_fp64_contents(data)
-        else:
-            raise ValueError(f"Unsupported data type: {self._datatype}")
-
+        try:
+            list_type, replace, list_dtype = _CONTENTS_DISPATCH[dtype]
+        except KeyError:
+            raise ValueError(f"Unsupported data type: {self._datatype}") from None
+        # ravel 对连续数组返回视图（flatten 总是拷贝）
+        flat_data = np.ascontiguousarray(data).ravel()
+        # 原生字节序的数组 dtype 与表中的单例相同，is 比较即可命中；否则再回退到 ==
+        if flat_data.dtype is not list_dtype and flat_data.dtype != list_dtype:
+            # 类型转换（如 FP16 上转换）写入线程复用的缓冲区，避免每次请求分配临时数组
+            staging = _staging_buffer(list_dtype, flat_data.size)
+            if staging is None:
+                flat_data = flat_data.astype(list_dtype)
+            else:
+                np.copyto(staging, flat_data, casting="unsafe")
+                flat_data = staging
+        contents = triton_client.InferTensorContents()
+        if list_type is not None:
+            flat_data = list_type.from_array(flat_data)
+        getattr(contents, replace)(flat_data)
         return contents
 
-    def _create_shm_parameters(self) -> Dict[str, triton_client.InferParameter]:
-        """创建共享内存参数字典."""
-        parameters = {}
-
-        # 设置共享内存区域名称
-        shm_name_param = triton_client.InferParameter()
-        # ParameterChoice.string_param 是 classmethod，直接调用即可
-        shm_name_param.parameter_choice = triton_client.ParameterChoice.string_param(
-            self._shm_region_name
-        )
-        parameters["shared_memory_region"] = shm_name_param
-
-        # 设置字节大小
-        byte_size_param = triton_client.InferParameter()
-        byte_size_param.parameter_choice = triton_client.ParameterChoice.uint64_param(
-            self._shm_byte_size
-        )
-        parameters["shared_memory_byte_size"] = byte_size_param
-
-        # 设置偏移量（如果有）
-        if self._shm_offset > 0:
-            offset_param = triton_client.InferParameter()
-            offset_param.parameter_choice = triton_client.ParameterChoice.uint64_param(
-                self._shm_offset
-            )
-            parameters["shared_memory_offset"] = offset_param
-
-        return parameters
-
-
 class InferRequestedOutput:
     """Represents a requested output tensor for inference."""
 
+    __slots__ = ("_name", "_class_count", "_shm_region_name", "_shm_byte_size", "_shm_offset",
+                 "_shm_parameters")
+
     def __init__(self, name: str, class_count: int = 0) -> None:
         """Initialize a requested output.
         
@@ -224,6 +367,7 @@ class InferRequestedOutput:
         self._shm_region_name: Optional[str] = None
         self._shm_byte_size: int = 0
         self._shm_offset: int = 0
+        self._shm_parameters: Optional[Dict[str, triton_client.InferParameter]] = None
 
     def name(self) -> str:
         """Get the name of output associated with this object.
@@ -249,6 +393,7 @@ class InferRequestedOutput:
         self._shm_region_name = region_name
         self._shm_byte_size = byte_size
         self._shm_offset = offset
+        self._shm_parameters = None
 
     def unset_shared_memory(self) -> None:
         """Clears the shared memory option set by the last call to set_shared_memory().
@@ -258,6 +403,7 @@ class InferRequestedOutput:
         self._shm_region_name = None
         self._shm_byte_size = 0
         self._shm_offset = 0
+        self._shm_parameters = None
 
     def to_rust_output(self) -> triton_client.InferRequestedOutputTensor:
         """Convert to Rust InferRequestedOutputTensor.
@@ -269,25 +415,11 @@ class InferRequestedOutput:
 
         if self._shm_region_name is not None:
             # 设置共享内存参数
-            shm_name_param = triton_client.InferParameter()
-            # ParameterChoice.string_param 是 classmethod，直接调用即可
-            shm_name_param.parameter_choice = triton_client.ParameterChoice.string_param(
-                self._shm_region_name
-            )
-            parameters["shared_memory_region"] = shm_name_param
-
-            byte_size_param = triton_client.InferParameter()
-            byte_size_param.parameter_choice = triton_client.ParameterChoice.uint64_param(
-                self._shm_byte_size
-            )
-            parameters["shared_memory_byte_size"] = byte_size_param
-
-            if self._shm_offset > 0:
-                offset_param = triton_client.InferParameter()
-                offset_param.parameter_choice = triton_client.ParameterChoice.uint64_param(
-                    self._shm_offset
+            if self._shm_parameters is None:
+                self._shm_parameters = _create_shm_parameters(
+                    self._shm_region_name, self._shm_byte_size, self._shm_offset
                 )
-                parameters["shared_memory_offset"] = offset_param
+            parameters = self._shm_parameters
 
         return triton_client.InferRequestedOutputTensor(
             name=self._name,
@@ -298,12 +430,16 @@ class InferRequestedOutput:
 class InferOutput:
     """Represents an output tensor from inference."""
 
+    __slots__ = ("_name", "_shape", "_datatype", "_contents", "_response", "_raw_index", "_array")
+
     def __init__(
             self,
             name: str,
             shape: tuple[int, ...],
             datatype: str,
-            contents: triton_client.InferTensorContents,
+            contents: Optional[triton_client.InferTensorContents],
+            response: Optional[triton_client.ModelInferResponse] = None,
+            raw_index: Optional[int] = None,
     ):
         """Initialize an output tensor.
         
@@ -311,12 +447,18 @@ class InferOutput:
             name: The name of the output tensor.
             shape: The shape of the output tensor.
             datatype: The data type of the output tensor.
-            contents: The tensor contents from Rust.
+            contents: The tensor contents from Rust, or None if the response carries no
+                data for this output (e.g. it was written to shared memory).
+            response: The response holding the raw output contents (optional).
+            raw_index: The index of this output in `raw_output_contents` (optional).
         """
         self._name = name
         self._shape = shape
         self._datatype = datatype
         self._contents = contents
+        self._response = response
+        self._raw_index = raw_index
+        self._array: Optional[np.ndarray] = None
 
     @property
     def name(self) -> str:
@@ -333,13 +475,60 @@ class InferOutput:
         """The data type of the output tensor."""
         return self._datatype
 
-    def as_numpy(self) -> np.ndarray:
+    def as_numpy(self) -> np.ndarray | None:
         """Get the output tensor as a numpy array.
         
         Returns:
-            The output tensor as a numpy array.
+            The output tensor as a numpy array, or None if the response carries no data
+            for it (e.g. the output was written to shared memory).
         """
-        return self._tensor_contents_to_numpy(self._contents, self._datatype, self._shape)
+        # Take_* / take_raw_output 会转移数据所有权，只能调用一次，因此缓存结果
+        if self._array is None:
+            if self._raw_index is not None:
+                raw = self._response.take_raw_output(self._raw_index)
+                self._array = self._raw_or_missing_to_numpy(raw, self._datatype, self._shape)
+            elif self._contents is not None:
+                self._array = self._tensor_contents_to_numpy(self._contents, self._datatype, self._shape)
+            else:
+                self._array = self._raw_or_missing_to_numpy(None, self._datatype, self._shape)
+        return self._array
+
+    @classmethod
+    def _raw_or_missing_to_numpy(
+            cls,
+            raw: Optional[np.ndarray],
+            datatype: str,
+            shape: tuple[int, ...],
+    ) -> np.ndarray | None:
+        """转换 raw_output_contents；响应中没有该输出的数据时，非空形状返回 None."""
+        if raw is not None:
+            return cls._raw_contents_to_numpy(raw, datatype, shape)
+        if math.prod(shape) != 0:
+            return None
+        return cls._tensor_contents_to_numpy(_EMPTY_CONTENTS, datatype, shape)
+
+    @staticmethod
+    def _raw_contents_to_numpy(
+            raw: np.ndarray,
+            datatype: str,
+            shape: tuple[int, ...],
+    ) -> np.ndarray:
+        """将 raw_output_contents（uint8 数组）按 dtype 重新解释，不拷贝数据."""
+        if datatype == "BYTES":
+            # BYTES 为 4 字节小端长度前缀 + 内容的序列
+            items = []
+            buffer = raw.tobytes()
+            offset = 0
+            while offset < len(buffer):
+                length = int.from_bytes(buffer[offset:offset + 4], "little")
+                offset += 4
+                items.append(buffer[offset:offset + length])
+                offset += length
+            return np.array(items, dtype=np.object_).reshape(shape)
+        arr = np.frombuffer(raw, dtype=triton_to_np_dtype(datatype))
+        # 原地修改 shape：一维连续数组只会得到视图，无法视图化时直接报错而不是拷贝
+        arr.shape = shape
+        return arr
 
     @staticmethod
     def _tensor_contents_to_numpy(
@@ -348,63 +537,101 @@ class InferOutput:
             shape: tuple[int, ...],
     ) -> np.ndarray:
         """将 InferTensorContents 转换为 numpy 数组."""
-        dtype = triton_to_np_dtype(datatype)
-        if dtype == np.bool_:
-            vec = contents.Take_bool_contents()
-        elif dtype == np.int32:
-            vec = contents.Take_int_contents()
-        elif dtype == np.int64:
-            vec = contents.Take_int64_contents()
-        elif dtype == np.uint32:
-            vec = contents.Take_uint_contents()
-        elif dtype == np.uint64:
-            vec = contents.Take_uint64_contents()
-        elif dtype == np.float32:
-            vec = contents.Take_fp32_contents()
-        elif dtype == np.float64:
-            vec = contents.Take_fp64_contents()
-        else:
-            # 对于其他类型，尝试使用 int32
-            vec = contents.Take_int_contents()
+        take, narrow_dtype = _OUTPUT_DISPATCH.get(datatype, ("Take_int_contents", None))
+        vec = getattr(contents, take)()
         vec: triton_client.ListF32
-        return vec.into_array().reshape(shape)
+        arr = vec.into_array()
+        if narrow_dtype is not None:
+            # 8/16 位整数和 FP16 以更宽的 protobuf 字段传输，转换回声明的类型
+            arr = arr.astype(narrow_dtype)
+        arr.shape = shape
+        return arr
 
 
 class InferResult:
     """Represents the result of an inference request."""
 
-    def __init__(self, response: triton_client.ModelInferResponse):
+    def __init__(
+            self,
+            response: triton_client.ModelInferResponse,
+            shm_outputs: FrozenSet[str] = frozenset(),
+    ):
         """Initialize an inference result.
         
         Args:
             response: The ModelInferResponse from Rust.
+            shm_outputs: The names of the requested outputs written to shared memory;
+                the response carries no raw_output_contents entry for them.
         """
         self._response = response
+        self._shm_outputs = shm_outputs
+        # 只读取输出的描述信息（outputs getter 会克隆包括张量数据在内的整个列表）；
+        # InferOutput 在首次按名称访问时才创建
+        self._output_headers: Dict[str, Tuple[int, str, List[int], bool]] = {
+            name: (index, datatype, shape, has_contents)
+            for index, (name, datatype, shape, has_contents) in enumerate(response.output_headers())
+        }
         self._outputs: Dict[str, InferOutput] = {}
-        self._extract_outputs()
-
-    def _extract_outputs(self) -> None:
-        """提取输出张量."""
-        for output in self._response.outputs:
-            # 获取形状（get_all 自动生成 getter，shape 是 List[i64]）
-            shape_list = output.shape  # 直接访问，get_all 会自动处理
-            shape = tuple(int(x) for x in shape_list)  # 转换为 tuple[int, ...]
-
-            # 获取数据类型
-            datatype = output.datatype
+        # as_numpy 直接解码得到的数组，不经过 InferOutput
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._raw_indices: Optional[Dict[str, int]] = None
 
-            # 获取 contents（可能是 None）
-            contents = output.contents if output.contents is not None else triton_client.InferTensorContents()
-
-            # 创建 InferOutput
-            infer_output = InferOutput(
-                name=output.name,
-                shape=shape,
-                datatype=datatype,
-                contents=contents,
-            )
-
-            self._outputs[output.name] = infer_output
+    def _get_output(self, name: str) -> Optional[InferOutput]:
+        """按名称返回 InferOutput，首次访问时创建并缓存."""
+        output = self._outputs.get(name)
+        if output is not None:
+            return output
+        header = self._output_headers.get(name)
+        if header is None:
+            return None
+        index, datatype, shape, has_contents = header
+
+        # 已经由 as_numpy 解码过的输出，数据已从响应中转移出来，直接复用数组
+        array = self._arrays.get(name)
+        contents = _EMPTY_CONTENTS
+        raw_index = None
+        if array is None:
+            if has_contents:
+                # 从响应中转移 contents 的所有权，不克隆张量数据
+                contents = self._response.take_output_contents(index)
+            else:
+                raw_index = self._get_raw_indices().get(name)
+                if raw_index is None:
+                    # 写入共享内存的输出，响应中没有数据
+                    contents = None
+
+        output = InferOutput(
+            name=name,
+            shape=tuple(shape),
+            datatype=datatype,
+            contents=contents,
+            response=self._response,
+            raw_index=raw_index,
+        )
+        output._array = array
+        self._outputs[name] = output
+        return output
+
+    def _decode_output(self, name: str, header: Tuple[int, str, List[int], bool]) -> np.ndarray | None:
+        """直接将输出解码为 numpy 数组，不创建 InferOutput."""
+        index, datatype, shape, has_contents = header
+        if has_contents:
+            contents = self._response.take_output_contents(index)
+        else:
+            raw_index = self._get_raw_indices().get(name)
+            raw = None if raw_index is None else self._response.take_raw_output(raw_index)
+            return InferOutput._raw_or_missing_to_numpy(raw, datatype, tuple(shape))
+        return InferOutput._tensor_contents_to_numpy(contents, datatype, tuple(shape))
+
+    def _get_raw_indices(self) -> Dict[str, int]:
+        """既未使用 contents、也未写入共享内存的输出按顺序对应 raw_output_contents，返回 名称 -> 下标."""
+        if self._raw_indices is None:
+            raw_outputs = [
+                name for name, header in self._output_headers.items()
+                if not header[3] and name not in self._shm_outputs
+            ]
+            self._raw_indices = {name: index for index, name in enumerate(raw_outputs)}
+        return self._raw_indices
 
     def as_numpy(self, name: str) -> np.ndarray | None:
         """Get the output tensor as a numpy array.
@@ -413,12 +640,32 @@ class InferResult:
             name: The name of the output tensor.
             
         Returns:
-            The output tensor as a numpy array, or None if not found.
+            The output tensor as a numpy array, or None if not found or the response carries
+            no data for it.
         """
-        output = self._outputs.get(name)
-        if output is None:
-            return None
-        return output.as_numpy()
+        array = self._arrays.get(name)
+        if array is None:
+            output = self._outputs.get(name)
+            if output is not None:
+                array = output.as_numpy()
+            else:
+                header = self._output_headers.get(name)
+                if header is None:
+                    return None
+                array = self._decode_output(name, header)
+            if array is not None:
+                self._arrays[name] = array
+        return array
+
+    def as_numpy_all(self) -> Dict[str, np.ndarray | None]:
+        """Get all output tensors as numpy arrays.
+        
+        Returns:
+            The output tensors as numpy arrays, keyed by output name. Outputs the response
+            carries no data for (e.g. written to shared memory) map to None.
+        """
+        # 一次遍历解码全部输出，raw_output_contents 的下标也只计算一次
+        return {name: self.as_numpy(name) for name in self._output_headers}
 
     def get_output(self, name: str, as_json: bool = False) -> Any:
         """Get the output tensor object.
@@ -430,7 +677,7 @@ class InferResult:
         Returns:
             The output tensor object as a protobuf message or dict, or None if not found.
         """
-        output = self._outputs.get(name)
+        output = self._get_output(name)
         if output is None:
             return None
 
@@ -461,25 +708,72 @@ class InferResult:
                 "id": self._response.id,
                 "outputs": [
                     {
-                        "name": output.name,
-                        "shape": list(output.shape),
-                        "datatype": output.datatype,
+                        "name": name,
+                        "shape": list(shape),
+                        "datatype": datatype,
                     }
-                    for output in self._outputs.values()
+                    for name, (_, datatype, shape, _) in self._output_headers.items()
                 ],
             }
         else:
             return self._response
 
 
+class PreparedInferRequest:
+    """A reusable inference request created by InferenceServerClient.prepare_infer()."""
+
+    def __init__(
+            self,
+            rust_client: triton_client.Client,
+            request: triton_client.ModelInferRequest,
+            raw_datatypes: List[str],
+            shm_outputs: FrozenSet[str] = frozenset(),
+    ):
+        """Initialize a prepared inference request.
+        
+        Args:
+            rust_client: The Rust client used to send the request.
+            request: The request template without input data.
+            raw_datatypes: The datatypes of the inputs whose data is passed to run().
+            shm_outputs: The names of the requested outputs written to shared memory.
+        """
+        self._rust_client = rust_client
+        self._prepared = triton_client.PreparedInferRequest(request)
+        self._raw_datatypes = raw_datatypes
+        self._shm_outputs = shm_outputs
+
+    def run(self, buffers: List[Any]) -> "InferResult":
+        """Perform synchronous inference with new input data.
+        
+        Args:
+            buffers: The data of each input not using shared memory, in schema order.
+                Numpy arrays or objects exposing a byte buffer (e.g. memoryview).
+            
+        Returns:
+            The inference result.
+        """
+        if len(buffers) != len(self._raw_datatypes):
+            raise ValueError(
+                f"Expected {len(self._raw_datatypes)} input buffers, got {len(buffers)}"
+            )
+        raw_contents = [
+            _raw_bytes_view(buffer, datatype)
+            for buffer, datatype in zip(buffers, self._raw_datatypes)
+        ]
+        response = self._rust_client.model_infer_prepared(self._prepared, raw_contents)
+        return InferResult(response, self._shm_outputs)
+
+
 class TensorMetadata:
     """Represents metadata for a tensor (input or output)."""
 
+    __slots__ = ("_name", "_datatype", "_shape")
+
     def __init__(
             self,
             name: str,
             datatype: str,
-            shape: List[int],
+            shape: Sequence[int],
     ):
         """Initialize tensor metadata.
         
@@ -490,7 +784,7 @@ class TensorMetadata:
         """
         self._name = name
         self._datatype = datatype
-        self._shape = shape
+        self._shape = tuple(shape)
 
     @property
     def name(self) -> str:
@@ -503,9 +797,9 @@ class TensorMetadata:
         return self._datatype
 
     @property
-    def shape(self) -> List[int]:
+    def shape(self) -> Tuple[int, ...]:
         """The shape of the tensor."""
-        return self._shape.copy()
+        return self._shape
 
 
 class ModelMetadata:
@@ -517,32 +811,18 @@ class ModelMetadata:
         Args:
             metadata: The ModelMetadataResponse from Rust.
         """
+        # TensorMetadata 列表在首次访问 inputs/outputs 时才创建
         self._metadata = metadata
-        self._inputs = [
-            TensorMetadata(
-                name=input.name,
-                datatype=input.datatype,
-                shape=input.shape,
-            )
-            for input in metadata.inputs
-        ]
-        self._outputs = [
-            TensorMetadata(
-                name=output.name,
-                datatype=output.datatype,
-                shape=output.shape,
-            )
-            for output in metadata.outputs
-        ]
 
     @property
     def name(self) -> str:
         """The name of the model."""
         return self._metadata.name
 
-    @property
+    @cached_property
     def versions(self) -> str:
         """The versions of the model."""
+        # 响应对象不会再被修改，拼接结果可以缓存；versions getter 每次访问都会克隆列表
         return ",".join(self._metadata.versions)
 
     @property
@@ -550,25 +830,41 @@ class ModelMetadata:
         """The platform of the model."""
         return self._metadata.platform
 
-    @property
+    @cached_property
     def inputs(self) -> List[TensorMetadata]:
         """The input specifications of the model."""
-        return self._inputs
+        return [
+            TensorMetadata(
+                name=input.name,
+                datatype=input.datatype,
+                shape=input.shape,
+            )
+            for input in self._metadata.inputs
+        ]
 
-    @property
+    @cached_property
     def outputs(self) -> List[TensorMetadata]:
         """The output specifications of the model."""
-        return self._outputs
+        return [
+            TensorMetadata(
+                name=output.name,
+                datatype=output.datatype,
+                shape=output.shape,
+            )
+            for output in self._metadata.outputs
+        ]
 
 
 class TensorConfig:
     """Represents configuration for a tensor (input or output)."""
 
+    __slots__ = ("_name", "_datatype", "_shape")
+
     def __init__(
             self,
             name: str,
             datatype: str,
-            shape: List[int],
+            shape: Sequence[int],
     ):
         """Initialize tensor configuration.
         
@@ -579,7 +875,7 @@ class TensorConfig:
         """
         self._name = name
         self._datatype = datatype
-        self._shape = shape
+        self._shape = tuple(shape)
 
     @property
     def name(self) -> str:
@@ -592,9 +888,9 @@ class TensorConfig:
         return self._datatype
 
     @property
-    def shape(self) -> List[int]:
+    def shape(self) -> Tuple[int, ...]:
         """The shape of the tensor."""
-        return self._shape.copy()
+        return self._shape
 
 
 class ModelConfig:
@@ -606,23 +902,8 @@ class ModelConfig:
         Args:
             config: The ModelConfig from Rust.
         """
+        # TensorConfig 列表在首次访问 input/output 时才创建
         self._config = config
-        self._inputs = [
-            TensorConfig(
-                name=input.name,
-                datatype=input.datatype,
-                shape=input.shape,
-            )
-            for input in config.input
-        ]
-        self._outputs = [
-            TensorConfig(
-                name=output.name,
-                datatype=output.datatype,
-                shape=output.shape,
-            )
-            for output in config.output
-        ]
 
     @property
     def name(self) -> str:
@@ -639,15 +920,29 @@ class ModelConfig:
         """The maximum batch size for the model."""
         return self._config.max_batch_size
 
-    @property
+    @cached_property
     def input(self) -> List[TensorConfig]:
         """The input specifications of the model."""
-        return self._inputs
+        return [
+            TensorConfig(
+                name=input.name,
+                datatype=input.datatype,
+                shape=input.shape,
+            )
+            for input in self._config.input
+        ]
 
-    @property
+    @cached_property
     def output(self) -> List[TensorConfig]:
         """The output specifications of the model."""
-        return self._outputs
+        return [
+            TensorConfig(
+                name=output.name,
+                datatype=output.datatype,
+                shape=output.shape,
+            )
+            for output in self._config.output
+        ]
 
     @property
     def parameters(self) -> Dict[str, Any]:
@@ -674,17 +969,111 @@ class ModelConfigResponse:
         return self._config
 
 
+@lru_cache(maxsize=None)
+def _message_fields(cls: type) -> Tuple[str, ...]:
+    """返回 Rust 消息类型的字段名（get_all 生成的 getset descriptor），按类型缓存."""
+    fields: List[str] = []
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if not isinstance(attr, (types.GetSetDescriptorType, property)):
+                continue
+            if not name.startswith("_") and name not in fields:
+                fields.append(name)
+    return tuple(fields)
+
+
+def _json_value(value: Any) -> Any:
+    """将字段值转换为 JSON 风格的值，嵌套消息包装为 JsonView."""
+    if isinstance(value, list):
+        return [_json_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _json_value(item) for key, item in value.items()}
+    if type(value).__module__ == "triton_client":
+        return JsonView(value)
+    return value
+
+
+def _json_plain(value: Any) -> Any:
+    """递归地将 JsonView 展开为普通 dict."""
+    if isinstance(value, JsonView):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_json_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _json_plain(item) for key, item in value.items()}
+    return value
+
+
+class JsonView(Mapping):
+    """Read-only json-style view of a protobuf message, returned for as_json=True.
+    
+    Fields are read from the message and converted only when accessed, and cached
+    afterwards; nested messages are returned as JsonView as well. Use to_dict() to
+    get a plain dict (e.g. for json.dumps).
+    """
+
+    def __init__(self, message: Any):
+        """Initialize the view.
+        
+        Args:
+            message: The protobuf message from Rust.
+        """
+        self._message = message
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if key not in _message_fields(type(self._message)):
+            raise KeyError(key)
+        value = _json_value(getattr(self._message, key))
+        self._cache[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_message_fields(type(self._message)))
+
+    def __len__(self) -> int:
+        return len(_message_fields(type(self._message)))
+
+    def __repr__(self) -> str:
+        return f"JsonView({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the whole message to a plain dict.
+        
+        Returns:
+            The message as nested dicts and lists.
+        """
+        return {key: _json_plain(self[key]) for key in self}
+
+
 class CallContext:
     """Context for asynchronous inference calls."""
 
-    def __init__(self, future):
+    __slots__ = ("_request_id", "_cancel_fn")
+
+    def __init__(self, request_id: str, cancel_fn: Callable[[str], None]):
         """Initialize call context.
         
         Args:
-            future: The future object from ThreadPoolExecutor.
+            request_id: The id of the in-flight request.
+            cancel_fn: Function that drops the pending callback for the given id.
         """
-        self._future = future
+        self._request_id = request_id
+        self._cancel_fn = cancel_fn
+
+    @property
+    def request_id(self) -> str:
+        """The id of the in-flight request."""
+        return self._request_id
 
     def cancel(self) -> None:
-        """Cancel the ongoing inference request."""
-        self._future.cancel()
+        """Cancel the ongoing inference request.
+        
+        The request has already been sent on the stream; its response is discarded
+        and the callback will not be invoked.
+        """
+        self._cancel_fn(self._request_id)
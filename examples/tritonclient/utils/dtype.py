@@ -1,24 +1,30 @@
 """Data type conversion utilities."""
 
+import types
 import numpy as np
-from typing import Dict
+from typing import Mapping
 
 # Triton 数据类型到 NumPy 数据类型的映射
-_TRITON_TO_NP_DTYPE: Dict[str, np.dtype] = {
-    "BOOL": np.bool_,
-    "INT8": np.int8,
-    "INT16": np.int16,
-    "INT32": np.int32,
-    "INT64": np.int64,
-    "UINT8": np.uint8,
-    "UINT16": np.uint16,
-    "UINT32": np.uint32,
-    "UINT64": np.uint64,
-    "FP16": np.float16,
-    "FP32": np.float32,
-    "FP64": np.float64,
-    "BYTES": np.object_,
-}
+# 值为 np.dtype 实例（而不是标量类型），同时包含大写和小写的 key，常见写法无需 upper()
+_TRITON_TO_NP_DTYPE: Mapping[str, np.dtype] = types.MappingProxyType({
+    key: np.dtype(value)
+    for name, value in {
+        "BOOL": np.bool_,
+        "INT8": np.int8,
+        "INT16": np.int16,
+        "INT32": np.int32,
+        "INT64": np.int64,
+        "UINT8": np.uint8,
+        "UINT16": np.uint16,
+        "UINT32": np.uint32,
+        "UINT64": np.uint64,
+        "FP16": np.float16,
+        "FP32": np.float32,
+        "FP64": np.float64,
+        "BYTES": np.object_,
+    }.items()
+    for key in (name, name.lower())
+})
 
 
 def triton_to_np_dtype(datatype: str) -> np.dtype:
@@ -33,8 +39,12 @@ def triton_to_np_dtype(datatype: str) -> np.dtype:
     Raises:
         ValueError: If the datatype is not supported.
     """
+    try:
+        return _TRITON_TO_NP_DTYPE[datatype]
+    except KeyError:
+        pass
+    # 大小写混合的写法走慢路径
     dtype = _TRITON_TO_NP_DTYPE.get(datatype.upper())
     if dtype is None:
         raise ValueError(f"Unsupported Triton data type: {datatype}")
     return dtype
-
@@ -1,21 +1,98 @@
 """Shared memory utilities for Triton client."""
 
+import atexit
+import itertools
+import math
+import mmap
 import multiprocessing.shared_memory as shm
+from multiprocessing import resource_tracker
+import os
+import platform
+import struct
+import sys
+import threading
+import weakref
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Rust 扩展提供的批量拷贝，一次调用写入所有连续数组
+    from triton_client import write_buffers as _write_buffers
+except ImportError:
+    _write_buffers = None
+
+try:
+    # acquire/release 语义的 u64 读写，用于跨进程发布 SharedMemoryRing 的计数
+    from triton_client import atomic_load_u64 as _atomic_load_u64
+    from triton_client import atomic_store_u64 as _atomic_store_u64
+except ImportError:
+    _atomic_load_u64 = None
+    _atomic_store_u64 = None
+
+# 当前进程中已映射的共享内存区域句柄，句柄被回收后自动移除；
+# 同一个 shm_key 可能被多个句柄映射，因此按句柄而不是按 key 登记
+_REGISTRY: "weakref.WeakSet[SharedMemoryRegion]" = weakref.WeakSet()
+_REGISTRY_LOCK = threading.Lock()
+
+# 为 False 时自己创建的区域在创建后立即从 multiprocessing 的 resource_tracker 取消登记：
+# 不再有 "leaked shared_memory" 警告，代价是进程异常退出时区域不会被自动删除，需要调用方自行清理
+SHM_USE_RESOURCE_TRACKER = True
+
+# 只有 POSIX 平台的 SharedMemory 会登记到 resource_tracker
+_TRACKER_ENABLED = os.name == "posix"
+
+# 自动生成 key 时使用的进程内计数器
+_next_id = itertools.count()
+
+
+def _make_shm_key(prefix: str = "tc") -> str:
+    """生成短 key：前缀 + 十六进制 pid + 十六进制计数，比 uuid 短得多且在本机唯一."""
+    return f"/{prefix}{os.getpid():x}_{next(_next_id):x}"
+
+
+def _tracked_in_process(shm_key: str) -> bool:
+    """当前进程中是否有已映射、且仍登记在 resource_tracker 中的创建方句柄."""
+    with _REGISTRY_LOCK:
+        return any(region._tracked and region._shm_key == shm_key for region in _REGISTRY)
+
+
+# 不小于该大小的区域额外请求透明大页，降低首次写入时的缺页和 TLB 开销
+_HUGEPAGE_MIN_BYTES = 2 << 20
+
+# Linux 的 MADV_POPULATE_WRITE，Python 的 mmap 模块没有导出该常量
+_MADV_POPULATE_WRITE = 23
+
 
 class SharedMemoryException(Exception):
     """Exception type for shared memory related errors."""
     pass
 
 
+# SharedMemoryRegion 的状态：未映射、已映射他人创建的区域、已映射自己创建的区域
+_STATE_DETACHED = 0
+_STATE_ATTACHED = 1
+_STATE_CREATED = 2
+
+
 class SharedMemoryRegion:
     """Handle for a system shared memory region."""
     
+    # 池中可能有大量句柄，使用 __slots__ 去掉实例 __dict__；__weakref__ 供 _REGISTRY 使用
+    __slots__ = (
+        "_triton_shm_name",
+        "_shm_key",
+        "_byte_size",
+        "_shm",
+        "_state",
+        "_tracked",
+        "_buf",
+        "_np_buf",
+        "__weakref__",
+    )
+    
     def __init__(self, triton_shm_name: str, shm_key: str, byte_size: int):
         """Initialize a shared memory region handle.
         
@@ -28,7 +105,12 @@ class SharedMemoryRegion:
         self._shm_key = shm_key
         self._byte_size = byte_size
         self._shm: Optional[shm.SharedMemory] = None
-        self._created = False
+        self._state = _STATE_DETACHED
+        # 是否仍登记在 resource_tracker 中，决定 unlink() 时是否需要通知它
+        self._tracked = False
+        # 缓存 buffer 及其 uint8 视图，读写时不再经过 SharedMemory.buf 的属性查找
+        self._buf: Optional[memoryview] = None
+        self._np_buf: Optional[np.ndarray] = None
     
     @property
     def name(self) -> str:
@@ -45,8 +127,13 @@ class SharedMemoryRegion:
         """Get the size in bytes."""
         return self._byte_size
     
-    def create(self) -> None:
-        """Create a new shared memory region."""
+    def create(self, prefault: bool = False) -> None:
+        """Create a new shared memory region.
+        
+        Args:
+            prefault: If True, populate every page of the region up front so the first
+                write of each page does not take a page fault. Default is False.
+        """
         if self._shm is not None:
             return
         
@@ -56,8 +143,16 @@ class SharedMemoryRegion:
                 size=self._byte_size,
                 name=self._shm_key
             )
-            self._created = True
-            logger.debug(f"Created shared memory: {self._shm_key}, size: {self._byte_size}")
+            self._state = _STATE_CREATED
+            self._tracked = _TRACKER_ENABLED
+            if self._tracked and not SHM_USE_RESOURCE_TRACKER:
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+                self._tracked = False
+            self._cache_buffer()
+            self._advise()
+            if prefault:
+                self._prefault()
+            logger.debug("Created shared memory: %s, size: %d", self._shm_key, self._byte_size)
         except FileExistsError:
             raise SharedMemoryException(f"Shared memory region already exists: {self._shm_key}")
     
@@ -68,25 +163,100 @@ class SharedMemoryRegion:
         
         try:
             self._shm = shm.SharedMemory(name=self._shm_key)
-            self._created = False
-            logger.debug(f"Attached to shared memory: {self._shm_key}")
+            self._state = _STATE_ATTACHED
+            if _TRACKER_ENABLED and not _tracked_in_process(self._shm_key):
+                # Python 3.12 打开已有区域时也会登记，进程退出时 resource_tracker 会删除
+                # 其他进程创建的区域；区域归创建方所有，附加方总是取消登记。
+                # 同一进程中的创建方与附加方共用一条登记，此时保留给创建方
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+            self._cache_buffer()
+            self._advise()
+            logger.debug("Attached to shared memory: %s", self._shm_key)
         except FileNotFoundError:
             raise SharedMemoryException(f"Shared memory region not found: {self._shm_key}")
     
+    def _advise(self) -> None:
+        """提示内核该映射按顺序访问，较大的区域同时请求透明大页（仅 Linux 等支持 madvise 的平台）."""
+        mapping = getattr(self._shm, "_mmap", None)
+        if mapping is None or not hasattr(mapping, "madvise"):
+            return
+        advices = [getattr(mmap, "MADV_SEQUENTIAL", None)]
+        if self._byte_size >= _HUGEPAGE_MIN_BYTES:
+            advices.append(getattr(mmap, "MADV_HUGEPAGE", None))
+        for advice in advices:
+            if advice is None:
+                continue
+            try:
+                mapping.madvise(advice)
+            except OSError as e:
+                # 只是性能提示，内核不支持时忽略
+                logger.debug("madvise(%s) failed for %s: %s", advice, self._shm_key, e)
+    
+    def _prefault(self) -> None:
+        """预先分配区域的所有物理页，只能用于新创建（全零）的区域."""
+        mapping = getattr(self._shm, "_mmap", None)
+        if sys.platform == "linux" and mapping is not None and hasattr(mapping, "madvise"):
+            # MADV_POPULATE_WRITE（Linux 5.14+）由内核一次性完成；mmap 模块不导出该常量，
+            # 更早的内核会以 EINVAL 拒绝，此时才回退为逐页写入
+            try:
+                mapping.madvise(_MADV_POPULATE_WRITE)
+                return
+            except (OSError, ValueError) as e:
+                logger.debug("MADV_POPULATE_WRITE failed for %s: %s", self._shm_key, e)
+        self._touch_pages()
+    
+    def _touch_pages(self) -> None:
+        """每页写入一个字节；新区域内容全为 0，写 0 不会改变数据."""
+        self._np_buf[::mmap.PAGESIZE] = 0
+    
+    def _cache_buffer(self) -> None:
+        """缓存共享内存的 memoryview 和 uint8 数组视图，并登记为已映射."""
+        self._buf = self._shm.buf
+        self._np_buf = np.frombuffer(self._buf, dtype=np.uint8)
+        with _REGISTRY_LOCK:
+            _REGISTRY.add(self)
+    
+    def _release_buffer(self) -> None:
+        """释放缓存的视图，否则 SharedMemory.close() 会因存在导出的 buffer 而失败."""
+        self._np_buf = None
+        self._buf = None
+        with _REGISTRY_LOCK:
+            _REGISTRY.discard(self)
+    
     def close(self) -> None:
         """Close the shared memory region (but don't delete it)."""
         if self._shm:
-            self._shm.close()
+            self._release_buffer()
+            try:
+                self._shm.close()
+            except BufferError as e:
+                # 仍有外部视图（as_ndarray、copy=False 的结果等）引用共享内存，映射没有关闭；
+                # SharedMemory.close() 此时已释放自己的 memoryview，重新建立后恢复缓存使句柄保持可用
+                if self._shm._buf is None:
+                    self._shm._buf = memoryview(self._shm._mmap)
+                self._cache_buffer()
+                raise SharedMemoryException(
+                    f"Cannot close shared memory region while views of it are alive: {self._shm_key}"
+                ) from e
             self._shm = None
-            logger.debug(f"Closed shared memory: {self._shm_key}")
+            self._state = _STATE_DETACHED
+            logger.debug("Closed shared memory: %s", self._shm_key)
     
     def unlink(self) -> None:
         """Delete the shared memory region."""
         if self._shm:
-            if self._created:
-                self._shm.unlink()
-                logger.debug(f"Unlinked shared memory: {self._shm_key}")
+            if self._state == _STATE_CREATED:
+                if self._tracked or not _TRACKER_ENABLED:
+                    self._shm.unlink()
+                else:
+                    # SharedMemory.unlink() 会向 resource_tracker 取消登记，未登记的区域直接删除
+                    import _posixshmem
+                    _posixshmem.shm_unlink(self._shm._name)
+                logger.debug("Unlinked shared memory: %s", self._shm_key)
+            self._release_buffer()
             self._shm = None
+            self._state = _STATE_DETACHED
+            self._tracked = False
     
     def get_buffer(self) -> memoryview:
         """Get a memoryview of the shared memory buffer.
@@ -94,9 +264,498 @@ class SharedMemoryRegion:
         Returns:
             A memoryview of the shared memory buffer.
         """
-        if self._shm is None:
+        if self._buf is None:
+            raise SharedMemoryException("Shared memory region not attached")
+        return self._buf
+    
+    def as_ndarray(
+        self,
+        dtype: np.dtype,
+        shape: List[int] | Tuple[int, ...],
+        offset: int = 0,
+    ) -> np.ndarray:
+        """Get a writable numpy array backed directly by the shared memory region.
+        
+        Producers can fill the returned array in place instead of building a private
+        array and copying it in with set_shared_memory_region().
+        
+        Args:
+            dtype: The data type of the array.
+            shape: The shape of the array.
+            offset: The offset, in bytes, into the region where the array starts. Default is 0.
+            
+        Returns:
+            A numpy array view of the shared memory region. The view must be released
+            before the region is closed.
+            
+        Raises:
+            ValueError: If offset is negative.
+            SharedMemoryException: If the shared memory region is not attached or is too small.
+        """
+        if offset < 0:
+            raise ValueError(f"offset must be non-negative, got {offset}")
+        if self._np_buf is None:
             raise SharedMemoryException("Shared memory region not attached")
-        return self._shm.buf
+        dtype = np.dtype(dtype)
+        total_size = dtype.itemsize * math.prod(shape)
+        if offset + total_size > self._byte_size:
+            raise SharedMemoryException(
+                f"Not enough space in shared memory region. "
+                f"Required: {offset + total_size}, Available: {self._byte_size}"
+            )
+        return self._np_buf[offset:offset + total_size].view(dtype).reshape(shape)
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+# arena 分配的块大小档位；超过最大档位的请求按 alignment 取整后以精确大小分配
+_ARENA_BUCKETS = (64, 128, 256, 512, 1024, 4096, 16384, 65536)
+# 空闲块的前 8 字节保存链表中下一个空闲块的偏移，-1 表示链表结束
+_FREE_LINK = struct.Struct("<q")
+
+
+class SharedMemorySlice:
+    """A byte range sub-allocated from a SharedMemoryArena.
+    
+    Slices can be passed to set_shared_memory_region() and get_contents_as_numpy() in place
+    of a SharedMemoryRegion; offsets given to those functions are relative to the slice.
+    """
+    
+    __slots__ = ("_arena", "_offset", "_byte_size")
+    
+    def __init__(self, arena: "SharedMemoryArena", offset: int, byte_size: int):
+        """Initialize a slice handle.
+        
+        Args:
+            arena: The arena the slice belongs to.
+            offset: The offset, in bytes, of the slice in the arena.
+            byte_size: The size in bytes of the slice.
+        """
+        self._arena = arena
+        self._offset = offset
+        self._byte_size = byte_size
+    
+    @property
+    def name(self) -> str:
+        """Get the Triton shared memory region name of the arena."""
+        return self._arena.name
+    
+    @property
+    def key(self) -> str:
+        """Get the shared memory key of the arena."""
+        return self._arena.key
+    
+    @property
+    def offset(self) -> int:
+        """Get the offset, in bytes, of the slice in the arena."""
+        return self._offset
+    
+    @property
+    def byte_size(self) -> int:
+        """Get the size in bytes."""
+        return self._byte_size
+    
+    # 以下属性供 set_shared_memory_region/get_contents_as_numpy 使用；每次按需切片，
+    # 不在句柄上保留视图，arena 关闭时不会因残留的导出 buffer 而失败
+    @property
+    def _shm(self) -> Optional[shm.SharedMemory]:
+        return self._arena._region._shm
+    
+    @property
+    def _np_buf(self) -> Optional[np.ndarray]:
+        np_buf = self._arena._region._np_buf
+        if np_buf is None:
+            return None
+        return np_buf[self._offset:self._offset + self._byte_size]
+    
+    @property
+    def _buf(self) -> Optional[memoryview]:
+        buf = self._arena._region._buf
+        if buf is None:
+            return None
+        return buf[self._offset:self._offset + self._byte_size]
+    
+    def get_buffer(self) -> memoryview:
+        """Get a memoryview of the slice.
+        
+        Returns:
+            A memoryview of the slice's bytes in the arena.
+        """
+        buf = self._buf
+        if buf is None:
+            raise SharedMemoryException("Shared memory region not attached")
+        return buf
+    
+    def as_ndarray(
+        self,
+        dtype: np.dtype,
+        shape: List[int] | Tuple[int, ...],
+        offset: int = 0,
+    ) -> np.ndarray:
+        """Get a writable numpy array backed directly by the slice.
+        
+        Args:
+            dtype: The data type of the array.
+            shape: The shape of the array.
+            offset: The offset, in bytes, into the slice where the array starts. Default is 0.
+            
+        Returns:
+            A numpy array view of the slice.
+            
+        Raises:
+            ValueError: If offset is negative.
+            SharedMemoryException: If the arena is not attached or the slice is too small.
+        """
+        if offset < 0:
+            raise ValueError(f"offset must be non-negative, got {offset}")
+        dtype = np.dtype(dtype)
+        total_size = dtype.itemsize * math.prod(shape)
+        if offset + total_size > self._byte_size:
+            raise SharedMemoryException(
+                f"Not enough space in shared memory slice. "
+                f"Required: {offset + total_size}, Available: {self._byte_size}"
+            )
+        return self._arena._region.as_ndarray(dtype, shape, self._offset + offset)
+
+
+class SharedMemoryArena:
+    """One system shared memory region carved into request-scoped slices.
+    
+    alloc() hands out byte ranges from a bump pointer and reset() frees all of them at
+    once, so many small tensors share a single shm_open/ftruncate/mmap and a single
+    server-side registration. Sizes are rounded up to fixed buckets, and slices given
+    back with free() are kept on per-bucket free lists for reuse by later alloc() calls.
+    """
+    
+    def __init__(
+        self,
+        total_size: int,
+        triton_shm_name: Optional[str] = None,
+        shm_key: Optional[str] = None,
+        alignment: int = 64,
+        prefault: bool = False,
+    ):
+        """Create the arena's backing shared memory region.
+        
+        Args:
+            total_size: The size in bytes of the arena.
+            triton_shm_name: The unique name of the region for Triton (optional, derived from the key).
+            shm_key: The unique key of the shared memory object (optional, generated if not given).
+            alignment: Each slice starts at a multiple of this many bytes. Default is 64.
+            prefault: Whether to populate the pages of the region up front. Default is False.
+        """
+        if shm_key is None:
+            shm_key = _make_shm_key("ta")
+        if triton_shm_name is None:
+            triton_shm_name = shm_key[1:]
+        self._region = create_shared_memory_region(
+            triton_shm_name, shm_key, total_size, create_only=True, prefault=prefault
+        )
+        self._alignment = alignment
+        self._top = 0
+        # 块大小 -> 空闲链表头部的偏移；链表通过空闲块自身的内存串联，不需要额外的元数据
+        self._free_lists: Dict[int, int] = {}
+        # 已分配且尚未释放的块：偏移 -> 块大小，用于拒绝重复释放和非本 arena 分配的偏移
+        self._live: Dict[int, int] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def name(self) -> str:
+        """Get the Triton shared memory region name."""
+        return self._region.name
+    
+    @property
+    def key(self) -> str:
+        """Get the shared memory key."""
+        return self._region.key
+    
+    @property
+    def byte_size(self) -> int:
+        """Get the size in bytes."""
+        return self._region.byte_size
+    
+    @property
+    def used(self) -> int:
+        """Get the number of bytes allocated since the last reset(), including padding."""
+        return self._top
+    
+    @property
+    def region(self) -> SharedMemoryRegion:
+        """Get the backing shared memory region."""
+        return self._region
+    
+    def _block_size(self, nbytes: int) -> int:
+        """返回 nbytes 所属档位的块大小."""
+        for bucket in _ARENA_BUCKETS:
+            if nbytes <= bucket:
+                return bucket
+        return -(-nbytes // self._alignment) * self._alignment
+    
+    def _check_attached(self) -> None:
+        """close()/destroy() 之后空闲链表所在的内存已不可访问."""
+        if self._region._buf is None:
+            raise SharedMemoryException("Shared memory arena not attached")
+    
+    def alloc(self, nbytes: int) -> SharedMemorySlice:
+        """Allocate a slice of nbytes bytes.
+        
+        Args:
+            nbytes: The size in bytes of the slice.
+            
+        Returns:
+            A handle to the slice. Its offset is the value to pass to the server as the
+            shared memory offset of the tensor.
+            
+        Raises:
+            SharedMemoryException: If the arena is closed or does not have enough free space.
+        """
+        block = self._block_size(nbytes)
+        with self._lock:
+            self._check_attached()
+            head = self._free_lists.get(block, -1)
+            if head >= 0:
+                # 复用同档位的空闲块，下一个空闲块的偏移从块的前 8 字节读出
+                self._free_lists[block] = _FREE_LINK.unpack_from(self._region._buf, head)[0]
+                self._live[head] = block
+                return SharedMemorySlice(self, head, nbytes)
+            # 起始位置向上取整到 alignment 的整数倍
+            start = -(-self._top // self._alignment) * self._alignment
+            if start + block > self._region.byte_size:
+                raise SharedMemoryException(
+                    f"Not enough space in shared memory arena. "
+                    f"Required: {start + block}, Available: {self._region.byte_size}"
+                )
+            self._top = start + block
+            self._live[start] = block
+        return SharedMemorySlice(self, start, nbytes)
+    
+    def free(self, shm_slice: SharedMemorySlice) -> None:
+        """Give a slice back to the arena so a later alloc() of the same bucket can reuse it.
+        
+        Args:
+            shm_slice: A slice returned by alloc() on this arena since the last reset().
+                It must no longer be used after this call.
+                
+        Raises:
+            SharedMemoryException: If the arena is closed, the slice does not belong to this
+                arena, or is not currently allocated (already freed, or allocated before the
+                last reset()).
+        """
+        if shm_slice._arena is not self:
+            raise SharedMemoryException("Shared memory slice does not belong to this arena")
+        block = self._block_size(shm_slice._byte_size)
+        with self._lock:
+            self._check_attached()
+            if self._live.get(shm_slice._offset) != block:
+                raise SharedMemoryException(
+                    f"Shared memory slice at offset {shm_slice._offset} is not allocated"
+                )
+            del self._live[shm_slice._offset]
+            _FREE_LINK.pack_into(
+                self._region._buf, shm_slice._offset, self._free_lists.get(block, -1)
+            )
+            self._free_lists[block] = shm_slice._offset
+    
+    def reset(self) -> None:
+        """Free all slices at once; slices allocated before the reset must no longer be used."""
+        with self._lock:
+            self._top = 0
+            self._free_lists.clear()
+            self._live.clear()
+    
+    def close(self) -> None:
+        """Close the arena's mapping (but don't delete the region)."""
+        self._region.close()
+    
+    def destroy(self) -> None:
+        """Delete the arena's shared memory region."""
+        mapped = self._region._shm
+        self._region.unlink()
+        if mapped is not None:
+            mapped.close()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.destroy()
+
+
+# 环形队列的控制块：区域开头一个 cache line，保存 head（已消费计数）和 tail（已生产计数）
+_RING_HEADER_BYTES = 64
+# 每个槽位开头保存消息长度
+_RING_LENGTH_BYTES = 8
+# x86 的存储不会与之前的存储重排（TSO），没有 Rust 扩展时普通的对齐 8 字节写即可发布计数；
+# aarch64 等弱内存序平台必须使用扩展提供的 release/acquire 读写
+_TSO_MACHINES = ("x86_64", "amd64", "i386", "i686", "x86")
+
+
+class SharedMemoryRing:
+    """Single-producer/single-consumer ring of fixed-size slots in a shared memory region.
+    
+    The first 64 bytes of the region hold the head and tail counters; each slot holds a
+    length prefix followed by up to slot_size bytes of payload. The producer only writes
+    tail and the consumer only writes head, so no lock is needed. Both sides construct the
+    ring over the same region with the same slot_size and num_slots; the region must be
+    zero-initialized (a newly created region is) before the first push().
+    
+    The counters are published with release stores and read with acquire loads through
+    the triton_client extension. Without the extension the ring only works on x86, whose
+    stores are not reordered.
+    """
+    
+    def __init__(self, region: SharedMemoryRegion, slot_size: int, num_slots: int):
+        """Initialize the ring.
+        
+        Args:
+            region: The attached shared memory region backing the ring.
+            slot_size: The maximum payload size in bytes of one message.
+            num_slots: The number of messages the ring can hold.
+            
+        Raises:
+            SharedMemoryException: If the region is not attached or is too small, or the
+                triton_client extension is unavailable on a non-x86 platform.
+        """
+        if region._np_buf is None:
+            raise SharedMemoryException("Shared memory region not attached")
+        if _atomic_load_u64 is None and platform.machine().lower() not in _TSO_MACHINES:
+            raise SharedMemoryException(
+                f"SharedMemoryRing requires the triton_client extension on {platform.machine()}"
+            )
+        # 槽位按 cache line 对齐，相邻槽位不会共享同一个 cache line
+        stride = -(-(_RING_LENGTH_BYTES + slot_size) // 64) * 64
+        required = _RING_HEADER_BYTES + stride * num_slots
+        if required > region.byte_size:
+            raise SharedMemoryException(
+                f"Not enough space in shared memory region. "
+                f"Required: {required}, Available: {region.byte_size}"
+            )
+        self._region = region
+        self._slot_size = slot_size
+        self._num_slots = num_slots
+        self._stride = stride
+        # head 位于偏移 0，tail 位于偏移 8；8 字节对齐的读写不会被对端看到写了一半的值
+        self._header: Optional[memoryview] = region._buf[:16]
+        self._counters: Optional[np.ndarray] = region._np_buf[:16].view(np.uint64)
+        self._data: Optional[np.ndarray] = region._np_buf[_RING_HEADER_BYTES:required]
+    
+    @property
+    def slot_size(self) -> int:
+        """Get the maximum payload size in bytes of one message."""
+        return self._slot_size
+    
+    @property
+    def num_slots(self) -> int:
+        """Get the number of messages the ring can hold."""
+        return self._num_slots
+    
+    def __len__(self) -> int:
+        """Get the number of messages waiting to be popped."""
+        return self._load(1) - self._load(0)
+    
+    def _load(self, index: int) -> int:
+        """以 acquire 语义读取计数，index 为 0 时读 head，为 1 时读 tail."""
+        if self._header is None:
+            raise SharedMemoryException("Shared memory ring is closed")
+        if _atomic_load_u64 is not None:
+            return _atomic_load_u64(self._header, index * 8)
+        return int(self._counters[index])
+    
+    def _store(self, index: int, value: int) -> None:
+        """以 release 语义写入计数，之前写入的槽位数据对读到该值的对端可见."""
+        if _atomic_store_u64 is not None:
+            _atomic_store_u64(self._header, index * 8, value)
+        else:
+            self._counters[index] = value
+    
+    def push(self, arr: np.ndarray) -> bool:
+        """Append a message; only one thread or process may push to a ring.
+        
+        Args:
+            arr: The array whose bytes form the message.
+            
+        Returns:
+            True if the message was written, False if the ring is full.
+            
+        Raises:
+            SharedMemoryException: If the message is larger than slot_size.
+        """
+        nbytes = arr.nbytes
+        if nbytes > self._slot_size:
+            raise SharedMemoryException(
+                f"Message does not fit in a ring slot. "
+                f"Required: {nbytes}, Available: {self._slot_size}"
+            )
+        tail = self._load(1)
+        if tail - self._load(0) >= self._num_slots:
+            return False
+        start = (tail % self._num_slots) * self._stride
+        slot = self._data[start:start + _RING_LENGTH_BYTES + nbytes]
+        slot[:_RING_LENGTH_BYTES].view(np.uint64)[0] = nbytes
+        np.copyto(
+            slot[_RING_LENGTH_BYTES:],
+            np.ascontiguousarray(arr).reshape(-1).view(np.uint8),
+        )
+        # 数据写完之后再发布 tail，消费者看到新的 tail 时消息已经完整
+        self._store(1, tail + 1)
+        return True
+    
+    def pop(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Remove the oldest message; only one thread or process may pop from a ring.
+        
+        Args:
+            out: A C-contiguous array to copy the message into (optional). Its nbytes must
+                be at least the message size.
+                
+        Returns:
+            None if the ring is empty; otherwise out if given, else a uint8 copy of the
+            message that can be reinterpreted with .view(dtype).
+            
+        Raises:
+            SharedMemoryException: If out is not C-contiguous or is too small for the message,
+                or the slot's length prefix exceeds slot_size.
+        """
+        if out is not None and not out.flags.c_contiguous:
+            # 非连续数组 reshape(-1) 会得到副本，写入的数据会丢失
+            raise SharedMemoryException("Output array must be C-contiguous")
+        head = self._load(0)
+        if head == self._load(1):
+            return None
+        start = (head % self._num_slots) * self._stride
+        nbytes = int(self._data[start:start + _RING_LENGTH_BYTES].view(np.uint64)[0])
+        if nbytes > self._slot_size:
+            # 长度前缀损坏或由不匹配的生产者写入，按它读取会越过槽位读到下一个槽位
+            raise SharedMemoryException(
+                f"Corrupted ring slot: message length {nbytes} exceeds slot size {self._slot_size}"
+            )
+        payload = self._data[start + _RING_LENGTH_BYTES:start + _RING_LENGTH_BYTES + nbytes]
+        if out is None:
+            result = payload.copy()
+        else:
+            if out.nbytes < nbytes:
+                raise SharedMemoryException(
+                    f"Output array is too small for the message. "
+                    f"Required: {nbytes}, Available: {out.nbytes}"
+                )
+            np.copyto(out.reshape(-1).view(np.uint8)[:nbytes], payload)
+            result = out
+        # 拷贝完成后才释放槽位，生产者不会覆盖尚未读取的数据
+        self._store(0, head + 1)
+        return result
+    
+    def close(self) -> None:
+        """Release the ring's views of the region; must be called before the region is closed."""
+        self._header = None
+        self._counters = None
+        self._data = None
     
     def __enter__(self):
         """Context manager entry."""
@@ -109,17 +768,20 @@ class SharedMemoryRegion:
 
 def create_shared_memory_region(
     triton_shm_name: str,
-    shm_key: str,
+    shm_key: Optional[str],
     byte_size: int,
     create_only: bool = False,
+    prefault: bool = False,
 ) -> SharedMemoryRegion:
     """Create a system shared memory region.
     
     Args:
         triton_shm_name: The unique name of the shared memory region to be created.
-        shm_key: The unique key of the shared memory object.
+        shm_key: The unique key of the shared memory object. If None, a short unique key is
+            generated and a new region is always created.
         byte_size: The size in bytes of the shared memory region to be created.
         create_only: Whether a shared memory region must be created. Default is False.
+        prefault: Whether to populate the pages of a newly created region up front. Default is False.
         
     Returns:
         A handle to the shared memory region (SharedMemoryRegion).
@@ -127,30 +789,39 @@ def create_shared_memory_region(
     Raises:
         SharedMemoryException: If the shared memory region cannot be created or attached.
     """
+    if shm_key is None:
+        shm_key = _make_shm_key()
+        create_only = True
     region = SharedMemoryRegion(triton_shm_name, shm_key, byte_size)
     
     if create_only:
-        region.create()
+        region.create(prefault)
     else:
         try:
             region.attach()
         except SharedMemoryException:
-            region.create()
+            region.create(prefault)
     
     return region
 
 
 def set_shared_memory_region(
-    shm_handle: SharedMemoryRegion,
+    shm_handle: SharedMemoryRegion | SharedMemorySlice,
     input_values: List[np.ndarray] | Tuple[np.ndarray, ...],
     offset: int = 0,
-) -> None:
+    alignment: int = 1,
+) -> List[int]:
     """Set the contents of a shared memory region from numpy arrays.
     
     Args:
-        shm_handle: The handle to the shared memory region.
+        shm_handle: The handle to the shared memory region, or a slice of a SharedMemoryArena.
         input_values: The list/tuple of numpy arrays to write to the shared memory region.
         offset: The offset, in bytes, into the region where you want the array copied. Default is 0.
+        alignment: Each array after the first starts at a multiple of this many bytes
+            (e.g. 64 for cache-line aligned tensors). Default is 1 (arrays are packed).
+        
+    Returns:
+        The offset, in bytes, at which each array was written.
         
     Raises:
         SharedMemoryException: If the shared memory region is not attached or there's not enough space.
@@ -158,39 +829,91 @@ def set_shared_memory_region(
     if shm_handle._shm is None:
         raise SharedMemoryException("Shared memory region not attached")
     
+    # 先计算每个数组的写入位置，写入前一次性检查总大小，空间不足时不会留下写了一半的数据
+    input_values = tuple(input_values)
+    offsets = []
     current_offset = offset
-    buffer = shm_handle.get_buffer()
-    
     for arr in input_values:
-        arr_bytes = arr.tobytes()
-        arr_size = len(arr_bytes)
-        
-        if current_offset + arr_size > shm_handle._byte_size:
-            raise SharedMemoryException(
-                f"Not enough space in shared memory region. "
-                f"Required: {current_offset + arr_size}, Available: {shm_handle._byte_size}"
-            )
-        
-        buffer[current_offset:current_offset + arr_size] = arr_bytes
-        current_offset += arr_size
+        offsets.append(current_offset)
+        current_offset += arr.nbytes
+        if alignment > 1:
+            # 下一个数组的起始位置向上取整到 alignment 的整数倍
+            current_offset = -(-current_offset // alignment) * alignment
+    required = offsets[-1] + input_values[-1].nbytes if input_values else offset
+    if required > shm_handle._byte_size:
+        raise SharedMemoryException(
+            f"Not enough space in shared memory region. "
+            f"Required: {required}, Available: {shm_handle._byte_size}"
+        )
+    
+    # 以缓存的 uint8 数组访问共享内存，数据直接从输入数组拷贝进来，不经过 tobytes() 的中间 bytes
+    dst = shm_handle._np_buf
+    
+    if alignment > 1:
+        # 对齐后数组之间有间隙，逐个拷贝
+        for arr, arr_offset in zip(input_values, offsets):
+            dst_view = dst[arr_offset:arr_offset + arr.nbytes].view(arr.dtype)
+            np.copyto(dst_view.reshape(arr.shape), arr, casting="no")
+        return offsets
+    
+    if _write_buffers is not None and all(arr.flags.c_contiguous for arr in input_values):
+        _write_buffers(
+            shm_handle._buf,
+            offset,
+            [arr.reshape(-1).view(np.uint8) for arr in input_values],
+        )
+        return offsets
+    
+    current_offset = offset
+    count = len(input_values)
+    index = 0
+    while index < count:
+        arr = input_values[index]
+        # 相邻的、dtype 相同的 C 连续数组合并为一次 concatenate，减少 Python 层的循环次数
+        end = index + 1
+        if arr.flags.c_contiguous:
+            while (
+                end < count
+                and input_values[end].dtype == arr.dtype
+                and input_values[end].flags.c_contiguous
+            ):
+                end += 1
+        run = input_values[index:end]
+        run_size = sum(item.nbytes for item in run)
+        dst_view = dst[current_offset:current_offset + run_size].view(arr.dtype)
+        if len(run) == 1:
+            # 目标是与输入同形状、同 dtype 的视图：非连续输入也由 numpy 按步长直接拷贝，
+            # 不需要先生成一份连续的临时副本
+            np.copyto(dst_view.reshape(arr.shape), arr, casting="no")
+        else:
+            np.concatenate([item.reshape(-1) for item in run], out=dst_view, casting="no")
+        current_offset += run_size
+        index = end
+    return offsets
 
 
 def get_contents_as_numpy(
-    shm_handle: SharedMemoryRegion,
+    shm_handle: SharedMemoryRegion | SharedMemorySlice,
     datatype: np.dtype,
     shape: List[int] | Tuple[int, ...],
     offset: int = 0,
+    out: Optional[np.ndarray] = None,
+    copy: bool = True,
 ) -> np.ndarray:
     """Get the contents of a shared memory region as a numpy array.
     
     Args:
-        shm_handle: The handle to the shared memory region.
+        shm_handle: The handle to the shared memory region, or a slice of a SharedMemoryArena.
         datatype: The data type of the array.
         shape: The shape of the array.
         offset: The offset, in bytes, into the region where you want the array extracted. Default is 0.
+        out: A preallocated array of the given shape to copy the contents into (optional).
+        copy: If False and out is not given, return a view of the shared memory instead of a
+            copy. The view is only valid while the region stays attached. Default is True.
         
     Returns:
-        A numpy array view of the shared memory region (copy to avoid issues when shared memory is released).
+        out if given, otherwise a copy of the contents, or a view of the shared memory region
+        when copy is False.
         
     Raises:
         SharedMemoryException: If the shared memory region is not attached or there's not enough data.
@@ -198,11 +921,10 @@ def get_contents_as_numpy(
     if shm_handle._shm is None:
         raise SharedMemoryException("Shared memory region not attached")
     
-    element_size = datatype.itemsize
-    total_elements = 1
-    for dim in shape:
-        total_elements *= dim
-    total_size = total_elements * element_size
+    if not isinstance(datatype, np.dtype):
+        # 只有传入标量类型（如 np.float32）时才需要转换
+        datatype = np.dtype(datatype)
+    total_size = datatype.itemsize * math.prod(shape)
     
     if offset + total_size > shm_handle._byte_size:
         raise SharedMemoryException(
@@ -210,11 +932,17 @@ def get_contents_as_numpy(
             f"Required: {offset + total_size}, Available: {shm_handle._byte_size}"
         )
     
-    buffer = shm_handle.get_buffer()
-    arr = np.frombuffer(buffer[offset:offset + total_size], dtype=datatype).reshape(shape)
+    view = shm_handle._np_buf[offset:offset + total_size].view(datatype).reshape(shape)
     
-    # 返回拷贝，避免共享内存被释放后的问题
-    return arr.copy()
+    if out is not None:
+        # 拷贝到调用方复用的数组，不分配新内存
+        np.copyto(out, view)
+        return out
+    if not copy:
+        # 调用方负责在数组使用完之前保持共享内存区域有效
+        return view
+    # 默认返回拷贝，避免共享内存被释放后的问题
+    return view.copy()
 
 
 def destroy_shared_memory_region(shm_handle: SharedMemoryRegion) -> None:
@@ -226,17 +954,120 @@ def destroy_shared_memory_region(shm_handle: SharedMemoryRegion) -> None:
     shm_handle.unlink()
 
 
-def mapped_shared_memory_regions() -> List[str]:
-    """Get information about all mapped shared memory regions.
+# 共享内存区域池：大小按 2 的幂向上取整分桶，释放的区域留待复用，
+# 省去每次请求 shm_open/ftruncate/mmap 以及向服务端重新注册的开销
+_POOL: Dict[int, List[SharedMemoryRegion]] = {}
+# 已借出的区域，按 key 登记；进程退出时与空闲区域一起删除
+_POOL_IN_USE: Dict[str, SharedMemoryRegion] = {}
+_POOL_LOCK = threading.Lock()
+_POOL_MIN_BYTES = 4096
+# 每个桶最多保留的空闲区域数，超过时淘汰最久未使用的区域
+_POOL_MAX_IDLE = 4
+
+
+def _pool_bucket(byte_size: int) -> int:
+    """返回 byte_size 所属的桶大小."""
+    return max(_POOL_MIN_BYTES, 1 << max(byte_size - 1, 0).bit_length())
+
+
+def _discard_pooled_region(region: SharedMemoryRegion) -> None:
+    """删除池中的区域并关闭映射；句柄已被关闭时按 key 重新打开后删除."""
+    # 池不知道区域注册在哪个服务端，无法代为取消注册；服务端残留的注册需要调用方处理
+    logger.warning(
+        "Deleting pooled shared memory region %s (key %s); unregister it from the server "
+        "if it is still registered",
+        region._triton_shm_name,
+        region._shm_key,
+    )
+    mapped = region._shm
+    if mapped is None:
+        try:
+            mapped = shm.SharedMemory(name=region._shm_key)
+        except FileNotFoundError:
+            return
+        mapped.unlink()
+    else:
+        region.unlink()
+    # unlink 只删除名称，映射需要单独关闭
+    mapped.close()
+
+
+def acquire_shared_memory_region(byte_size: int) -> SharedMemoryRegion:
+    """Get a system shared memory region of at least byte_size bytes from the pool.
     
-    Note: This is a simplified implementation. The actual implementation would
-    need to track all created regions, as multiprocessing.shared_memory doesn't
-    provide a way to list all existing regions.
+    Regions returned by release_shared_memory_region() are reused, so a region keeps its
+    name and key across requests and only needs to be registered with the server once.
     
+    Args:
+        byte_size: The minimum size in bytes of the region.
+        
     Returns:
-        The list of mapped system shared memory regions (currently empty as we
-        don't track regions globally).
+        A handle to the shared memory region. Its byte_size may be larger than requested.
+    """
+    bucket = _pool_bucket(byte_size)
+    with _POOL_LOCK:
+        idle = _POOL.get(bucket)
+        region = idle.pop() if idle else None
+    if region is None:
+        key = _make_shm_key("tp")
+        region = create_shared_memory_region(key[1:], key, bucket, create_only=True)
+    with _POOL_LOCK:
+        _POOL_IN_USE[region.key] = region
+    return region
+
+
+def release_shared_memory_region(shm_handle: SharedMemoryRegion) -> None:
+    """Return a region obtained from acquire_shared_memory_region() to the pool.
+    
+    A region that was closed or destroyed while acquired is deleted instead of being
+    returned to the pool. Regions the pool deletes (evicted, or left in the pool at exit)
+    are not unregistered from the server; a warning naming each of them is logged.
+    
+    Args:
+        shm_handle: The handle to the shared memory region.
+        
+    Raises:
+        SharedMemoryException: If the region is not currently acquired from the pool.
     """
-    # TODO: Implement proper tracking of shared memory regions
-    return []
+    with _POOL_LOCK:
+        if _POOL_IN_USE.get(shm_handle.key) is not shm_handle:
+            raise SharedMemoryException(
+                f"Shared memory region is not acquired from the pool: {shm_handle.key}"
+            )
+        del _POOL_IN_USE[shm_handle.key]
+        if shm_handle._state != _STATE_CREATED:
+            # 已关闭的句柄不能再复用
+            evicted = shm_handle
+        else:
+            idle = _POOL.setdefault(shm_handle.byte_size, [])
+            idle.append(shm_handle)
+            evicted = idle.pop(0) if len(idle) > _POOL_MAX_IDLE else None
+    if evicted is not None:
+        _discard_pooled_region(evicted)
+
+
+@atexit.register
+def _drain_pool() -> None:
+    """进程退出时删除池中所有空闲区域，以及尚未归还的区域."""
+    with _POOL_LOCK:
+        regions = [region for idle in _POOL.values() for region in idle]
+        regions.extend(_POOL_IN_USE.values())
+        _POOL.clear()
+        _POOL_IN_USE.clear()
+    for region in regions:
+        try:
+            _discard_pooled_region(region)
+        except (OSError, BufferError) as e:
+            # 单个区域失败（如仍有视图引用）时继续删除其余区域
+            logger.debug("Failed to discard pooled region %s: %s", region._shm_key, e)
+
 
+def mapped_shared_memory_regions() -> List[str]:
+    """Get information about all mapped shared memory regions.
+    
+    Returns:
+        The keys of the system shared memory regions created or attached by this process
+        and not yet closed.
+    """
+    with _REGISTRY_LOCK:
+        return list(dict.fromkeys(region._shm_key for region in _REGISTRY))
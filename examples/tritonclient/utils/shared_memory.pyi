@@ -5,33 +5,218 @@ import numpy as np
 
 __all__ = [
     "SharedMemoryRegion",
+    "SharedMemorySlice",
+    "SharedMemoryArena",
+    "SharedMemoryRing",
     "create_shared_memory_region",
     "set_shared_memory_region",
     "get_contents_as_numpy",
     "destroy_shared_memory_region",
     "mapped_shared_memory_regions",
+    "acquire_shared_memory_region",
+    "release_shared_memory_region",
     "SharedMemoryException",
 ]
 
+SHM_USE_RESOURCE_TRACKER: bool
+
 
 class SharedMemoryRegion:
     """Handle for a system shared memory region."""
-    ...
+    
+    def as_ndarray(
+        self,
+        dtype: np.dtype,
+        shape: list[int] | tuple[int, ...],
+        offset: int = 0,
+    ) -> np.ndarray:
+        """Get a writable numpy array backed directly by the shared memory region.
+        
+        Args:
+            dtype: The data type of the array.
+            shape: The shape of the array.
+            offset: The offset, in bytes, into the region where the array starts. Default is 0.
+            
+        Returns:
+            A numpy array view of the shared memory region. The view must be released
+            before the region is closed.
+            
+        Raises:
+            ValueError: If offset is negative.
+            SharedMemoryException: If the shared memory region is not attached or is too small.
+        """
+        ...
+
+
+class SharedMemorySlice:
+    """A byte range sub-allocated from a SharedMemoryArena."""
+    
+    @property
+    def name(self) -> str:
+        """Get the Triton shared memory region name of the arena."""
+        ...
+    
+    @property
+    def key(self) -> str:
+        """Get the shared memory key of the arena."""
+        ...
+    
+    @property
+    def offset(self) -> int:
+        """Get the offset, in bytes, of the slice in the arena."""
+        ...
+    
+    @property
+    def byte_size(self) -> int:
+        """Get the size in bytes."""
+        ...
+    
+    def get_buffer(self) -> memoryview:
+        """Get a memoryview of the slice."""
+        ...
+    
+    def as_ndarray(
+        self,
+        dtype: np.dtype,
+        shape: list[int] | tuple[int, ...],
+        offset: int = 0,
+    ) -> np.ndarray:
+        """Get a writable numpy array backed directly by the slice."""
+        ...
+
+
+class SharedMemoryArena:
+    """One system shared memory region carved into request-scoped slices."""
+    
+    def __init__(
+        self,
+        total_size: int,
+        triton_shm_name: str | None = None,
+        shm_key: str | None = None,
+        alignment: int = 64,
+        prefault: bool = False,
+    ) -> None:
+        """Create the arena's backing shared memory region.
+        
+        Args:
+            total_size: The size in bytes of the arena.
+            triton_shm_name: The unique name of the region for Triton (optional, derived from the key).
+            shm_key: The unique key of the shared memory object (optional, generated if not given).
+            alignment: Each slice starts at a multiple of this many bytes. Default is 64.
+            prefault: Whether to populate the pages of the region up front. Default is False.
+        """
+        ...
+    
+    @property
+    def name(self) -> str: ...
+    @property
+    def key(self) -> str: ...
+    @property
+    def byte_size(self) -> int: ...
+    @property
+    def used(self) -> int: ...
+    @property
+    def region(self) -> SharedMemoryRegion: ...
+    
+    def alloc(self, nbytes: int) -> SharedMemorySlice:
+        """Allocate a slice of nbytes bytes.
+        
+        Raises:
+            SharedMemoryException: If the arena is closed or does not have enough free space.
+        """
+        ...
+    
+    def free(self, shm_slice: SharedMemorySlice) -> None:
+        """Give a slice back to the arena so a later alloc() of the same bucket can reuse it.
+        
+        Raises:
+            SharedMemoryException: If the arena is closed, the slice does not belong to this
+                arena, or is not currently allocated (already freed, or allocated before the
+                last reset()).
+        """
+        ...
+    
+    def reset(self) -> None:
+        """Free all slices at once; slices allocated before the reset must no longer be used."""
+        ...
+    
+    def close(self) -> None:
+        """Close the arena's mapping (but don't delete the region)."""
+        ...
+    
+    def destroy(self) -> None:
+        """Delete the arena's shared memory region."""
+        ...
+    
+    def __enter__(self) -> "SharedMemoryArena": ...
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
+
+
+class SharedMemoryRing:
+    """Single-producer/single-consumer ring of fixed-size slots in a shared memory region.
+    
+    The counters are published with release stores and read with acquire loads through
+    the triton_client extension. Without the extension the ring only works on x86.
+    """
+    
+    def __init__(self, region: SharedMemoryRegion, slot_size: int, num_slots: int) -> None:
+        """Initialize the ring.
+        
+        Args:
+            region: The attached shared memory region backing the ring.
+            slot_size: The maximum payload size in bytes of one message.
+            num_slots: The number of messages the ring can hold.
+            
+        Raises:
+            SharedMemoryException: If the region is not attached or is too small, or the
+                triton_client extension is unavailable on a non-x86 platform.
+        """
+        ...
+    
+    @property
+    def slot_size(self) -> int: ...
+    @property
+    def num_slots(self) -> int: ...
+    
+    def __len__(self) -> int: ...
+    
+    def push(self, arr: np.ndarray) -> bool:
+        """Append a message; returns False if the ring is full."""
+        ...
+    
+    def pop(self, out: np.ndarray | None = None) -> np.ndarray | None:
+        """Remove the oldest message; returns None if the ring is empty.
+        
+        Raises:
+            SharedMemoryException: If out is not C-contiguous or is too small for the message,
+                or the slot's length prefix exceeds slot_size.
+        """
+        ...
+    
+    def close(self) -> None:
+        """Release the ring's views of the region; must be called before the region is closed."""
+        ...
+    
+    def __enter__(self) -> "SharedMemoryRing": ...
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
 
 
 def create_shared_memory_region(
     triton_shm_name: str,
-    shm_key: str,
+    shm_key: str | None,
     byte_size: int,
     create_only: bool = False,
+    prefault: bool = False,
 ) -> SharedMemoryRegion:
     """Create a system shared memory region.
     
     Args:
         triton_shm_name: The unique name of the shared memory region to be created.
-        shm_key: The unique key of the shared memory object.
+        shm_key: The unique key of the shared memory object. If None, a short unique key is
+            generated and a new region is always created.
         byte_size: The size in bytes of the shared memory region to be created.
         create_only: Whether a shared memory region must be created. Default is False.
+        prefault: Whether to populate the pages of a newly created region up front. Default is False.
         
     Returns:
         A handle to the shared memory region (SharedMemoryRegion).
@@ -40,36 +225,48 @@ def create_shared_memory_region(
 
 
 def set_shared_memory_region(
-    shm_handle: SharedMemoryRegion,
+    shm_handle: SharedMemoryRegion | SharedMemorySlice,
     input_values: list[np.ndarray] | tuple[np.ndarray, ...],
     offset: int = 0,
-) -> None:
+    alignment: int = 1,
+) -> list[int]:
     """Set the contents of a shared memory region from numpy arrays.
     
     Args:
-        shm_handle: The handle to the shared memory region.
+        shm_handle: The handle to the shared memory region, or a slice of a SharedMemoryArena.
         input_values: The list/tuple of numpy arrays to write to the shared memory region.
         offset: The offset, in bytes, into the region where you want the array copied. Default is 0.
+        alignment: Each array after the first starts at a multiple of this many bytes
+            (e.g. 64 for cache-line aligned tensors). Default is 1 (arrays are packed).
+        
+    Returns:
+        The offset, in bytes, at which each array was written.
     """
     ...
 
 
 def get_contents_as_numpy(
-    shm_handle: SharedMemoryRegion,
+    shm_handle: SharedMemoryRegion | SharedMemorySlice,
     datatype: np.dtype,
     shape: list[int] | tuple[int, ...],
     offset: int = 0,
+    out: np.ndarray | None = None,
+    copy: bool = True,
 ) -> np.ndarray:
     """Get the contents of a shared memory region as a numpy array.
     
     Args:
-        shm_handle: The handle to the shared memory region.
+        shm_handle: The handle to the shared memory region, or a slice of a SharedMemoryArena.
         datatype: The data type of the array.
         shape: The shape of the array.
         offset: The offset, in bytes, into the region where you want the array extracted. Default is 0.
+        out: A preallocated array of the given shape to copy the contents into (optional).
+        copy: If False and out is not given, return a view of the shared memory instead of a
+            copy. The view is only valid while the region stays attached. Default is True.
         
     Returns:
-        A numpy array view of the shared memory region.
+        out if given, otherwise a copy of the contents, or a view of the shared memory region
+        when copy is False.
     """
     ...
 
@@ -83,11 +280,37 @@ def destroy_shared_memory_region(shm_handle: SharedMemoryRegion) -> None:
     ...
 
 
+def acquire_shared_memory_region(byte_size: int) -> SharedMemoryRegion:
+    """Get a system shared memory region of at least byte_size bytes from the pool.
+    
+    Args:
+        byte_size: The minimum size in bytes of the region.
+        
+    Returns:
+        A handle to the shared memory region. Its byte_size may be larger than requested.
+    """
+    ...
+
+
+def release_shared_memory_region(shm_handle: SharedMemoryRegion) -> None:
+    """Return a region obtained from acquire_shared_memory_region() to the pool.
+    
+    A region that was closed or destroyed while acquired is deleted instead of being
+    returned to the pool. Regions the pool deletes (evicted, or left in the pool at exit)
+    are not unregistered from the server; a warning naming each of them is logged.
+    
+    Args:
+        shm_handle: The handle to the shared memory region.
+    """
+    ...
+
+
 def mapped_shared_memory_regions() -> list[str]:
     """Get information about all mapped shared memory regions.
     
     Returns:
-        The list of mapped system shared memory regions.
+        The keys of the system shared memory regions created or attached by this process
+        and not yet closed.
     """
     ...
 
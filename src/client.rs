@@ -1,6 +1,7 @@
 use crate::error::Error;
 use anyhow::Context;
 use pyo3::types::PyAnyMethods;
+use std::time::Duration;
 use tonic::metadata::{AsciiMetadataValue, MetadataValue};
 use tonic::service::Interceptor;
 use tonic::transport::Channel;
@@ -39,37 +40,83 @@ impl AuthInterceptor {
     }
 }
 
+/// 按顺序等待所有请求，返回每个请求的错误信息（成功为 None）
+async fn collect_errors<T>(
+    handles: Vec<tokio::task::JoinHandle<Result<T, Status>>>,
+) -> Vec<Option<String>> {
+    let mut errors = Vec::with_capacity(handles.len());
+    for handle in handles {
+        errors.push(match handle.await {
+            Ok(Ok(_)) => None,
+            Ok(Err(status)) => Some(status.message().to_string()),
+            Err(e) => Some(e.to_string()),
+        });
+    }
+    errors
+}
+
 /// Triton Client
-#[pyo3::pyclass(module = "triton_client")]
+// weakref: Python 侧按 URL 共享 Client 时使用 WeakValueDictionary
+#[pyo3::pyclass(module = "triton_client", weakref)]
 #[derive(Debug, Clone)]
 pub struct Client {
     /// Raw grpc client interfaces automatically generated by tonic
     ///
     /// Should not necessary to use this interface directly in most cases
     pub inner: GrpcInferenceServiceClient<InterceptedService<Channel, AuthInterceptor>>,
+    /// The underlying channel, used for calls with a custom codec
+    service: InterceptedService<Channel, AuthInterceptor>,
 }
 
 #[pyo3::pymethods]
 impl Client {
     #[new]
-    pub fn new(url: &str, access_token: Option<String>) -> Result<Self, Error> {
+    #[pyo3(signature = (
+        url,
+        access_token=None,
+        keepalive_time_ms=None,
+        keepalive_timeout_ms=None,
+        keepalive_permit_without_calls=false,
+    ))]
+    pub fn new(
+        url: &str,
+        access_token: Option<String>,
+        keepalive_time_ms: Option<u64>,
+        keepalive_timeout_ms: Option<u64>,
+        keepalive_permit_without_calls: bool,
+    ) -> Result<Self, Error> {
         let url = url.parse::<http::Uri>()?;
-        let client = crate::TOKIO_RT
+        let service = crate::TOKIO_RT
             .get()
             .context("failed to get tokio runtime")?
             .block_on(async {
-                let mut channel = Channel::builder(url);
+                // 关闭 Nagle 算法，避免健康检查、元数据等小请求被延迟发送
+                let mut channel = Channel::builder(url)
+                    .tcp_nodelay(true)
+                    .http2_adaptive_window(true);
+                // keepalive 默认关闭：服务端默认限制无数据时的 ping 频率，过于频繁会被断开连接
+                if let Some(interval) = keepalive_time_ms {
+                    channel = channel
+                        .http2_keep_alive_interval(Duration::from_millis(interval))
+                        .keep_alive_while_idle(keepalive_permit_without_calls);
+                    if let Some(timeout) = keepalive_timeout_ms {
+                        channel = channel.keep_alive_timeout(Duration::from_millis(timeout));
+                    }
+                }
                 if access_token.is_some() {
                     channel = channel.tls_config(ClientTlsConfig::new())?;
                 }
                 let channel = channel.connect().await?;
-                let client = GrpcInferenceServiceClient::with_interceptor(
+                let service = InterceptedService::new(
                     channel,
                     AuthInterceptor::create(access_token.as_deref())?,
                 );
-                Ok::<_, Error>(client)
+                Ok::<_, Error>(service)
             })?;
-        Ok(Client { inner: client })
+        Ok(Client {
+            inner: GrpcInferenceServiceClient::new(service.clone()),
+            service,
+        })
     }
 
     #[doc = "Check liveness of the inference server."]
@@ -119,6 +166,88 @@ impl Client {
             .block_on(async { inner.server_metadata(tonic::Request::new(req)).await })?;
         Ok(response.into_inner())
     }
+    #[doc = "Check liveness and readiness and get metadata of the server concurrently."]
+    #[doc = ""]
+    #[doc = "The three requests share one HTTP/2 connection and are sent at once, costing one round trip."]
+    pub fn server_status(
+        &self,
+    ) -> Result<
+        (
+            inference::ServerLiveResponse,
+            inference::ServerReadyResponse,
+            inference::ServerMetadataResponse,
+        ),
+        Error,
+    > {
+        let mut live = self.inner.clone();
+        let mut ready = self.inner.clone();
+        let mut metadata = self.inner.clone();
+        let (live, ready, metadata) = crate::TOKIO_RT
+            .get()
+            .context("failed to get tokio runtime")?
+            .block_on(async {
+                tokio::try_join!(
+                    live.server_live(tonic::Request::new(Default::default())),
+                    ready.server_ready(tonic::Request::new(Default::default())),
+                    metadata.server_metadata(tonic::Request::new(Default::default())),
+                )
+            })?;
+        Ok((live.into_inner(), ready.into_inner(), metadata.into_inner()))
+    }
+    #[doc = "Get readiness, metadata, configuration and statistics of a model concurrently."]
+    #[doc = ""]
+    #[doc = "The four requests share one HTTP/2 connection and are sent at once, costing one round trip."]
+    pub fn model_status(
+        &self,
+        model_name: String,
+        model_version: String,
+    ) -> Result<
+        (
+            inference::ModelReadyResponse,
+            inference::ModelMetadataResponse,
+            inference::ModelConfigResponse,
+            inference::ModelStatisticsResponse,
+        ),
+        Error,
+    > {
+        let ready_req = inference::ModelReadyRequest {
+            name: model_name.clone(),
+            version: model_version.clone(),
+        };
+        let metadata_req = inference::ModelMetadataRequest {
+            name: model_name.clone(),
+            version: model_version.clone(),
+        };
+        let config_req = inference::ModelConfigRequest {
+            name: model_name.clone(),
+            version: model_version.clone(),
+        };
+        let statistics_req = inference::ModelStatisticsRequest {
+            name: model_name,
+            version: model_version,
+        };
+        let mut ready = self.inner.clone();
+        let mut metadata = self.inner.clone();
+        let mut config = self.inner.clone();
+        let mut statistics = self.inner.clone();
+        let (ready, metadata, config, statistics) = crate::TOKIO_RT
+            .get()
+            .context("failed to get tokio runtime")?
+            .block_on(async {
+                tokio::try_join!(
+                    ready.model_ready(tonic::Request::new(ready_req)),
+                    metadata.model_metadata(tonic::Request::new(metadata_req)),
+                    config.model_config(tonic::Request::new(config_req)),
+                    statistics.model_statistics(tonic::Request::new(statistics_req)),
+                )
+            })?;
+        Ok((
+            ready.into_inner(),
+            metadata.into_inner(),
+            config.into_inner(),
+            statistics.into_inner(),
+        ))
+    }
     #[doc = "Get model metadata."]
     #[inline(always)]
     pub fn model_metadata(
@@ -133,12 +262,102 @@ impl Client {
         Ok(response.into_inner())
     }
     #[doc = "Perform inference using a specific model."]
+    #[doc = ""]
+    #[doc = "`raw_inputs` (optional) are appended to `raw_input_contents` directly from their buffers."]
     #[inline(always)]
+    #[pyo3(signature = (req, raw_inputs=None))]
     pub fn model_infer(
         &self,
         req: pyo3::Bound<'_, pyo3::PyAny>,
+        raw_inputs: Option<Vec<pyo3::Bound<'_, pyo3::PyAny>>>,
+    ) -> Result<inference::ModelInferResponse, Error> {
+        let req = crate::request::extract_with_raw_inputs(req.py(), &req, raw_inputs)
+            .map_err(Error::msg)?;
+        let mut inner = self.inner.clone();
+        let response = crate::TOKIO_RT
+            .get()
+            .context("failed to get tokio runtime")?
+            .block_on(async { inner.model_infer(tonic::Request::new(req)).await })?;
+        Ok(response.into_inner())
+    }
+    #[doc = "Perform inference, decoding only the raw outputs of the response."]
+    #[doc = ""]
+    #[doc = "Returns the undecoded response body as a read-only ResponseBody (buffer protocol,"]
+    #[doc = "not copied) together with (name, datatype, shape, start, end) of each raw output"]
+    #[doc = "within it."]
+    #[pyo3(signature = (req, raw_inputs=None))]
+    pub fn model_infer_raw_outputs<'py>(
+        &self,
+        req: pyo3::Bound<'py, pyo3::PyAny>,
+        raw_inputs: Option<Vec<pyo3::Bound<'py, pyo3::PyAny>>>,
+    ) -> Result<
+        (
+            crate::response::ResponseBody,
+            Vec<(String, String, Vec<i64>, usize, usize)>,
+        ),
+        Error,
+    > {
+        let py = req.py();
+        let req = crate::request::extract_with_raw_inputs(py, &req, raw_inputs)
+            .map_err(Error::msg)?;
+        // 写入共享内存的输出在响应中没有 raw 数据，定位时需跳过
+        let shm_outputs: std::collections::HashSet<String> = req
+            .outputs
+            .iter()
+            .filter(|output| output.parameters.contains_key("shared_memory_region"))
+            .map(|output| output.name.clone())
+            .collect();
+        let mut grpc = tonic::client::Grpc::new(self.service.clone());
+        let body = crate::TOKIO_RT
+            .get()
+            .context("failed to get tokio runtime")?
+            .block_on(async {
+                grpc.ready()
+                    .await
+                    .map_err(|e| Status::unknown(format!("Service was not ready: {}", e)))?;
+                let path = http::uri::PathAndQuery::from_static(
+                    "/inference.GRPCInferenceService/ModelInfer",
+                );
+                grpc.unary(
+                    tonic::Request::new(req),
+                    path,
+                    crate::response::RawResponseCodec,
+                )
+                .await
+            })?
+            .into_inner();
+        // 跳过完整的 protobuf 解码，raw 数据保留在响应 buffer 中，Python 侧按范围切片
+        let spans = crate::response::parse_raw_outputs(&body, &shm_outputs)?
+            .into_iter()
+            .map(|span| (span.name, span.datatype, span.shape, span.start, span.end))
+            .collect();
+        Ok((crate::response::ResponseBody::new(body), spans))
+    }
+    #[doc = "Perform inference from parallel input/output sequences in a single call."]
+    #[allow(clippy::too_many_arguments)]
+    pub fn model_infer_soa(
+        &self,
+        py: pyo3::Python<'_>,
+        model_name: String,
+        model_version: String,
+        id: String,
+        input_names: Vec<String>,
+        input_datatypes: Vec<String>,
+        input_shapes: Vec<Vec<i64>>,
+        input_buffers: Vec<pyo3::Bound<'_, pyo3::PyAny>>,
+        output_names: Vec<String>,
     ) -> Result<inference::ModelInferResponse, Error> {
-        let req = req.extract::<inference::ModelInferRequest>().map_err(Error::msg)?;
+        let req = crate::request::build_soa_request(
+            py,
+            model_name,
+            model_version,
+            id,
+            input_names,
+            input_datatypes,
+            input_shapes,
+            input_buffers,
+            output_names,
+        )?;
         let mut inner = self.inner.clone();
         let response = crate::TOKIO_RT
             .get()
@@ -146,6 +365,43 @@ impl Client {
             .block_on(async { inner.model_infer(tonic::Request::new(req)).await })?;
         Ok(response.into_inner())
     }
+    #[doc = "Perform inference using a specific model, returning an awaitable."]
+    #[pyo3(signature = (req, raw_inputs=None))]
+    pub fn model_infer_async<'py>(
+        &self,
+        py: pyo3::Python<'py>,
+        req: pyo3::Bound<'py, pyo3::PyAny>,
+        raw_inputs: Option<Vec<pyo3::Bound<'py, pyo3::PyAny>>>,
+    ) -> pyo3::PyResult<pyo3::Bound<'py, pyo3::PyAny>> {
+        let req = crate::request::extract_with_raw_inputs(py, &req, raw_inputs)?;
+        let mut inner = self.inner.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let response = inner
+                .model_infer(tonic::Request::new(req))
+                .await
+                .map_err(Error::from)?;
+            Ok(response.into_inner())
+        })
+    }
+    #[doc = "Perform inference with a prepared request, binding only the raw input buffers."]
+    #[inline(always)]
+    pub fn model_infer_prepared(
+        &self,
+        prepared: pyo3::PyRef<'_, crate::request::PreparedInferRequest>,
+        buffers: Vec<pyo3::Bound<'_, pyo3::PyAny>>,
+    ) -> Result<inference::ModelInferResponse, Error> {
+        let req = prepared.bind(prepared.py(), &buffers).map_err(Error::msg)?;
+        let mut inner = self.inner.clone();
+        let response = crate::TOKIO_RT
+            .get()
+            .context("failed to get tokio runtime")?
+            .block_on(async { inner.model_infer(tonic::Request::new(req)).await })?;
+        Ok(response.into_inner())
+    }
+    #[doc = "Open a bidirectional ModelStreamInfer stream."]
+    pub fn model_stream_infer(&self) -> Result<crate::stream::InferStream, Error> {
+        crate::stream::InferStream::open(self)
+    }
     #[doc = "Get model configuration."]
     #[inline(always)]
     pub fn model_config(
@@ -215,6 +471,52 @@ impl Client {
             })?;
         Ok(response.into_inner())
     }
+    #[doc = "Load or reload several models concurrently over the shared connection."]
+    #[doc = ""]
+    #[doc = "Returns one entry per model, in order: None on success, otherwise the error message."]
+    pub fn repository_model_load_many(
+        &self,
+        model_names: Vec<String>,
+    ) -> Result<Vec<Option<String>>, Error> {
+        let rt = crate::TOKIO_RT.get().context("failed to get tokio runtime")?;
+        let handles = model_names
+            .into_iter()
+            .map(|model_name| {
+                let mut inner = self.inner.clone();
+                let req = inference::RepositoryModelLoadRequest {
+                    model_name,
+                    ..Default::default()
+                };
+                rt.spawn(async move { inner.repository_model_load(tonic::Request::new(req)).await })
+            })
+            .collect();
+        Ok(rt.block_on(collect_errors(handles)))
+    }
+    #[doc = "Unload several models concurrently over the shared connection."]
+    #[doc = ""]
+    #[doc = "Returns one entry per model, in order: None on success, otherwise the error message."]
+    pub fn repository_model_unload_many(
+        &self,
+        model_names: Vec<String>,
+    ) -> Result<Vec<Option<String>>, Error> {
+        let rt = crate::TOKIO_RT.get().context("failed to get tokio runtime")?;
+        let handles = model_names
+            .into_iter()
+            .map(|model_name| {
+                let mut inner = self.inner.clone();
+                let req = inference::RepositoryModelUnloadRequest {
+                    model_name,
+                    ..Default::default()
+                };
+                rt.spawn(async move {
+                    inner
+                        .repository_model_unload(tonic::Request::new(req))
+                        .await
+                })
+            })
+            .collect();
+        Ok(rt.block_on(collect_errors(handles)))
+    }
     #[doc = "Get the status of all registered system-shared-memory regions."]
     #[inline(always)]
     pub fn system_shared_memory_status(
@@ -0,0 +1,75 @@
+use crate::error::Error;
+use crate::inference::InferTensorContents;
+use numpy::PyReadonlyArray1;
+use pyo3::prelude::*;
+
+#[pymethods]
+impl InferTensorContents {
+    /// Replace `int_contents` with a 1-D int8, int16 or int32 numpy array.
+    ///
+    /// 窄整数在 Rust 侧逐个扩展为 i32，Python 侧无需先 astype 再拷贝更宽的数据
+    #[allow(non_snake_case)]
+    fn Replace_int_contents_from_array(&mut self, data: &Bound<'_, PyAny>) -> Result<(), Error> {
+        self.int_contents = if let Ok(array) = data.extract::<PyReadonlyArray1<'_, i8>>() {
+            widen(array.as_slice()?)
+        } else if let Ok(array) = data.extract::<PyReadonlyArray1<'_, i16>>() {
+            widen(array.as_slice()?)
+        } else {
+            let array = data
+                .extract::<PyReadonlyArray1<'_, i32>>()
+                .map_err(Error::msg)?;
+            array.as_slice()?.to_vec()
+        };
+        Ok(())
+    }
+
+    /// Replace `uint_contents` with a 1-D uint8, uint16 or uint32 numpy array.
+    ///
+    /// 窄整数在 Rust 侧逐个扩展为 u32，Python 侧无需先 astype 再拷贝更宽的数据
+    #[allow(non_snake_case)]
+    fn Replace_uint_contents_from_array(&mut self, data: &Bound<'_, PyAny>) -> Result<(), Error> {
+        self.uint_contents = if let Ok(array) = data.extract::<PyReadonlyArray1<'_, u8>>() {
+            widen(array.as_slice()?)
+        } else if let Ok(array) = data.extract::<PyReadonlyArray1<'_, u16>>() {
+            widen(array.as_slice()?)
+        } else {
+            let array = data
+                .extract::<PyReadonlyArray1<'_, u32>>()
+                .map_err(Error::msg)?;
+            array.as_slice()?.to_vec()
+        };
+        Ok(())
+    }
+}
+
+impl InferTensorContents {
+    /// Build contents from a flat numpy array according to the Triton datatype.
+    ///
+    /// 数组的元素类型必须与 datatype 对应；FP16 需以 float32 数组传入
+    pub(crate) fn from_array(datatype: &str, data: &Bound<'_, PyAny>) -> Result<Self, Error> {
+        let mut contents = InferTensorContents::default();
+        match datatype.to_ascii_uppercase().as_str() {
+            "BOOL" => contents.bool_contents = read_array(data)?,
+            "INT8" | "INT16" | "INT32" => contents.Replace_int_contents_from_array(data)?,
+            "INT64" => contents.int64_contents = read_array(data)?,
+            "UINT8" | "UINT16" | "UINT32" => contents.Replace_uint_contents_from_array(data)?,
+            "UINT64" => contents.uint64_contents = read_array(data)?,
+            // FP16 在 protobuf 中以 fp32_contents 传输，Python 侧已转换为 float32
+            "FP16" | "FP32" => contents.fp32_contents = read_array(data)?,
+            "FP64" => contents.fp64_contents = read_array(data)?,
+            _ => return Err(Error::msg(format!("Unsupported data type: {}", datatype))),
+        }
+        Ok(contents)
+    }
+}
+
+fn read_array<T: numpy::Element + Copy>(data: &Bound<'_, PyAny>) -> Result<Vec<T>, Error> {
+    let array = data
+        .extract::<PyReadonlyArray1<'_, T>>()
+        .map_err(Error::msg)?;
+    Ok(array.as_slice()?.to_vec())
+}
+
+fn widen<S: Copy, T: From<S>>(data: &[S]) -> Vec<T> {
+    data.iter().map(|&value| T::from(value)).collect()
+}
@@ -20,6 +20,8 @@ pub enum Error {
     #[error(transparent)]
     EncodeError(#[from] prost::EncodeError),
     #[error(transparent)]
+    DecodeError(#[from] prost::DecodeError),
+    #[error(transparent)]
     FromVecError(#[from] FromVecError),
     #[error(transparent)]
     NotContiguousError(#[from] NotContiguousError),
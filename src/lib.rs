@@ -1,12 +1,18 @@
 #![doc = include_str!("../README.md")]
 
 pub mod client;
+pub mod stream;
+mod contents;
 mod inference;
+mod request;
+mod response;
+mod shm;
 // mod py_types;
 mod utils;
 mod error;
 
 pub use client::Client;
+pub use stream::InferStream;
 pub use error::{Error, Result};
 
 use pyo3::prelude::*;
@@ -21,9 +27,21 @@ fn triton_client(m: &Bound<'_, PyModule>) -> PyResult<()> {
     if let Err(e) = TOKIO_RT.set(rt) {
         log::error!("TRITON_CLIENT RUNTIME SET ERROR: {:#}", e);
     }
+    // asyncio 接口与同步接口共用同一个 tokio runtime
+    if let Some(rt) = TOKIO_RT.get() {
+        if pyo3_async_runtimes::tokio::init_with_runtime(rt).is_err() {
+            log::error!("TRITON_CLIENT ASYNC RUNTIME SET ERROR: already initialized");
+        }
+    }
     m.add("__doc__", "High-performance Triton inference client")?;
     // Add client class
     m.add_class::<Client>()?;
+    m.add_class::<InferStream>()?;
+    m.add_class::<request::PreparedInferRequest>()?;
+    m.add_class::<response::ResponseBody>()?;
+    m.add_function(wrap_pyfunction!(shm::write_buffers, m)?)?;
+    m.add_function(wrap_pyfunction!(shm::atomic_load_u64, m)?)?;
+    m.add_function(wrap_pyfunction!(shm::atomic_store_u64, m)?)?;
     // Add request/response types
     m.add_class::<inference::ServerLiveResponse>()?;
     m.add_class::<inference::ServerReadyResponse>()?;
@@ -35,6 +53,7 @@ fn triton_client(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<inference::ModelMetadataResponse>()?;
     m.add_class::<inference::ModelInferRequest>()?;
     m.add_class::<inference::ModelInferResponse>()?;
+    m.add_class::<inference::ModelStreamInferResponse>()?;
     m.add_class::<inference::ModelConfigRequest>()?;
     m.add_class::<inference::ModelConfigResponse>()?;
     m.add_class::<inference::ModelStatisticsRequest>()?;
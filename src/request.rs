@@ -0,0 +1,149 @@
+use crate::error::Error;
+use crate::inference::{InferTensorContents, ModelInferRequest};
+use crate::inference::model_infer_request::{InferInputTensor, InferRequestedOutputTensor};
+use pyo3::buffer::PyBuffer;
+use pyo3::prelude::*;
+
+#[pymethods]
+impl ModelInferRequest {
+    /// Append one entry to `raw_input_contents` from any object exposing a byte buffer.
+    ///
+    /// 直接读取 buffer protocol 拷贝一次，避免先 `tobytes()` 再转换为 `Vec<u8>` 的两次拷贝
+    fn add_raw_input(&mut self, py: Python<'_>, data: &Bound<'_, PyAny>) -> PyResult<()> {
+        self.raw_input_contents.push(read_buffer(py, data)?);
+        Ok(())
+    }
+
+    /// Append all inputs in one call.
+    ///
+    /// 每一项是 `InferInputTensor`，或 `(name, datatype, shape, data)` 元组：
+    /// 后者由 Rust 按 datatype 直接从一维 numpy 数组构建 contents，省去逐个输入的 FFI 往返
+    fn extend_inputs(&mut self, items: Vec<Bound<'_, PyAny>>) -> Result<(), Error> {
+        self.inputs.reserve(items.len());
+        for item in items {
+            let input = match item.extract::<(String, String, Vec<i64>, Bound<'_, PyAny>)>() {
+                Ok((name, datatype, shape, data)) => {
+                    let contents = InferTensorContents::from_array(&datatype, &data)?;
+                    InferInputTensor {
+                        name,
+                        datatype,
+                        shape,
+                        contents: Some(contents),
+                        ..Default::default()
+                    }
+                }
+                Err(_) => item.extract::<InferInputTensor>().map_err(Error::msg)?,
+            };
+            self.inputs.push(input);
+        }
+        Ok(())
+    }
+}
+
+/// Pre-built `ModelInferRequest` reused across inference calls
+///
+/// 模型名、版本、输入输出描述只构建一次，每次推理只替换 `raw_input_contents`
+#[pyo3::pyclass(module = "triton_client")]
+pub struct PreparedInferRequest {
+    template: ModelInferRequest,
+}
+
+#[pymethods]
+impl PreparedInferRequest {
+    #[new]
+    fn new(request: Bound<'_, PyAny>) -> PyResult<Self> {
+        let mut template = request.extract::<ModelInferRequest>()?;
+        template.raw_input_contents.clear();
+        Ok(PreparedInferRequest { template })
+    }
+}
+
+impl PreparedInferRequest {
+    /// Build a request from the template with the given raw input buffers.
+    pub(crate) fn bind(
+        &self,
+        py: Python<'_>,
+        buffers: &[Bound<'_, PyAny>],
+    ) -> PyResult<ModelInferRequest> {
+        let mut request = self.template.clone();
+        request.raw_input_contents = buffers
+            .iter()
+            .map(|buffer| read_buffer(py, buffer))
+            .collect::<PyResult<_>>()?;
+        Ok(request)
+    }
+}
+
+/// Build a request from parallel (struct-of-arrays) input/output descriptions.
+#[allow(clippy::too_many_arguments)]
+pub(crate) fn build_soa_request(
+    py: Python<'_>,
+    model_name: String,
+    model_version: String,
+    id: String,
+    input_names: Vec<String>,
+    input_datatypes: Vec<String>,
+    input_shapes: Vec<Vec<i64>>,
+    input_buffers: Vec<Bound<'_, PyAny>>,
+    output_names: Vec<String>,
+) -> Result<ModelInferRequest, Error> {
+    let count = input_names.len();
+    if input_datatypes.len() != count || input_shapes.len() != count || input_buffers.len() != count
+    {
+        return Err(Error::msg("input sequences must have the same length"));
+    }
+    let inputs = input_names
+        .into_iter()
+        .zip(input_datatypes)
+        .zip(input_shapes)
+        .map(|((name, datatype), shape)| InferInputTensor {
+            name,
+            datatype,
+            shape,
+            ..Default::default()
+        })
+        .collect();
+    let raw_input_contents = input_buffers
+        .iter()
+        .map(|buffer| read_buffer(py, buffer))
+        .collect::<PyResult<_>>()
+        .map_err(Error::msg)?;
+    let outputs = output_names
+        .into_iter()
+        .map(|name| InferRequestedOutputTensor {
+            name,
+            ..Default::default()
+        })
+        .collect();
+    Ok(ModelInferRequest {
+        model_name,
+        model_version,
+        id,
+        inputs,
+        outputs,
+        raw_input_contents,
+        ..Default::default()
+    })
+}
+
+/// Extract a request and gather `raw_inputs` straight from their buffers.
+///
+/// 原始输入不经过 Python 侧的 ModelInferRequest 中转，避免 extract 时再克隆一遍所有输入数据
+pub(crate) fn extract_with_raw_inputs(
+    py: Python<'_>,
+    req: &Bound<'_, PyAny>,
+    raw_inputs: Option<Vec<Bound<'_, PyAny>>>,
+) -> PyResult<ModelInferRequest> {
+    let mut request = req.extract::<ModelInferRequest>()?;
+    if let Some(raw_inputs) = raw_inputs {
+        request.raw_input_contents.reserve(raw_inputs.len());
+        for buffer in &raw_inputs {
+            request.raw_input_contents.push(read_buffer(py, buffer)?);
+        }
+    }
+    Ok(request)
+}
+
+fn read_buffer(py: Python<'_>, data: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
+    PyBuffer::<u8>::get(data)?.to_vec(py)
+}
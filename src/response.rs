@@ -0,0 +1,259 @@
+use crate::error::Error;
+use crate::inference::{InferTensorContents, ModelInferRequest, ModelInferResponse};
+use numpy::PyArray1;
+use prost::Message;
+use prost::bytes::{Buf, Bytes};
+use prost::encoding::{WireType, decode_key, decode_varint};
+use pyo3::prelude::*;
+use std::collections::HashSet;
+use tonic::Status;
+use tonic::codec::{Codec, DecodeBuf, Decoder, EncodeBuf, Encoder};
+
+#[pymethods]
+impl ModelInferResponse {
+    /// Move one entry of `raw_output_contents` into a numpy `uint8` array.
+    ///
+    /// 直接转移 `Vec<u8>` 的所有权，不拷贝数据；索引越界时返回 None
+    fn take_raw_output<'py>(
+        &mut self,
+        py: Python<'py>,
+        index: usize,
+    ) -> Option<Bound<'py, PyArray1<u8>>> {
+        self.raw_output_contents
+            .get_mut(index)
+            .map(|contents| PyArray1::from_vec(py, std::mem::take(contents)))
+    }
+
+    /// Describe each output as `(name, datatype, shape, has_contents)`.
+    ///
+    /// `outputs` 的 getter 会克隆包括 contents 在内的整个列表，这里只复制描述信息
+    fn output_headers(&self) -> Vec<(String, String, Vec<i64>, bool)> {
+        self.outputs
+            .iter()
+            .map(|output| {
+                (
+                    output.name.clone(),
+                    output.datatype.clone(),
+                    output.shape.clone(),
+                    output.contents.is_some(),
+                )
+            })
+            .collect()
+    }
+
+    /// Move the `contents` of one output out of the response.
+    ///
+    /// 转移所有权而不是克隆张量数据；之后该输出的 contents 为 None，索引越界时返回 None
+    fn take_output_contents(&mut self, index: usize) -> Option<InferTensorContents> {
+        self.outputs
+            .get_mut(index)
+            .and_then(|output| output.contents.take())
+    }
+}
+
+/// `ModelInfer` codec that encodes the request as usual but returns the response body undecoded
+#[derive(Debug, Clone, Default)]
+pub(crate) struct RawResponseCodec;
+
+impl Codec for RawResponseCodec {
+    type Encode = ModelInferRequest;
+    type Decode = Bytes;
+    type Encoder = RawResponseCodec;
+    type Decoder = RawResponseCodec;
+
+    fn encoder(&mut self) -> Self::Encoder {
+        RawResponseCodec
+    }
+
+    fn decoder(&mut self) -> Self::Decoder {
+        RawResponseCodec
+    }
+}
+
+impl Encoder for RawResponseCodec {
+    type Item = ModelInferRequest;
+    type Error = Status;
+
+    fn encode(&mut self, item: Self::Item, buf: &mut EncodeBuf<'_>) -> Result<(), Self::Error> {
+        item.encode(buf)
+            .map_err(|e| Status::internal(e.to_string()))
+    }
+}
+
+impl Decoder for RawResponseCodec {
+    type Item = Bytes;
+    type Error = Status;
+
+    fn decode(&mut self, buf: &mut DecodeBuf<'_>) -> Result<Option<Self::Item>, Self::Error> {
+        // DecodeBuf 底层是 BytesMut，copy_to_bytes 只拆分出共享同一块内存的 Bytes，不拷贝数据
+        Ok(Some(buf.copy_to_bytes(buf.remaining())))
+    }
+}
+
+/// Undecoded `ModelInfer` response body, exposed to Python through the buffer protocol.
+///
+/// 持有解码器返回的 `Bytes`，`memoryview` / `np.frombuffer` 直接引用其中的数据，不拷贝；
+/// 导出的 buffer 只读，并持有该对象的引用，所有视图释放前数据一直有效
+#[pyo3::pyclass(module = "triton_client", frozen)]
+pub struct ResponseBody {
+    data: Bytes,
+}
+
+impl ResponseBody {
+    pub(crate) fn new(data: Bytes) -> Self {
+        Self { data }
+    }
+}
+
+#[pymethods]
+impl ResponseBody {
+    fn __len__(&self) -> usize {
+        self.data.len()
+    }
+
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut pyo3::ffi::Py_buffer,
+        flags: std::os::raw::c_int,
+    ) -> PyResult<()> {
+        let data = &slf.get().data;
+        // readonly = 1：请求可写 buffer 时 PyBuffer_FillInfo 会设置 BufferError
+        let ret = unsafe {
+            pyo3::ffi::PyBuffer_FillInfo(
+                view,
+                slf.as_ptr(),
+                data.as_ptr() as *mut std::os::raw::c_void,
+                data.len() as pyo3::ffi::Py_ssize_t,
+                1,
+                flags,
+            )
+        };
+        if ret == -1 {
+            return Err(PyErr::fetch(slf.py()));
+        }
+        Ok(())
+    }
+}
+
+/// Position of one raw output inside an encoded `ModelInferResponse`
+pub(crate) struct RawOutputSpan {
+    pub name: String,
+    pub datatype: String,
+    pub shape: Vec<i64>,
+    pub start: usize,
+    pub end: usize,
+}
+
+#[derive(Default)]
+struct OutputHeader {
+    name: String,
+    datatype: String,
+    shape: Vec<i64>,
+    has_contents: bool,
+}
+
+/// Locate the raw outputs in an encoded `ModelInferResponse`.
+///
+/// 只解析 `outputs`(5) 与 `raw_output_contents`(6)，其余字段（id、parameters 等）直接跳过；
+/// 不读取 raw 数据本身，只返回其在 `data` 中的范围。
+/// `shm_outputs` 为请求中写入共享内存的输出名，这些输出没有对应的 raw 数据
+pub(crate) fn parse_raw_outputs(
+    data: &[u8],
+    shm_outputs: &HashSet<String>,
+) -> Result<Vec<RawOutputSpan>, Error> {
+    let mut buf = data;
+    let mut outputs = Vec::new();
+    let mut ranges = Vec::new();
+    while !buf.is_empty() {
+        let (tag, wire_type) = decode_key(&mut buf)?;
+        match (tag, wire_type) {
+            (5, WireType::LengthDelimited) => {
+                let len = read_len(&mut buf)?;
+                outputs.push(parse_output_header(&buf[..len])?);
+                buf.advance(len);
+            }
+            (6, WireType::LengthDelimited) => {
+                let len = read_len(&mut buf)?;
+                let start = data.len() - buf.len();
+                ranges.push((start, start + len));
+                buf.advance(len);
+            }
+            _ => skip_field(&mut buf, wire_type)?,
+        }
+    }
+    // raw_output_contents 按顺序对应既未使用 contents、也未写入共享内存的输出
+    Ok(outputs
+        .into_iter()
+        .filter(|output| !output.has_contents && !shm_outputs.contains(&output.name))
+        .zip(ranges)
+        .map(|(output, (start, end))| RawOutputSpan {
+            name: output.name,
+            datatype: output.datatype,
+            shape: output.shape,
+            start,
+            end,
+        })
+        .collect())
+}
+
+fn parse_output_header(mut buf: &[u8]) -> Result<OutputHeader, Error> {
+    let mut output = OutputHeader::default();
+    while !buf.is_empty() {
+        let (tag, wire_type) = decode_key(&mut buf)?;
+        match (tag, wire_type) {
+            (1, WireType::LengthDelimited) => output.name = read_string(&mut buf)?,
+            (2, WireType::LengthDelimited) => output.datatype = read_string(&mut buf)?,
+            // shape 通常为 packed 编码，也兼容逐个编码
+            (3, WireType::LengthDelimited) => {
+                let len = read_len(&mut buf)?;
+                let mut packed = &buf[..len];
+                while !packed.is_empty() {
+                    output.shape.push(decode_varint(&mut packed)? as i64);
+                }
+                buf.advance(len);
+            }
+            (3, WireType::Varint) => output.shape.push(decode_varint(&mut buf)? as i64),
+            (5, _) => {
+                output.has_contents = true;
+                skip_field(&mut buf, wire_type)?;
+            }
+            _ => skip_field(&mut buf, wire_type)?,
+        }
+    }
+    Ok(output)
+}
+
+fn read_len(buf: &mut &[u8]) -> Result<usize, Error> {
+    let len = decode_varint(buf)? as usize;
+    if len > buf.len() {
+        return Err(Error::msg("truncated ModelInferResponse"));
+    }
+    Ok(len)
+}
+
+fn read_string(buf: &mut &[u8]) -> Result<String, Error> {
+    let len = read_len(buf)?;
+    let value = std::str::from_utf8(&buf[..len]).map_err(Error::msg)?.to_string();
+    buf.advance(len);
+    Ok(value)
+}
+
+fn skip_field(buf: &mut &[u8], wire_type: WireType) -> Result<(), Error> {
+    let len = match wire_type {
+        WireType::Varint => {
+            decode_varint(buf)?;
+            return Ok(());
+        }
+        WireType::SixtyFourBit => 8,
+        WireType::ThirtyTwoBit => 4,
+        WireType::LengthDelimited => read_len(buf)?,
+        WireType::StartGroup | WireType::EndGroup => {
+            return Err(Error::msg("unexpected group in ModelInferResponse"));
+        }
+    };
+    if len > buf.len() {
+        return Err(Error::msg("truncated ModelInferResponse"));
+    }
+    buf.advance(len);
+    Ok(())
+}
@@ -0,0 +1,94 @@
+use crate::error::Error;
+use pyo3::buffer::PyBuffer;
+use pyo3::prelude::*;
+use std::sync::atomic::{AtomicU64, Ordering};
+
+/// Copy byte buffers back to back into a writable buffer, e.g. a shared memory region.
+///
+/// 所有数据在一次调用中拷贝，省去 Python 侧逐个数组的循环；返回写入结束位置的偏移
+#[pyfunction]
+pub(crate) fn write_buffers(
+    py: Python<'_>,
+    dst: &Bound<'_, PyAny>,
+    offset: usize,
+    buffers: Vec<Bound<'_, PyAny>>,
+) -> Result<usize, Error> {
+    let target = PyBuffer::<u8>::get(dst).map_err(Error::msg)?;
+    if target.readonly() {
+        return Err(Error::msg("destination buffer is read-only"));
+    }
+    if !target.is_c_contiguous() {
+        return Err(Error::msg("destination buffer must be contiguous"));
+    }
+    let sources = buffers
+        .iter()
+        .map(|buffer| PyBuffer::<u8>::get(buffer))
+        .collect::<PyResult<Vec<_>>>()
+        .map_err(Error::msg)?;
+    let end = sources
+        .iter()
+        .fold(offset, |end, source| end + source.len_bytes());
+    if end > target.len_bytes() {
+        return Err(Error::msg(format!(
+            "Not enough space in destination buffer. Required: {}, Available: {}",
+            end,
+            target.len_bytes()
+        )));
+    }
+    // SAFETY: 目标 buffer 已检查为可写且连续，target 持有 buffer 直到函数返回
+    let dst = unsafe {
+        std::slice::from_raw_parts_mut(target.buf_ptr() as *mut u8, target.len_bytes())
+    };
+    let mut position = offset;
+    for source in &sources {
+        let len = source.len_bytes();
+        source
+            .copy_to_slice(py, &mut dst[position..position + len])
+            .map_err(Error::msg)?;
+        position += len;
+    }
+    Ok(end)
+}
+
+/// 返回 buffer 中 offset 处 8 字节对齐的 u64 的原子引用
+fn atomic_u64_at<'a>(target: &'a PyBuffer<u8>, offset: usize) -> Result<&'a AtomicU64, Error> {
+    if offset + 8 > target.len_bytes() {
+        return Err(Error::msg(format!(
+            "Offset out of range. Required: {}, Available: {}",
+            offset + 8,
+            target.len_bytes()
+        )));
+    }
+    let ptr = unsafe { (target.buf_ptr() as *mut u8).add(offset) };
+    if ptr as usize % std::mem::align_of::<AtomicU64>() != 0 {
+        return Err(Error::msg("atomic u64 must be 8-byte aligned"));
+    }
+    // SAFETY: 已检查范围与对齐，target 持有 buffer 直到引用失效
+    Ok(unsafe { &*(ptr as *const AtomicU64) })
+}
+
+/// Load a u64 from a buffer with acquire ordering.
+///
+/// 用于共享内存中的 SPSC 计数：读到新值后，对端在发布前写入的数据一定可见
+#[pyfunction]
+pub(crate) fn atomic_load_u64(buf: &Bound<'_, PyAny>, offset: usize) -> Result<u64, Error> {
+    let target = PyBuffer::<u8>::get(buf).map_err(Error::msg)?;
+    Ok(atomic_u64_at(&target, offset)?.load(Ordering::Acquire))
+}
+
+/// Store a u64 into a writable buffer with release ordering.
+///
+/// 之前写入的数据在对端 acquire 读到该值时一定可见（aarch64 等弱内存序平台同样成立）
+#[pyfunction]
+pub(crate) fn atomic_store_u64(
+    buf: &Bound<'_, PyAny>,
+    offset: usize,
+    value: u64,
+) -> Result<(), Error> {
+    let target = PyBuffer::<u8>::get(buf).map_err(Error::msg)?;
+    if target.readonly() {
+        return Err(Error::msg("destination buffer is read-only"));
+    }
+    atomic_u64_at(&target, offset)?.store(value, Ordering::Release);
+    Ok(())
+}
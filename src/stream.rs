@@ -0,0 +1,121 @@
+use crate::error::Error;
+use anyhow::Context;
+use pyo3::prelude::*;
+use tokio::sync::mpsc;
+use tokio_stream::wrappers::UnboundedReceiverStream;
+use tonic::Status;
+
+use super::inference;
+
+type StreamResponse = Result<inference::ModelStreamInferResponse, Status>;
+
+/// Bidirectional `ModelStreamInfer` stream
+///
+/// 所有请求复用同一条 HTTP/2 stream，响应通过 `id` 与请求对应
+#[pyo3::pyclass(module = "triton_client")]
+pub struct InferStream {
+    sender: std::sync::Mutex<Option<mpsc::UnboundedSender<inference::ModelInferRequest>>>,
+    receiver: tokio::sync::Mutex<mpsc::UnboundedReceiver<StreamResponse>>,
+}
+
+impl InferStream {
+    pub(crate) fn open(client: &crate::Client) -> Result<Self, Error> {
+        let (req_tx, req_rx) = mpsc::unbounded_channel();
+        let (resp_tx, resp_rx) = mpsc::unbounded_channel::<StreamResponse>();
+        let mut inner = client.inner.clone();
+        // 在后台任务中建立 stream：部分服务端在收到第一个请求前不会返回 header，
+        // 若在这里 block_on 会导致死锁
+        crate::TOKIO_RT
+            .get()
+            .context("failed to get tokio runtime")?
+            .spawn(async move {
+                let mut stream = match inner
+                    .model_stream_infer(UnboundedReceiverStream::new(req_rx))
+                    .await
+                {
+                    Ok(response) => response.into_inner(),
+                    Err(status) => {
+                        let _ = resp_tx.send(Err(status));
+                        return;
+                    }
+                };
+                loop {
+                    match stream.message().await {
+                        Ok(Some(message)) => {
+                            if resp_tx.send(Ok(message)).is_err() {
+                                break;
+                            }
+                        }
+                        Ok(None) => break,
+                        Err(status) => {
+                            let _ = resp_tx.send(Err(status));
+                            break;
+                        }
+                    }
+                }
+            });
+        Ok(InferStream {
+            sender: std::sync::Mutex::new(Some(req_tx)),
+            receiver: tokio::sync::Mutex::new(resp_rx),
+        })
+    }
+}
+
+#[pyo3::pymethods]
+impl InferStream {
+    #[doc = "Send an inference request on the stream without waiting for its response."]
+    #[pyo3(signature = (req, raw_inputs=None))]
+    pub fn send(
+        &self,
+        req: pyo3::Bound<'_, pyo3::PyAny>,
+        raw_inputs: Option<Vec<pyo3::Bound<'_, pyo3::PyAny>>>,
+    ) -> Result<(), Error> {
+        let req = crate::request::extract_with_raw_inputs(req.py(), &req, raw_inputs)
+            .map_err(Error::msg)?;
+        let sender = self.sender.lock().map_err(Error::msg)?;
+        sender
+            .as_ref()
+            .context("stream is closed")?
+            .send(req)
+            .map_err(|_| Error::msg("stream is closed"))
+    }
+
+    #[doc = "Wait for the next response. Returns None once the stream has ended."]
+    pub fn recv(
+        &self,
+        py: Python<'_>,
+    ) -> Result<Option<inference::ModelStreamInferResponse>, Error> {
+        let rt = crate::TOKIO_RT.get().context("failed to get tokio runtime")?;
+        // 等待期间释放 GIL，让分发线程之外的 Python 代码继续运行
+        let message = py.detach(|| rt.block_on(async { self.receiver.lock().await.recv().await }));
+        match message {
+            None => Ok(None),
+            Some(Ok(message)) => Ok(Some(message)),
+            Some(Err(status)) => Err(status.into()),
+        }
+    }
+
+    #[doc = "Wait for the next response and split it into (id, response, error_message)."]
+    #[doc = ""]
+    #[doc = "Returns None once the stream has ended."]
+    pub fn poll_response(
+        &self,
+        py: Python<'_>,
+    ) -> Result<Option<(String, Option<inference::ModelInferResponse>, String)>, Error> {
+        // 直接转移 infer_response 的所有权，避免 Python 侧访问属性时克隆整个响应
+        Ok(self.recv(py)?.map(|message| {
+            let response = message.infer_response;
+            let id = response
+                .as_ref()
+                .map(|response| response.id.clone())
+                .unwrap_or_default();
+            (id, response, message.error_message)
+        }))
+    }
+
+    #[doc = "Close the sending half; responses of in-flight requests are still delivered."]
+    pub fn close(&self) -> Result<(), Error> {
+        self.sender.lock().map_err(Error::msg)?.take();
+        Ok(())
+    }
+}
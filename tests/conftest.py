@@ -0,0 +1,14 @@
+"""pytest 配置：tritonclient 包位于 examples 目录下."""
+
+import importlib.util
+import os
+import sys
+
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(_TESTS_DIR), "examples"))
+
+# 仓库根目录下的 triton_client/ 只有 .pyi 存根，会被当成命名空间包导入；
+# 扩展模块未构建时改用 tests/stub 中的替身，使 grpc 侧的纯 Python 逻辑仍能被测试
+_spec = importlib.util.find_spec("triton_client")
+if _spec is None or _spec.origin is None:
+    sys.path.insert(0, os.path.join(_TESTS_DIR, "stub"))
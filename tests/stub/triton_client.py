@@ -0,0 +1,126 @@
+"""测试用的 triton_client 替身，在扩展模块未构建时代替它.
+
+只实现纯 Python 部分的测试会用到的内容：tritonclient.grpc 导入时查找的模块级名称、
+List* 容器和按关键字参数构造的消息类型。不发起任何网络请求。
+"""
+
+import numpy as np
+
+
+class _List:
+    """List* 容器：from_array 拷贝数据，into_array 返回数组."""
+
+    def __init__(self, array: np.ndarray):
+        self._array = array
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "_List":
+        return cls(np.array(array, copy=True))
+
+    def into_array(self) -> np.ndarray:
+        return self._array
+
+
+class ListBool(_List):
+    pass
+
+
+class ListI8(_List):
+    pass
+
+
+class ListI16(_List):
+    pass
+
+
+class ListI32(_List):
+    pass
+
+
+class ListI64(_List):
+    pass
+
+
+class ListU8(_List):
+    pass
+
+
+class ListU16(_List):
+    pass
+
+
+class ListU32(_List):
+    pass
+
+
+class ListU64(_List):
+    pass
+
+
+class ListF32(_List):
+    pass
+
+
+class ListF64(_List):
+    pass
+
+
+def _message(name: str, fields: tuple = ()) -> type:
+    """创建消息类型：声明的字段是 property（与 PyO3 getset 一样可被 JsonView 枚举），
+    其余关键字参数作为普通属性保存."""
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    namespace = {"__init__": __init__, "__module__": __name__}
+    for field in fields:
+        namespace[field] = property(
+            lambda self, field=field: self.__dict__.get("_" + field),
+            lambda self, value, field=field: self.__dict__.__setitem__("_" + field, value),
+        )
+    return type(name, (), namespace)
+
+
+TensorMetadata = _message("TensorMetadata", ("name", "datatype", "shape"))
+ModelMetadataResponse = _message(
+    "ModelMetadataResponse", ("name", "versions", "platform", "inputs", "outputs")
+)
+ModelConfig = _message("ModelConfig")
+ModelConfigResponse = _message("ModelConfigResponse", ("config",))
+InferTensorContents = _message("InferTensorContents")
+InferParameter = _message("InferParameter", ("parameter_choice",))
+InferInputTensor = _message("InferInputTensor", ("name", "datatype", "shape", "contents", "parameters"))
+InferRequestedOutputTensor = _message("InferRequestedOutputTensor", ("name", "parameters"))
+ModelInferRequest = _message("ModelInferRequest")
+ModelInferResponse = _message("ModelInferResponse")
+ModelMetadataRequest = _message("ModelMetadataRequest")
+ModelConfigRequest = _message("ModelConfigRequest")
+RepositoryModelLoadRequest = _message("RepositoryModelLoadRequest")
+RepositoryModelUnloadRequest = _message("RepositoryModelUnloadRequest")
+SystemSharedMemoryRegisterRequest = _message("SystemSharedMemoryRegisterRequest")
+SystemSharedMemoryUnregisterRequest = _message("SystemSharedMemoryUnregisterRequest")
+CudaSharedMemoryUnregisterRequest = _message("CudaSharedMemoryUnregisterRequest")
+PreparedInferRequest = _message("PreparedInferRequest")
+InferStream = _message("InferStream")
+Client = _message("Client")
+
+
+class ParameterChoice:
+    """InferParameter.parameter_choice 的构造函数."""
+
+    @staticmethod
+    def string_param(value: str) -> tuple:
+        return ("string_param", value)
+
+    @staticmethod
+    def uint64_param(value: int) -> tuple:
+        return ("uint64_param", value)
+
+    @staticmethod
+    def int64_param(value: int) -> tuple:
+        return ("int64_param", value)
+
+    @staticmethod
+    def bool_param(value: bool) -> tuple:
+        return ("bool_param", value)
@@ -0,0 +1,189 @@
+"""Tests for BatchingInferenceServerClient."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from tritonclient.grpc import client as client_module
+from tritonclient.grpc import BatchingInferenceServerClient, BatchedInferResult, InferInput, InferResult
+
+
+class FakeResponse:
+    """只带 raw_output_contents 的 FP32 ModelInferResponse."""
+
+    model_name = "m"
+    model_version = ""
+    id = ""
+
+    def __init__(self, arrays):
+        self._arrays = [np.ascontiguousarray(array, dtype=np.float32) for array in arrays.values()]
+        self._names = list(arrays)
+
+    def output_headers(self):
+        return [
+            (name, "FP32", list(array.shape), False)
+            for name, array in zip(self._names, self._arrays)
+        ]
+
+    def take_raw_output(self, index):
+        return self._arrays[index].view(np.uint8).reshape(-1)
+
+
+def make_result(arrays):
+    return InferResult(FakeResponse(arrays))
+
+
+def double_first_input(inputs):
+    """把第一个输入乘 2 作为输出 "out"."""
+    return make_result({"out": np.reshape(inputs[0]._data, inputs[0].shape()) * 2})
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+
+    def fake_infer(self, model_name, inputs, model_version="", outputs=None, request_id="", **kwargs):
+        calls.append((inputs[0].shape(), kwargs))
+        return double_first_input(inputs)
+
+    monkeypatch.setattr(client_module, "_shared_rust_client", lambda *args: object())
+    monkeypatch.setattr(client_module.InferenceServerClient, "infer", fake_infer)
+    return calls
+
+
+def make_input(rows):
+    data = np.asarray(rows, dtype=np.float32)
+    inp = InferInput("x", data.shape, "FP32")
+    inp.set_data_from_numpy(data)
+    return inp
+
+
+def test_concurrent_calls_are_merged_and_split(calls):
+    client = BatchingInferenceServerClient("fake", max_delay_us=200_000)
+    results = {}
+    barrier = threading.Barrier(3)
+
+    def worker(key, rows):
+        barrier.wait()
+        results[key] = client.infer("m", [make_input(rows)]).as_numpy("out")
+
+    threads = [
+        threading.Thread(target=worker, args=("a", [[1, 2]])),
+        threading.Thread(target=worker, args=("b", [[3, 4], [5, 6]])),
+        threading.Thread(target=worker, args=("c", [[7, 8]])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert [shape for shape, _ in calls] == [(4, 2)]
+    np.testing.assert_array_equal(results["a"], [[2, 4]])
+    np.testing.assert_array_equal(results["b"], [[6, 8], [10, 12]])
+    np.testing.assert_array_equal(results["c"], [[14, 16]])
+
+
+def test_groups_are_sent_concurrently(calls, monkeypatch):
+    # 两个不同模型的组都进入发送后才能返回，串行发送时 barrier 会超时
+    in_flight = threading.Barrier(2, timeout=5)
+
+    def fake_infer(self, model_name, inputs, model_version="", outputs=None, request_id="", **kwargs):
+        in_flight.wait()
+        return double_first_input(inputs)
+
+    monkeypatch.setattr(client_module.InferenceServerClient, "infer", fake_infer)
+    client = BatchingInferenceServerClient("fake", max_delay_us=200_000)
+    results = {}
+    barrier = threading.Barrier(2)
+
+    def worker(model_name):
+        barrier.wait()
+        results[model_name] = client.infer(model_name, [make_input([[1, 2]])]).as_numpy("out")
+
+    threads = [threading.Thread(target=worker, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    np.testing.assert_array_equal(results["a"], [[2, 4]])
+    np.testing.assert_array_equal(results["b"], [[2, 4]])
+
+
+def test_unsplittable_outputs_fall_back_to_single_calls(calls, monkeypatch):
+    def fake_infer(self, model_name, inputs, model_version="", outputs=None, request_id="", **kwargs):
+        calls.append((inputs[0].shape(), kwargs))
+        # 输出按行求和，第一维不随 batch 变化
+        data = np.reshape(inputs[0]._data, inputs[0].shape())
+        return make_result({"out": data.sum(axis=0, keepdims=True)})
+
+    monkeypatch.setattr(client_module.InferenceServerClient, "infer", fake_infer)
+    client = BatchingInferenceServerClient("fake", max_delay_us=200_000)
+    results = {}
+    barrier = threading.Barrier(2)
+
+    def worker(key, rows):
+        barrier.wait()
+        results[key] = client.infer("m", [make_input(rows)]).as_numpy("out")
+
+    threads = [
+        threading.Thread(target=worker, args=("a", [[1, 2]])),
+        threading.Thread(target=worker, args=("b", [[3, 4]])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert sorted(shape for shape, _ in calls) == [(1, 2), (1, 2), (2, 2)]
+    np.testing.assert_array_equal(results["a"], [[1, 2]])
+    np.testing.assert_array_equal(results["b"], [[3, 4]])
+
+
+def test_calls_with_options_are_sent_directly(calls):
+    client = BatchingInferenceServerClient("fake", max_delay_us=200_000)
+    result = client.infer("m", [make_input([[1, 2]])], priority=3, timeout=1.0)
+    client.close()
+    assert isinstance(result, InferResult)
+    assert calls == [((1, 2), {"priority": 3, "timeout": 1.0})]
+
+
+def test_calls_after_close_are_sent_directly(calls):
+    client = BatchingInferenceServerClient("fake")
+    client.close()
+    result = client.infer("m", [make_input([[1, 2]])])
+    assert isinstance(result, InferResult)
+    assert not client._batcher.is_alive()
+
+
+def test_single_call_returns_plain_result(calls):
+    client = BatchingInferenceServerClient("fake", max_delay_us=1000)
+    result = client.infer("m", [make_input([[1, 2]])])
+    client.close()
+    assert isinstance(result, InferResult)
+
+
+def test_batched_result_accessors_cover_callers_rows():
+    result = make_result({"out": [[1, 2], [3, 4], [5, 6]], "sum": [[3], [7], [11]]})
+    mine = BatchedInferResult(
+        result, {name: result.as_numpy(name)[1:3] for name in ("out", "sum")}
+    )
+    arrays = mine.as_numpy_all()
+    assert set(arrays) == {"out", "sum"}
+    np.testing.assert_array_equal(arrays["out"], [[3, 4], [5, 6]])
+    np.testing.assert_array_equal(arrays["sum"], [[7], [11]])
+
+    output = mine.get_output("out")
+    assert (output.name, output.shape, output.datatype) == ("out", (2, 2), "FP32")
+    np.testing.assert_array_equal(output.as_numpy(), [[3, 4], [5, 6]])
+    assert mine.get_output("out", as_json=True) == {"name": "out", "shape": [2, 2], "datatype": "FP32"}
+    assert mine.get_output("missing") is None
+
+    response = mine.get_response(as_json=True)
+    assert response["model_name"] == "m"
+    assert [out["shape"] for out in response["outputs"]] == [[2, 2], [2, 1]]
+    assert mine.get_response() is result.get_response()
@@ -0,0 +1,23 @@
+"""Tests for converting InferInput data into request items."""
+
+import numpy as np
+
+from tritonclient.grpc import InferInput
+
+
+def test_fp16_float32_data_is_sent_without_narrowing():
+    # 0.1 无法用 float16 精确表示，先截断为 float16 会丢失精度
+    data = np.array([[0.1, 1.0 / 3.0]], dtype=np.float32)
+    inp = InferInput("x", [1, 2], "FP16").set_data_from_numpy(data)
+    name, datatype, shape, flat_data = inp._to_rust_item()
+    assert (name, datatype) == ("x", "FP16")
+    assert flat_data.dtype == np.float32
+    np.testing.assert_array_equal(flat_data, data.reshape(-1))
+
+
+def test_fp16_data_is_upcast_to_float32():
+    data = np.array([0.5, -2.0, 65504.0], dtype=np.float16)
+    inp = InferInput("x", [3], "FP16").set_data_from_numpy(data)
+    flat_data = inp._to_rust_item()[3]
+    assert flat_data.dtype == np.float32
+    np.testing.assert_array_equal(flat_data, data.astype(np.float32))
@@ -0,0 +1,74 @@
+"""Tests for mapping InferResult outputs to raw_output_contents."""
+
+import numpy as np
+import pytest
+
+from tritonclient.grpc import client as client_module
+from tritonclient.grpc import InferRequestedOutput, InferResult
+
+
+class FakeResponse:
+    """FP32 输出；raw_output_contents 只包含 raw 中给出的输出，与 Triton 一致."""
+
+    def __init__(self, shapes, raw):
+        self._shapes = shapes
+        self._raw = [np.ascontiguousarray(array, dtype=np.float32) for array in raw]
+
+    def output_headers(self):
+        return [(name, "FP32", list(shape), False) for name, shape in self._shapes.items()]
+
+    def take_raw_output(self, index):
+        if index >= len(self._raw):
+            return None
+        return self._raw[index].view(np.uint8).reshape(-1)
+
+
+class FakeRustClient:
+    def __init__(self, response):
+        self.response = response
+
+    def model_infer(self, request, raw_inputs=None):
+        return self.response
+
+
+def requested_outputs():
+    shm_out = InferRequestedOutput("shm_out")
+    shm_out.set_shared_memory("region", 8)
+    return [shm_out, InferRequestedOutput("out")]
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    def make(response):
+        rust_client = FakeRustClient(response)
+        monkeypatch.setattr(client_module, "_shared_rust_client", lambda *args: rust_client)
+        client = client_module.InferenceServerClient("fake")
+        monkeypatch.setattr(client, "_build_request", lambda *args: (None, None))
+        return client
+
+    return make
+
+
+@pytest.mark.parametrize("accessor", ["as_numpy", "get_output"])
+def test_shm_output_does_not_shift_later_raw_outputs(make_client, accessor):
+    out = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+    # shm_out 写入共享内存，raw_output_contents 中只有 out 一项
+    response = FakeResponse({"shm_out": (2,), "out": (3,)}, [out])
+    client = make_client(response)
+
+    result = client.infer("m", [], outputs=requested_outputs())
+
+    if accessor == "as_numpy":
+        values = {name: result.as_numpy(name) for name in ("out", "shm_out")}
+    else:
+        values = {name: result.get_output(name).as_numpy() for name in ("out", "shm_out")}
+    np.testing.assert_array_equal(values["out"], out)
+    assert values["shm_out"] is None
+
+
+def test_raw_outputs_map_by_position_without_shm():
+    first = np.array([1.0], dtype=np.float32)
+    second = np.array([2.0, 3.0], dtype=np.float32)
+    result = InferResult(FakeResponse({"a": (1,), "b": (2,)}, [first, second]))
+    np.testing.assert_array_equal(result.as_numpy("b"), second)
+    np.testing.assert_array_equal(result.as_numpy("a"), first)
@@ -0,0 +1,45 @@
+"""Tests for JsonView."""
+
+import json
+
+import pytest
+import triton_client
+
+from tritonclient.grpc import JsonView
+
+
+def make_metadata():
+    return triton_client.ModelMetadataResponse(
+        name="model",
+        versions=["1", "2"],
+        platform="onnxruntime_onnx",
+        inputs=[triton_client.TensorMetadata(name="x", datatype="FP32", shape=[-1, 3])],
+        outputs=[],
+    )
+
+
+def test_fields_are_read_lazily_and_cached():
+    view = JsonView(make_metadata())
+    assert view["name"] == "model"
+    assert view["versions"] == ["1", "2"]
+    assert "name" in view._cache and "platform" not in view._cache
+    assert view["versions"] is view["versions"]
+
+
+def test_nested_messages_are_views():
+    view = JsonView(make_metadata())
+    (tensor,) = view["inputs"]
+    assert isinstance(tensor, JsonView)
+    assert tensor["shape"] == [-1, 3]
+
+
+def test_mapping_protocol_and_to_dict():
+    view = JsonView(make_metadata())
+    assert set(view) >= {"name", "versions", "platform", "inputs", "outputs"}
+    assert len(view) == len(list(view))
+    assert view.get("missing") is None
+    with pytest.raises(KeyError):
+        view["missing"]
+    plain = view.to_dict()
+    assert plain["inputs"] == [{"name": "x", "datatype": "FP32", "shape": [-1, 3]}]
+    json.dumps(plain)
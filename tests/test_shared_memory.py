@@ -0,0 +1,307 @@
+"""Tests for tritonclient.utils.shared_memory."""
+
+import os
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from tritonclient.utils import shared_memory as shm
+
+
+@pytest.fixture
+def unregistered(monkeypatch):
+    """记录取消登记的共享内存名称，并照常通知 resource_tracker."""
+    names = []
+    unregister = shm.resource_tracker.unregister
+
+    def record(name, rtype):
+        names.append(name)
+        unregister(name, rtype)
+
+    monkeypatch.setattr(shm.resource_tracker, "unregister", record)
+    return names
+
+
+@pytest.fixture
+def region():
+    region = shm.create_shared_memory_region("test", None, 4096)
+    yield region
+    shm.destroy_shared_memory_region(region)
+    if region._shm is not None:
+        region._shm.close()
+
+
+@pytest.fixture
+def arena():
+    arena = shm.SharedMemoryArena(1 << 20)
+    yield arena
+    arena.destroy()
+
+
+def _unlink_key(shm_key):
+    """删除句柄已关闭的区域."""
+    mapped = shared_memory.SharedMemory(name=shm_key)
+    mapped.unlink()
+    mapped.close()
+
+
+def _fail_touch_pages(self):
+    raise AssertionError("prefault fell back to touching every page")
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="MADV_POPULATE_WRITE is Linux only")
+def test_prefault_uses_madvise_on_linux(monkeypatch):
+    monkeypatch.setattr(shm.SharedMemoryRegion, "_touch_pages", _fail_touch_pages)
+    region = shm.create_shared_memory_region("test", None, 1 << 20, prefault=True)
+    shm.destroy_shared_memory_region(region)
+
+
+def test_prefault_falls_back_when_madvise_is_rejected(monkeypatch):
+    touched = []
+    monkeypatch.setattr(shm, "_MADV_POPULATE_WRITE", -1)
+    monkeypatch.setattr(shm.SharedMemoryRegion, "_touch_pages", lambda self: touched.append(self))
+    region = shm.create_shared_memory_region("test", None, 1 << 16, prefault=True)
+    shm.destroy_shared_memory_region(region)
+    assert touched == [region]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="resource_tracker only tracks POSIX shared memory")
+def test_created_region_is_untracked_when_tracker_disabled(monkeypatch, unregistered):
+    monkeypatch.setattr(shm, "SHM_USE_RESOURCE_TRACKER", False)
+    region = shm.create_shared_memory_region("test", None, 4096)
+    name = region._shm._name
+    assert unregistered == [name]
+    shm.destroy_shared_memory_region(region)
+    # 未登记的区域直接删除，不再通知 resource_tracker
+    assert unregistered == [name]
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=region.key)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="resource_tracker only tracks POSIX shared memory")
+def test_created_region_stays_tracked_by_default(unregistered):
+    region = shm.create_shared_memory_region("test", None, 4096)
+    name = region._shm._name
+    assert unregistered == []
+    shm.destroy_shared_memory_region(region)
+    assert unregistered == [name]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="resource_tracker only tracks POSIX shared memory")
+def test_attached_region_is_untracked(monkeypatch, unregistered):
+    # 创建方不在 resource_tracker 中登记，相当于由其他进程创建
+    monkeypatch.setattr(shm, "SHM_USE_RESOURCE_TRACKER", False)
+    owner = shm.create_shared_memory_region("test", None, 4096)
+    unregistered.clear()
+    attached = shm.create_shared_memory_region("test", owner.key, 4096)
+    assert unregistered == [attached._shm._name]
+    attached.close()
+    shm.destroy_shared_memory_region(owner)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="resource_tracker only tracks POSIX shared memory")
+def test_attach_keeps_registration_of_creator_in_same_process(unregistered):
+    owner = shm.create_shared_memory_region("test", None, 4096)
+    name = owner._shm._name
+    attached = shm.create_shared_memory_region("test", owner.key, 4096)
+    assert unregistered == []
+    attached.close()
+    shm.destroy_shared_memory_region(owner)
+    assert unregistered == [name]
+
+
+def test_arena_slices_work_with_region_functions(arena):
+    piece = arena.alloc(24)
+    shm.set_shared_memory_region(piece, [np.arange(3, dtype=np.float64)])
+    np.testing.assert_array_equal(shm.get_contents_as_numpy(piece, np.float64, (3,)), [0, 1, 2])
+    np.testing.assert_array_equal(arena.region.as_ndarray(np.float64, (3,), piece.offset), [0, 1, 2])
+    with pytest.raises(shm.SharedMemoryException):
+        shm.get_contents_as_numpy(piece, np.float64, (4,))
+
+
+def test_arena_out_of_space():
+    with shm.SharedMemoryArena(128) as arena:
+        arena.alloc(64)
+        arena.alloc(64)
+        with pytest.raises(shm.SharedMemoryException):
+            arena.alloc(1)
+
+
+def test_arena_rejects_alloc_and_free_after_close():
+    arena = shm.SharedMemoryArena(4096)
+    piece = arena.alloc(10)
+    arena.close()
+    try:
+        with pytest.raises(shm.SharedMemoryException):
+            arena.alloc(10)
+        with pytest.raises(shm.SharedMemoryException):
+            arena.free(piece)
+    finally:
+        _unlink_key(arena.key)
+
+
+def test_arena_alloc_is_aligned_and_bucketed(arena):
+    first = arena.alloc(10)
+    second = arena.alloc(100)
+    assert (first.offset, first.byte_size) == (0, 10)
+    assert second.offset == 64
+    assert arena.used == 64 + 128
+
+
+def test_arena_free_reuses_block(arena):
+    first = arena.alloc(100)
+    arena.alloc(100)
+    arena.free(first)
+    assert arena.alloc(80).offset == first.offset
+    assert arena.alloc(80).offset == 256
+
+
+def test_arena_rejects_double_free(arena):
+    piece = arena.alloc(100)
+    arena.free(piece)
+    with pytest.raises(shm.SharedMemoryException):
+        arena.free(piece)
+    assert arena.alloc(100).offset != arena.alloc(100).offset
+
+
+def test_arena_rejects_foreign_and_stale_slices(arena):
+    other = shm.SharedMemoryArena(4096)
+    try:
+        with pytest.raises(shm.SharedMemoryException):
+            arena.free(other.alloc(10))
+    finally:
+        other.destroy()
+    stale = arena.alloc(10)
+    arena.reset()
+    with pytest.raises(shm.SharedMemoryException):
+        arena.free(stale)
+    assert arena.alloc(10).offset == 0
+
+
+def test_ring_push_pop(region):
+    with shm.SharedMemoryRing(region, 64, 4) as ring:
+        assert ring.pop() is None
+        assert ring.push(np.arange(3, dtype=np.int64))
+        assert len(ring) == 1
+        np.testing.assert_array_equal(ring.pop().view(np.int64), [0, 1, 2])
+        out = np.zeros(3, dtype=np.int64)
+        ring.push(np.array([5, 6, 7]))
+        assert ring.pop(out) is out
+        np.testing.assert_array_equal(out, [5, 6, 7])
+
+
+def test_ring_full_and_wraps_around(region):
+    with shm.SharedMemoryRing(region, 8, 2) as ring:
+        for round_ in range(3):
+            assert ring.push(np.array([round_, 0]).astype(np.int32))
+            assert ring.push(np.array([round_, 1]).astype(np.int32))
+            assert not ring.push(np.array([9, 9]).astype(np.int32))
+            assert ring.pop().view(np.int32).tolist() == [round_, 0]
+            assert ring.pop().view(np.int32).tolist() == [round_, 1]
+
+
+def test_ring_rejects_oversized_message_and_bad_out(region):
+    with shm.SharedMemoryRing(region, 8, 2) as ring:
+        with pytest.raises(shm.SharedMemoryException):
+            ring.push(np.zeros(2, dtype=np.float64))
+        ring.push(np.arange(2, dtype=np.int32))
+        with pytest.raises(shm.SharedMemoryException):
+            ring.pop(np.zeros((2, 2), dtype=np.int32)[:, 0])
+        with pytest.raises(shm.SharedMemoryException):
+            ring.pop(np.zeros(1, dtype=np.int32))
+        assert len(ring) == 1
+
+
+def test_ring_rejects_corrupted_length(region):
+    with shm.SharedMemoryRing(region, 8, 2) as ring:
+        ring.push(np.arange(2, dtype=np.int32))
+        # 第一个槽位紧跟在 64 字节的控制块之后，开头 8 字节是消息长度
+        length = region.as_ndarray(np.uint64, (1,), 64)
+        length[0] = 9
+        del length
+        with pytest.raises(shm.SharedMemoryException):
+            ring.pop()
+        assert len(ring) == 1
+
+
+def test_ring_is_shared_between_handles(region):
+    other = shm.create_shared_memory_region("test", region.key, region.byte_size)
+    producer = shm.SharedMemoryRing(region, 16, 4)
+    consumer = shm.SharedMemoryRing(other, 16, 4)
+    producer.push(np.arange(4, dtype=np.int16))
+    assert consumer.pop().view(np.int16).tolist() == [0, 1, 2, 3]
+    assert len(producer) == 0
+    producer.close()
+    consumer.close()
+    other.close()
+
+
+def test_pool_reuses_released_region():
+    region = shm.acquire_shared_memory_region(100)
+    assert region.byte_size == 4096
+    shm.release_shared_memory_region(region)
+    again = shm.acquire_shared_memory_region(200)
+    assert again is region
+    with pytest.raises(shm.SharedMemoryException):
+        shm.release_shared_memory_region(shm.SharedMemoryRegion("x", "/x", 4096))
+    shm.release_shared_memory_region(again)
+    with pytest.raises(shm.SharedMemoryException):
+        shm.release_shared_memory_region(again)
+
+
+def test_pool_discards_closed_region(caplog):
+    region = shm.acquire_shared_memory_region(100)
+    region.close()
+    shm.release_shared_memory_region(region)
+    if os.path.isdir("/dev/shm"):
+        assert not os.path.exists(f"/dev/shm{region.key}")
+    assert region.name in caplog.text
+    fresh = shm.acquire_shared_memory_region(100)
+    assert fresh is not region
+    shm.release_shared_memory_region(fresh)
+
+
+def test_drain_pool_warns_about_each_region(caplog):
+    idle = shm.acquire_shared_memory_region(100)
+    shm.release_shared_memory_region(idle)
+    in_use = shm.acquire_shared_memory_region(100)
+    shm._drain_pool()
+    warned = [record.getMessage() for record in caplog.records if record.levelname == "WARNING"]
+    assert any(idle.name in message for message in warned)
+    assert any(in_use.name in message for message in warned)
+    mapped = shm.mapped_shared_memory_regions()
+    assert idle.key not in mapped and in_use.key not in mapped
+
+
+def test_close_with_live_view_keeps_region_usable():
+    region = shm.create_shared_memory_region("test", None, 4096)
+    view = region.as_ndarray(np.uint8, (4,))
+    with pytest.raises(shm.SharedMemoryException):
+        region.close()
+    # 关闭失败后句柄仍然可用
+    shm.set_shared_memory_region(region, [np.arange(4, dtype=np.uint8)])
+    np.testing.assert_array_equal(view, [0, 1, 2, 3])
+    assert region.key in shm.mapped_shared_memory_regions()
+    del view
+    shm.destroy_shared_memory_region(region)
+    assert region.key not in shm.mapped_shared_memory_regions()
+
+
+def test_as_ndarray_writes_through_and_rejects_negative_offset(region):
+    view = region.as_ndarray(np.int32, (2,), 8)
+    view[:] = [7, 9]
+    del view
+    np.testing.assert_array_equal(shm.get_contents_as_numpy(region, np.int32, (2,), 8), [7, 9])
+    with pytest.raises(ValueError):
+        region.as_ndarray(np.uint8, (4,), -1)
+
+
+def test_set_shared_memory_region_aligns_offsets(region):
+    offsets = shm.set_shared_memory_region(
+        region, [np.arange(3, dtype=np.int32), np.ones(2, dtype=np.float64)], alignment=8
+    )
+    assert offsets == [0, 16]
+    np.testing.assert_array_equal(shm.get_contents_as_numpy(region, np.int32, (3,)), [0, 1, 2])
+    np.testing.assert_array_equal(shm.get_contents_as_numpy(region, np.float64, (2,), 16), [1, 1])
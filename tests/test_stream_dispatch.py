@@ -0,0 +1,155 @@
+"""Tests for async_infer response dispatching over the shared stream."""
+
+import queue
+import threading
+
+import pytest
+
+from tritonclient.grpc import client as client_module
+from tritonclient.grpc import InferRequestedOutput, InferResult
+
+TIMEOUT = 5
+
+
+class FakeStream:
+    """按测试的指示返回响应的 InferStream."""
+
+    def __init__(self):
+        self.responses: "queue.Queue" = queue.Queue()
+        self.sent = []
+
+    def send(self, request, raw_inputs=None):
+        self.sent.append(request)
+
+    def poll_response(self):
+        item = self.responses.get(timeout=TIMEOUT)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def close(self):
+        self.responses.put(None)
+
+
+class FakeResponse:
+    def output_headers(self):
+        return []
+
+
+class FakeRustClient:
+    def __init__(self):
+        self.streams = []
+
+    def model_stream_infer(self):
+        stream = FakeStream()
+        self.streams.append(stream)
+        return stream
+
+
+class Recorder:
+    """记录回调结果，回调被调用时通知等待方."""
+
+    def __init__(self, raises=False):
+        self.calls = []
+        self.event = threading.Event()
+        self.raises = raises
+
+    def __call__(self, result, error):
+        self.calls.append((result, error))
+        self.event.set()
+        if self.raises:
+            raise RuntimeError("callback failure")
+
+    def wait(self):
+        assert self.event.wait(TIMEOUT)
+        return self.calls[-1]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    rust_client = FakeRustClient()
+    monkeypatch.setattr(client_module, "_shared_rust_client", lambda *args: rust_client)
+    client = client_module.InferenceServerClient("fake")
+    monkeypatch.setattr(client, "_build_request", lambda *args: (args[-1], None))
+    yield client
+    client.close()
+
+
+def test_responses_are_routed_by_id(client):
+    first, second = Recorder(), Recorder()
+    client.async_infer("m", [], first, request_id="a")
+    client.async_infer("m", [], second, request_id="b")
+    stream = client._rust_client.streams[0]
+    assert stream.sent == ["a", "b"]
+    stream.responses.put(("b", FakeResponse(), ""))
+    result, error = second.wait()
+    assert isinstance(result, InferResult) and error is None
+    stream.responses.put(("a", None, "model failed"))
+    result, error = first.wait()
+    assert result is None and str(error) == "model failed"
+
+
+def test_unmatched_error_is_not_given_to_another_request(client, caplog):
+    pending, later = Recorder(), Recorder()
+    client.async_infer("m", [], pending, request_id="a")
+    stream = client._rust_client.streams[0]
+    stream.responses.put(("", None, "unknown failure"))
+    client.async_infer("m", [], later, request_id="b")
+    stream.responses.put(("b", FakeResponse(), ""))
+    later.wait()
+    assert pending.calls == []
+    assert "unknown failure" in caplog.text
+    stream.responses.put(("a", FakeResponse(), ""))
+    assert pending.wait()[1] is None
+
+
+def test_stream_end_fails_pending_and_reopens(client):
+    failing, other = Recorder(raises=True), Recorder()
+    client.async_infer("m", [], failing, request_id="a")
+    client.async_infer("m", [], other, request_id="b")
+    client._rust_client.streams[0].responses.put(None)
+    # 一个回调抛出异常不影响其他回调收到通知
+    assert isinstance(failing.wait()[1], RuntimeError)
+    assert isinstance(other.wait()[1], RuntimeError)
+
+    retry = Recorder()
+    client.async_infer("m", [], retry, request_id="c")
+    assert len(client._rust_client.streams) == 2
+    client._rust_client.streams[1].responses.put(("c", FakeResponse(), ""))
+    assert retry.wait()[1] is None
+
+
+def test_stream_error_fails_pending(client):
+    callback = Recorder()
+    client.async_infer("m", [], callback, request_id="a")
+    client._rust_client.streams[0].responses.put(ConnectionError("reset"))
+    assert isinstance(callback.wait()[1], ConnectionError)
+
+
+def test_cancelled_request_is_not_called(client):
+    callback = Recorder()
+    context = client.async_infer("m", [], callback, request_id="a")
+    context.cancel()
+    stream = client._rust_client.streams[0]
+    stream.responses.put(("a", FakeResponse(), ""))
+    marker = Recorder()
+    client.async_infer("m", [], marker, request_id="b")
+    stream.responses.put(("b", FakeResponse(), ""))
+    marker.wait()
+    assert callback.calls == []
+
+
+def test_duplicate_request_id_is_rejected(client):
+    client.async_infer("m", [], Recorder(), request_id="a")
+    with pytest.raises(ValueError):
+        client.async_infer("m", [], Recorder(), request_id="a")
+
+
+def test_shm_outputs_are_passed_to_the_result(client):
+    recorder = Recorder()
+    shm_out = InferRequestedOutput("shm_out")
+    shm_out.set_shared_memory("region", 8)
+    client.async_infer("m", [], recorder, outputs=[shm_out], request_id="a")
+    client._rust_client.streams[0].responses.put(("a", FakeResponse(), ""))
+    result, _ = recorder.wait()
+    assert result._shm_outputs == frozenset({"shm_out"})
@@ -3,7 +3,7 @@ High-performance Triton inference client
 """
 from __future__ import annotations
 from . import triton_client
-__all__: list = ['__doc__', 'Client', 'ServerLiveResponse', 'ServerReadyResponse', 'ModelReadyRequest', 'ModelReadyResponse', 'ServerMetadataResponse', 'ModelConfig', 'ModelMetadataRequest', 'ModelMetadataResponse', 'ModelInferRequest', 'ModelInferResponse', 'ModelConfigRequest', 'ModelConfigResponse', 'ModelStatisticsRequest', 'ModelStatisticsResponse', 'TraceSettingRequest', 'TraceSettingResponse', 'InferParameter', 'InferTensorContents', 'ModelRepositoryParameter', 'RepositoryIndexRequest', 'RepositoryIndexResponse', 'RepositoryModelLoadRequest', 'RepositoryModelLoadResponse', 'RepositoryModelUnloadRequest', 'RepositoryModelUnloadResponse', 'SystemSharedMemoryStatusRequest', 'SystemSharedMemoryStatusResponse', 'SystemSharedMemoryRegisterRequest', 'SystemSharedMemoryRegisterResponse', 'SystemSharedMemoryUnregisterRequest', 'SystemSharedMemoryUnregisterResponse', 'CudaSharedMemoryStatusRequest', 'CudaSharedMemoryStatusResponse', 'CudaSharedMemoryRegisterRequest', 'CudaSharedMemoryRegisterResponse', 'CudaSharedMemoryUnregisterRequest', 'CudaSharedMemoryUnregisterResponse', 'ParameterChoice', 'TensorMetadata', 'ParameterChoice', 'InferInputTensor', 'RegionStatus', 'InferRequestedOutputTensor', 'InferOutputTensor', 'ModelIndex', 'ListBool', 'ListI8', 'ListI16', 'ListI32', 'ListI64', 'ListU8', 'ListU16', 'ListU32', 'ListU64', 'ListF32', 'ListF64']
+__all__: list = ['__doc__', 'Client', 'InferStream', 'PreparedInferRequest', 'ResponseBody', 'ServerLiveResponse', 'ServerReadyResponse', 'ModelReadyRequest', 'ModelReadyResponse', 'ServerMetadataResponse', 'ModelConfig', 'ModelMetadataRequest', 'ModelMetadataResponse', 'ModelInferRequest', 'ModelInferResponse', 'ModelStreamInferResponse', 'ModelConfigRequest', 'ModelConfigResponse', 'ModelStatisticsRequest', 'ModelStatisticsResponse', 'TraceSettingRequest', 'TraceSettingResponse', 'InferParameter', 'InferTensorContents', 'ModelRepositoryParameter', 'RepositoryIndexRequest', 'RepositoryIndexResponse', 'RepositoryModelLoadRequest', 'RepositoryModelLoadResponse', 'RepositoryModelUnloadRequest', 'RepositoryModelUnloadResponse', 'SystemSharedMemoryStatusRequest', 'SystemSharedMemoryStatusResponse', 'SystemSharedMemoryRegisterRequest', 'SystemSharedMemoryRegisterResponse', 'SystemSharedMemoryUnregisterRequest', 'SystemSharedMemoryUnregisterResponse', 'CudaSharedMemoryStatusRequest', 'CudaSharedMemoryStatusResponse', 'CudaSharedMemoryRegisterRequest', 'CudaSharedMemoryRegisterResponse', 'CudaSharedMemoryUnregisterRequest', 'CudaSharedMemoryUnregisterResponse', 'ParameterChoice', 'TensorMetadata', 'ParameterChoice', 'InferInputTensor', 'RegionStatus', 'InferRequestedOutputTensor', 'InferOutputTensor', 'ModelIndex', 'ListBool', 'ListI8', 'ListI16', 'ListI32', 'ListI64', 'ListU8', 'ListU16', 'ListU32', 'ListU64', 'ListF32', 'ListF64', 'write_buffers', 'atomic_load_u64', 'atomic_store_u64']
 class Client:
     """
     Triton Client
@@ -29,18 +29,50 @@ class Client:
         """
         Get model configuration.
         """
-    def model_infer(self, req):
+    def model_infer(self, req, raw_inputs = None):
         """
         Perform inference using a specific model.
+        
+        `raw_inputs` (optional) are appended to `raw_input_contents` directly from their buffers.
+        """
+    def model_infer_soa(self, model_name, model_version, id, input_names, input_datatypes, input_shapes, input_buffers, output_names):
+        """
+        Perform inference from parallel input/output sequences in a single call.
         """
     def model_metadata(self, req):
         """
         Get model metadata.
         """
+    def model_stream_infer(self):
+        """
+        Open a bidirectional ModelStreamInfer stream.
+        """
+    def model_infer_async(self, req, raw_inputs = None):
+        """
+        Perform inference using a specific model, returning an awaitable.
+        """
+    def model_infer_prepared(self, prepared, buffers):
+        """
+        Perform inference with a prepared request, binding only the raw input buffers.
+        """
+    def model_infer_raw_outputs(self, req, raw_inputs = None):
+        """
+        Perform inference, decoding only the raw outputs of the response.
+        
+        Returns the undecoded response body as a read-only ResponseBody (buffer protocol,
+        not copied) together with (name, datatype, shape, start, end) of each raw output
+        within it.
+        """
     def model_ready(self, req):
         """
         Check readiness of a model in the inference server.
         """
+    def model_status(self, model_name, model_version):
+        """
+        Get readiness, metadata, configuration and statistics of a model concurrently.
+        
+        The four requests share one HTTP/2 connection and are sent at once, costing one round trip.
+        """
     def model_statistics(self, req):
         """
         Get the cumulative inference statistics for a model.
@@ -53,10 +85,22 @@ class Client:
         """
         Load or reload a model from a repository.
         """
+    def repository_model_load_many(self, model_names):
+        """
+        Load or reload several models concurrently over the shared connection.
+        
+        Returns one entry per model, in order: None on success, otherwise the error message.
+        """
     def repository_model_unload(self, req):
         """
         Unload a model.
         """
+    def repository_model_unload_many(self, model_names):
+        """
+        Unload several models concurrently over the shared connection.
+        
+        Returns one entry per model, in order: None on success, otherwise the error message.
+        """
     def server_live(self):
         """
         Check liveness of the inference server.
@@ -69,6 +113,12 @@ class Client:
         """
         Check readiness of the inference server.
         """
+    def server_status(self):
+        """
+        Check liveness and readiness and get metadata of the server concurrently.
+        
+        The three requests share one HTTP/2 connection and are sent at once, costing one round trip.
+        """
     def system_shared_memory_register(self, req):
         """
         Register a system-shared-memory region.
@@ -213,6 +263,30 @@ class InferOutputTensor:
         ...
     def Take_shape(self):
         ...
+class InferStream:
+    """
+    Bidirectional `ModelStreamInfer` stream
+    
+    所有请求复用同一条 HTTP/2 stream，响应通过 `id` 与请求对应
+    """
+    def close(self):
+        """
+        Close the sending half; responses of in-flight requests are still delivered.
+        """
+    def poll_response(self):
+        """
+        Wait for the next response and split it into (id, response, error_message).
+        
+        Returns None once the stream has ended.
+        """
+    def recv(self):
+        """
+        Wait for the next response. Returns None once the stream has ended.
+        """
+    def send(self, req, raw_inputs = None):
+        """
+        Send an inference request on the stream without waiting for its response.
+        """
 class InferParameter:
     """
     @@
@@ -278,10 +352,22 @@ class InferTensorContents:
         ...
     def Replace_int_contents(self, val):
         ...
+    def Replace_int_contents_from_array(self, data):
+        """
+        Replace `int_contents` with a 1-D int8, int16 or int32 numpy array.
+        
+        窄整数在 Rust 侧逐个扩展为 i32，Python 侧无需先 astype 再拷贝更宽的数据
+        """
     def Replace_uint64_contents(self, val):
         ...
     def Replace_uint_contents(self, val):
         ...
+    def Replace_uint_contents_from_array(self, data):
+        """
+        Replace `uint_contents` with a 1-D uint8, uint16 or uint32 numpy array.
+        
+        窄整数在 Rust 侧逐个扩展为 u32，Python 侧无需先 astype 再拷贝更宽的数据
+        """
     def Set_bool_contents(self, list):
         ...
     def Set_fp32_contents(self, list):
@@ -1046,6 +1132,19 @@ class ModelInferRequest:
         """
         Create and return a new object.  See help(type) for accurate signature.
         """
+    def add_raw_input(self, data):
+        """
+        Append one entry to `raw_input_contents` from any object exposing a byte buffer.
+        
+        直接读取 buffer protocol 拷贝一次，避免先 `tobytes()` 再转换为 `Vec<u8>` 的两次拷贝
+        """
+    def extend_inputs(self, items):
+        """
+        Append all inputs in one call.
+        
+        每一项是 `InferInputTensor`，或 `(name, datatype, shape, data)` 元组：
+        后者由 Rust 按 datatype 直接从一维 numpy 数组构建 contents，省去逐个输入的 FFI 往返
+        """
 class ModelInferResponse:
     """
     @@
@@ -1059,6 +1158,24 @@ class ModelInferResponse:
         """
         Create and return a new object.  See help(type) for accurate signature.
         """
+    def take_raw_output(self, index):
+        """
+        Move one entry of `raw_output_contents` into a numpy `uint8` array.
+        
+        直接转移 `Vec<u8>` 的所有权，不拷贝数据；索引越界时返回 None
+        """
+    def output_headers(self):
+        """
+        Describe each output as `(name, datatype, shape, has_contents)`.
+        
+        `outputs` 的 getter 会克隆包括 contents 在内的整个列表，这里只复制描述信息
+        """
+    def take_output_contents(self, index):
+        """
+        Move the `contents` of one output out of the response.
+        
+        转移所有权而不是克隆张量数据；之后该输出的 contents 为 None，索引越界时返回 None
+        """
 class ModelMetadataRequest:
     """
     @@
@@ -1150,6 +1267,19 @@ class ModelStatisticsResponse:
         """
         Create and return a new object.  See help(type) for accurate signature.
         """
+class ModelStreamInferResponse:
+    """
+    @@
+    @@.. cpp:var:: message ModelStreamInferResponse
+    @@
+    @@   Response message for ModelStreamInfer.
+    @@
+    """
+    @staticmethod
+    def __new__(type, *args, **kwargs):
+        """
+        Create and return a new object.  See help(type) for accurate signature.
+        """
 class ParameterChoice:
     """
     @@  .. cpp:var:: oneof parameter_choice
@@ -1182,6 +1312,17 @@ class ParameterChoice:
     @classmethod
     def uint64_param(cls, value):
         ...
+class PreparedInferRequest:
+    """
+    Pre-built `ModelInferRequest` reused across inference calls
+    
+    模型名、版本、输入输出描述只构建一次，每次推理只替换 `raw_input_contents`
+    """
+    @staticmethod
+    def __new__(type, *args, **kwargs):
+        """
+        Create and return a new object.  See help(type) for accurate signature.
+        """
 class RegionStatus:
     """
     @@
@@ -1273,6 +1414,17 @@ class RepositoryModelUnloadResponse:
         """
         Create and return a new object.  See help(type) for accurate signature.
         """
+class ResponseBody:
+    """
+    Undecoded `ModelInfer` response body, exposed to Python through the buffer protocol.
+    
+    持有解码器返回的 `Bytes`，`memoryview` / `np.frombuffer` 直接引用其中的数据，不拷贝；
+    导出的 buffer 只读，并持有该对象的引用，所有视图释放前数据一直有效
+    """
+    def __len__(self):
+        """
+        Return len(self).
+        """
 class ServerLiveResponse:
     """
     @@
@@ -1437,3 +1589,21 @@ class TraceSettingResponse:
         """
         Create and return a new object.  See help(type) for accurate signature.
         """
+def write_buffers(dst, offset, buffers):
+    """
+    Copy byte buffers back to back into a writable buffer, e.g. a shared memory region.
+    
+    所有数据在一次调用中拷贝，省去 Python 侧逐个数组的循环；返回写入结束位置的偏移
+    """
+def atomic_load_u64(buf, offset):
+    """
+    Load a u64 from a buffer with acquire ordering.
+    
+    用于共享内存中的 SPSC 计数：读到新值后，对端在发布前写入的数据一定可见
+    """
+def atomic_store_u64(buf, offset, value):
+    """
+    Store a u64 into a writable buffer with release ordering.
+    
+    之前写入的数据在对端 acquire 读到该值时一定可见（aarch64 等弱内存序平台同样成立）
+    """
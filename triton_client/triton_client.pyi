@@ -12,6 +12,7 @@ from triton_client import CudaSharedMemoryUnregisterResponse
 from triton_client import InferInputTensor
 from triton_client import InferOutputTensor
 from triton_client import InferParameter
+from triton_client import InferStream
 from triton_client import InferRequestedOutputTensor
 from triton_client import InferTensorContents
 from triton_client import ListBool
@@ -38,7 +39,9 @@ from triton_client import ModelReadyResponse
 from triton_client import ModelRepositoryParameter
 from triton_client import ModelStatisticsRequest
 from triton_client import ModelStatisticsResponse
+from triton_client import ModelStreamInferResponse
 from triton_client import ParameterChoice
+from triton_client import PreparedInferRequest
 from triton_client import RegionStatus
 from triton_client import RepositoryIndexRequest
 from triton_client import RepositoryIndexResponse
@@ -58,4 +61,4 @@ from triton_client import SystemSharedMemoryUnregisterResponse
 from triton_client import TensorMetadata
 from triton_client import TraceSettingRequest
 from triton_client import TraceSettingResponse
-__all__: list = ['__doc__', 'Client', 'ServerLiveResponse', 'ServerReadyResponse', 'ModelReadyRequest', 'ModelReadyResponse', 'ServerMetadataResponse', 'ModelConfig', 'ModelMetadataRequest', 'ModelMetadataResponse', 'ModelInferRequest', 'ModelInferResponse', 'ModelConfigRequest', 'ModelConfigResponse', 'ModelStatisticsRequest', 'ModelStatisticsResponse', 'TraceSettingRequest', 'TraceSettingResponse', 'InferParameter', 'InferTensorContents', 'ModelRepositoryParameter', 'RepositoryIndexRequest', 'RepositoryIndexResponse', 'RepositoryModelLoadRequest', 'RepositoryModelLoadResponse', 'RepositoryModelUnloadRequest', 'RepositoryModelUnloadResponse', 'SystemSharedMemoryStatusRequest', 'SystemSharedMemoryStatusResponse', 'SystemSharedMemoryRegisterRequest', 'SystemSharedMemoryRegisterResponse', 'SystemSharedMemoryUnregisterRequest', 'SystemSharedMemoryUnregisterResponse', 'CudaSharedMemoryStatusRequest', 'CudaSharedMemoryStatusResponse', 'CudaSharedMemoryRegisterRequest', 'CudaSharedMemoryRegisterResponse', 'CudaSharedMemoryUnregisterRequest', 'CudaSharedMemoryUnregisterResponse', 'ParameterChoice', 'TensorMetadata', 'ParameterChoice', 'InferInputTensor', 'RegionStatus', 'InferRequestedOutputTensor', 'InferOutputTensor', 'ModelIndex', 'ListBool', 'ListI8', 'ListI16', 'ListI32', 'ListI64', 'ListU8', 'ListU16', 'ListU32', 'ListU64', 'ListF32', 'ListF64']
+__all__: list = ['__doc__', 'Client', 'InferStream', 'PreparedInferRequest', 'ServerLiveResponse', 'ServerReadyResponse', 'ModelReadyRequest', 'ModelReadyResponse', 'ServerMetadataResponse', 'ModelConfig', 'ModelMetadataRequest', 'ModelMetadataResponse', 'ModelInferRequest', 'ModelInferResponse', 'ModelStreamInferResponse', 'ModelConfigRequest', 'ModelConfigResponse', 'ModelStatisticsRequest', 'ModelStatisticsResponse', 'TraceSettingRequest', 'TraceSettingResponse', 'InferParameter', 'InferTensorContents', 'ModelRepositoryParameter', 'RepositoryIndexRequest', 'RepositoryIndexResponse', 'RepositoryModelLoadRequest', 'RepositoryModelLoadResponse', 'RepositoryModelUnloadRequest', 'RepositoryModelUnloadResponse', 'SystemSharedMemoryStatusRequest', 'SystemSharedMemoryStatusResponse', 'SystemSharedMemoryRegisterRequest', 'SystemSharedMemoryRegisterResponse', 'SystemSharedMemoryUnregisterRequest', 'SystemSharedMemoryUnregisterResponse', 'CudaSharedMemoryStatusRequest', 'CudaSharedMemoryStatusResponse', 'CudaSharedMemoryRegisterRequest', 'CudaSharedMemoryRegisterResponse', 'CudaSharedMemoryUnregisterRequest', 'CudaSharedMemoryUnregisterResponse', 'ParameterChoice', 'TensorMetadata', 'ParameterChoice', 'InferInputTensor', 'RegionStatus', 'InferRequestedOutputTensor', 'InferOutputTensor', 'ModelIndex', 'ListBool', 'ListI8', 'ListI16', 'ListI32', 'ListI64', 'ListU8', 'ListU16', 'ListU32', 'ListU64', 'ListF32', 'ListF64']